@@ -0,0 +1,145 @@
+"""
+Batch runner. Runs many headless matches in parallel over every CPU core and writes their results.
+
+e.g. python BatchRunner.py --matches 200 --colonies 20 --enemies 2 --output results.json
+     python BatchRunner.py --matches 50 --map Ellipse --mode events
+     python BatchRunner.py --matches 100 --state saves/quick.sav
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+from Settings import GUISettings
+from Simulation import Simulation
+
+DEFAULT_MAX_TICKS = 100000
+
+
+def run_match(settings):
+    """
+    Run a single match. Meant to run in a worker process.
+    :param settings: Match settings, with its seed
+    :type settings: dict
+    :return: Match results
+    :rtype: dict
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        simulation = Simulation(seed=settings["seed"])
+        simulation.map.set_collision_mode(settings["mode"])
+        simulation.map.set_party_store(settings["store"])
+        if settings["state"] is not None:
+            with open(settings["state"], "rb") as f:
+                simulation.load_state(f.read())
+            simulation.map.seed(settings["seed"])
+        elif settings["map"] is None:
+            simulation.load_random(settings["colonies"], settings["enemies"])
+        else:
+            simulation.load_map(settings["map"])
+        races = [str(p.race) for p in simulation.players]
+        winner = simulation.run(settings["max_ticks"])
+    if settings["replays"] is not None:
+        simulation.save_replay(os.path.join(settings["replays"], str(settings["seed"]) + ".rep"))
+
+    colonies = {}
+    for gr_col in simulation.map.graphic_colonies:
+        race = str(gr_col.colony.race)
+        colonies[race] = colonies.get(race, 0) + 1
+    return {
+        "seed": settings["seed"],
+        "races": races,
+        "winner": None if winner is None else str(winner),
+        "ticks": simulation.ticks,
+        "time": simulation.map.clock.time,
+        "colonies": colonies,
+    }
+
+
+def summarize(results):
+    """
+    Aggregate results of many matches.
+    :param results: Results as given by run_match
+    :type results: list
+    :return: Wins per race, unfinished matches and average match time
+    :rtype: dict
+    """
+    wins = {}
+    unfinished = 0
+    for result in results:
+        if result["winner"] is None:
+            unfinished += 1
+        else:
+            wins[result["winner"]] = wins.get(result["winner"], 0) + 1
+    times = [result["time"] for result in results]
+    return {
+        "matches": len(results),
+        "wins": wins,
+        "unfinished": unfinished,
+        "average_time": sum(times) / len(times) if len(times) > 0 else 0,
+    }
+
+
+def run_batch(settings, matches, seed=0, processes=None):
+    """
+    Run many matches in parallel, each with its own seed.
+    :param settings: Settings shared by every match
+    :type settings: dict
+    :param matches: Amount of matches
+    :param seed: Seed of first match, the rest follow
+    :param processes: Amount of worker processes, all CPU cores by default
+    :return: Summary and results of every match
+    :rtype: dict
+    """
+    jobs = []
+    for i in range(matches):
+        job = dict(settings)
+        job["seed"] = seed + i
+        jobs.append(job)
+    with multiprocessing.Pool(processes) as pool:
+        results = pool.map(run_match, jobs)
+    return {"settings": settings, "summary": summarize(results), "results": results}
+
+
+def main():
+    """
+    Parse arguments, run matches and write results.
+    """
+    parser = argparse.ArgumentParser(description="Run headless Bacto matches in parallel.")
+    parser.add_argument("--matches", type=int, default=100, help="amount of matches")
+    parser.add_argument("--map", default=None, help="custom map name, random maps if missing")
+    parser.add_argument("--state", default=None, help="saved match to continue from, with a new seed per match")
+    parser.add_argument("--colonies", type=int, default=20, help="empty colonies on random maps")
+    parser.add_argument("--enemies", type=int, default=2, help="enemies on random maps")
+    parser.add_argument("--seed", type=int, default=0, help="seed of first match")
+    parser.add_argument("--max-ticks", type=int, default=DEFAULT_MAX_TICKS, help="ticks before giving up a match")
+    parser.add_argument("--mode", default=GUISettings.COLLISION_MODE, help="collision mode",
+                        choices=[GUISettings.NAIVE_COLLISIONS, GUISettings.GRID_COLLISIONS,
+                                 GUISettings.VECTOR_COLLISIONS, GUISettings.EVENT_COLLISIONS])
+    parser.add_argument("--store", action="store_true", help="keep parties in a party store")
+    parser.add_argument("--processes", type=int, default=None, help="worker processes, all cores by default")
+    parser.add_argument("--output", default="results.json", help="results file")
+    parser.add_argument("--replays", default=None, help="folder to save a replay of every match in")
+    args = parser.parse_args()
+
+    settings = {
+        "map": args.map,
+        "state": args.state,
+        "colonies": args.colonies,
+        "enemies": args.enemies,
+        "max_ticks": args.max_ticks,
+        "mode": args.mode,
+        "store": args.store,
+        "replays": args.replays,
+    }
+    if args.replays is not None:
+        os.makedirs(args.replays, exist_ok=True)
+    batch = run_batch(settings, args.matches, args.seed, args.processes)
+    with open(args.output, "w") as f:
+        json.dump(batch, f, indent=2)
+    print(json.dumps(batch["summary"], indent=2))
+
+
+if __name__ == "__main__":
+    main()
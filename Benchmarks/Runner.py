@@ -0,0 +1,102 @@
+"""
+Benchmark runner. Times every phase of a tick on a scenario.
+"""
+
+import time
+import numpy as np
+
+PLAYERS_PHASE = "RandomPlayer.tick"
+MAP_TICK_PHASE = "Map.tick"
+COLLISIONS_PHASE = "Map.check_collisions"
+WINNER_PHASE = "Map.get_winner"
+DRAW_PHASE = "Map.draw"
+PHASES = [PLAYERS_PHASE, MAP_TICK_PHASE, COLLISIONS_PHASE, WINNER_PHASE, DRAW_PHASE]
+
+PERCENTILES = [50, 90, 99]
+
+
+def run_scenario(simulation, ticks, warmup=5, surface=None):
+    """
+    Tick a scenario as a match would, timing every phase. Collisions are timed from inside Map.tick.
+    :param simulation: Scenario to run
+    :type simulation: Simulation
+    :param ticks: Amount of measured ticks
+    :param warmup: Amount of ticks to run before measuring
+    :param surface: Surface to draw on, nothing is drawn if None
+    :type surface: Surface
+    :return: Seconds taken by every call, by phase
+    :rtype: dict
+    """
+    a_map = simulation.map
+    samples = {phase: [] for phase in PHASES}
+    check_collisions = a_map.check_collisions
+
+    def timed_check_collisions():
+        start = time.perf_counter()
+        check_collisions()
+        samples[COLLISIONS_PHASE].append(time.perf_counter() - start)
+
+    a_map.check_collisions = timed_check_collisions
+    try:
+        for i in range(warmup + ticks):
+            t0 = time.perf_counter()
+            for p in simulation.players:
+                p.tick(a_map)
+            t1 = time.perf_counter()
+            a_map.tick()
+            t2 = time.perf_counter()
+            a_map.get_winner()
+            t3 = time.perf_counter()
+            if surface is not None:
+                surface.fill((0, 0, 0))
+                a_map.draw(surface)
+            t4 = time.perf_counter()
+            samples[PLAYERS_PHASE].append(t1 - t0)
+            samples[MAP_TICK_PHASE].append(t2 - t1)
+            samples[WINNER_PHASE].append(t3 - t2)
+            if surface is not None:
+                samples[DRAW_PHASE].append(t4 - t3)
+    finally:
+        del a_map.check_collisions
+    return {phase: values[warmup:] for phase, values in samples.items() if len(values) > 0}
+
+
+def statistics(values):
+    """
+    :param values: Seconds taken by every call
+    :return: Calls per second, mean and percentiles in milliseconds
+    :rtype: dict
+    """
+    values = np.array(values)
+    mean = values.mean()
+    result = {
+        "calls": len(values),
+        "per_second": 1 / mean if mean > 0 else None,
+        "mean_ms": mean * 1000,
+        "max_ms": values.max() * 1000,
+    }
+    for p in PERCENTILES:
+        result["p" + str(p) + "_ms"] = np.percentile(values, p) * 1000
+    return result
+
+
+def compare(results, baseline):
+    """
+    :param results: Results of current run
+    :param baseline: Results of a previous run
+    :return: Lines comparing mean times of every scenario and phase found in both
+    :rtype: list
+    """
+    lines = []
+    for name, scenario in results["scenarios"].items():
+        old_scenario = baseline["scenarios"].get(name)
+        if old_scenario is None:
+            continue
+        for phase in PHASES:
+            if phase not in scenario["phases"] or phase not in old_scenario["phases"]:
+                continue
+            new = scenario["phases"][phase]["mean_ms"]
+            old = old_scenario["phases"][phase]["mean_ms"]
+            ratio = old / new if new > 0 else float("inf")
+            lines.append("%-28s %-22s %10.3f ms -> %10.3f ms  x%.2f" % (name, phase, old, new, ratio))
+    return lines
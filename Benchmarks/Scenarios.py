@@ -0,0 +1,106 @@
+"""
+Benchmark scenarios. Each one is a Simulation ready to be ticked.
+"""
+
+import contextlib
+import io
+import math
+from Colony import RegularColony
+from GUI.GraphicColony import GraphicColony
+from GUI.Point import Point
+from MapManager import MapManager
+from Party import Party
+from Race import NULL_RACE
+from Settings import GUISettings
+from Simulation import Simulation
+
+COLONY_COUNTS = [10, 100, 1000]
+PARTY_COUNTS = [0, 500, 5000]
+SYNTHETIC_PLAYERS = 3
+MAX_SYNTHETIC_RADIUS = 40
+
+
+def synthetic(n_colonies, n_parties, seed=0, mode=GUISettings.COLLISION_MODE, store=GUISettings.PARTY_STORE):
+    """
+    Build a map with colonies spread on a jittered grid, owned by a few players or nobody, and parties flying
+    towards random colonies from random positions.
+    :param n_colonies: Amount of colonies
+    :param n_parties: Amount of parties in flight
+    :param seed: Seed for layout and players
+    :param mode: Collision mode
+    :param store: Whether to keep parties in a party store
+    :return: Simulation with given scenario loaded
+    :rtype: Simulation
+    """
+    simulation = quiet(Simulation, seed=seed)
+    simulation.reset()
+    a_map = simulation.map
+    a_map.empty()
+    a_map.set_collision_mode(mode)
+    a_map.set_party_store(store)
+    random = a_map.random
+    players = quiet(simulation.new_players, SYNTHETIC_PLAYERS)
+    races = [p.race for p in players] + [NULL_RACE]
+
+    columns = max(int(math.ceil(math.sqrt(n_colonies * a_map.width / a_map.height))), 1)
+    rows = max(int(math.ceil(n_colonies / columns)), 1)
+    cell_width = a_map.width / columns
+    cell_height = a_map.height / rows
+    radius = min(MAX_SYNTHETIC_RADIUS, min(cell_width, cell_height) / 3)
+    for i in range(n_colonies):
+        x = (i % columns + 0.5) * cell_width + random.uniform(-1, 1) * (cell_width / 2 - radius)
+        y = (i // columns + 0.5) * cell_height + random.uniform(-1, 1) * (cell_height / 2 - radius)
+        colony = RegularColony(races[i % len(races)], int(random.integers(10, 60)))
+        GraphicColony(a_map, colony, Point(x, y), radius)
+
+    for i in range(n_parties):
+        destination = a_map.graphic_colonies[random.integers(0, n_colonies)]
+        position = Point(random.uniform(0, a_map.width), random.uniform(0, a_map.height))
+        party = Party(players[i % len(players)].race, int(random.integers(1, 30)))
+        a_map.create_party(party, position, GUISettings.MIN_PARTY_SIZE, destination)
+
+    simulation.players = players
+    return simulation
+
+
+def shipped_map(name, seed=0, mode=GUISettings.COLLISION_MODE, store=GUISettings.PARTY_STORE):
+    """
+    Load a map from data/maps, with RandomPlayers.
+    :param name: Map name
+    :param seed: Seed for players
+    :param mode: Collision mode
+    :param store: Whether to keep parties in a party store
+    :return: Simulation with given map loaded
+    :rtype: Simulation
+    """
+    simulation = quiet(Simulation, seed=seed)
+    simulation.map.set_collision_mode(mode)
+    simulation.map.set_party_store(store)
+    quiet(simulation.load_map, name)
+    simulation.map.recorder = None
+    return simulation
+
+
+def all_scenarios():
+    """
+    :return: Name and builder of every scenario. Builders take seed, collision mode and whether to use a store
+    :rtype: list
+    """
+    result = []
+    for n_colonies in COLONY_COUNTS:
+        for n_parties in PARTY_COUNTS:
+            result.append(("synthetic_" + str(n_colonies) + "c_" + str(n_parties) + "p",
+                           lambda seed, mode, store, c=n_colonies, p=n_parties: synthetic(c, p, seed, mode, store)))
+    for name in sorted(quiet(MapManager).get_maps()):
+        result.append(("map_" + name.strip('"').replace(" ", "_"),
+                       lambda seed, mode, store, n=name: shipped_map(n, seed, mode, store)))
+    return result
+
+
+def quiet(function, *args, **kwargs):
+    """
+    Call given function hiding what it prints.
+    :return: What given function returns
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        return function(*args, **kwargs)
@@ -0,0 +1,80 @@
+"""
+Benchmark suite. Times players, map tick, collisions, winner check and drawing on synthetic scenarios and on every
+shipped map, and saves the results as JSON to compare against a previous baseline.
+
+e.g. python -m Benchmarks --output bench.json
+     python -m Benchmarks --only synthetic_1000c --mode vectorized --baseline bench.json
+"""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import argparse
+import json
+import platform
+import pygame
+import numpy as np
+from Benchmarks.Runner import *
+from Benchmarks.Scenarios import all_scenarios
+from Settings import GUISettings
+
+
+def main():
+    """
+    Parse arguments, run every selected scenario and report.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark Bacto's tick and draw paths.")
+    parser.add_argument("--ticks", type=int, default=50, help="measured ticks per scenario")
+    parser.add_argument("--warmup", type=int, default=5, help="ticks before measuring")
+    parser.add_argument("--seed", type=int, default=0, help="seed for every scenario")
+    parser.add_argument("--mode", default=GUISettings.COLLISION_MODE, help="collision mode",
+                        choices=[GUISettings.NAIVE_COLLISIONS, GUISettings.GRID_COLLISIONS,
+                                 GUISettings.VECTOR_COLLISIONS, GUISettings.EVENT_COLLISIONS])
+    parser.add_argument("--store", action="store_true", help="keep parties in a party store")
+    parser.add_argument("--no-draw", action="store_true", help="don't time drawing")
+    parser.add_argument("--only", action="append", default=None, help="run scenarios whose name contains this")
+    parser.add_argument("--output", default=None, help="JSON file to save results to")
+    parser.add_argument("--baseline", default=None, help="JSON results of a previous run to compare with")
+    args = parser.parse_args()
+
+    pygame.init()
+    surface = None if args.no_draw else pygame.Surface((GUISettings.SCREEN_WIDTH, GUISettings.SCREEN_HEIGHT))
+
+    results = {
+        "settings": {"ticks": args.ticks, "warmup": args.warmup, "seed": args.seed, "mode": args.mode,
+                     "store": args.store, "draw": surface is not None},
+        "platform": {"python": platform.python_version(), "numpy": np.__version__,
+                     "pygame": pygame.version.ver, "machine": platform.machine()},
+        "scenarios": {},
+    }
+    for name, build in all_scenarios():
+        if args.only is not None and not any(o in name for o in args.only):
+            continue
+        simulation = build(args.seed, args.mode, args.store)
+        colonies = len(simulation.map.graphic_colonies)
+        parties = len(simulation.map.graphic_parties)
+        samples = run_scenario(simulation, args.ticks, args.warmup, surface)
+        scenario = {
+            "colonies": colonies,
+            "parties_start": parties,
+            "parties_end": len(simulation.map.graphic_parties),
+            "phases": {phase: statistics(values) for phase, values in samples.items()},
+        }
+        results["scenarios"][name] = scenario
+        tick = scenario["phases"][MAP_TICK_PHASE]
+        print("%-28s %6d colonies %6d parties  Map.tick %9.1f ticks/s  p99 %8.3f ms" %
+              (name, colonies, parties, tick["per_second"], tick["p99_ms"]))
+
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.baseline is not None:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        for line in compare(results, baseline):
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
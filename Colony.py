@@ -5,7 +5,32 @@ Colony.
 import math
 from Settings.ColonySettings import *
 from Party import Party
-from Race import NullRace
+from Race import NULL_RACE
+
+
+class TickCounter:
+    """
+    Counts ticks. Colonies sharing one grow lazily, only when their size is asked for.
+    """
+
+    def __init__(self):
+        """
+        Constructor.
+        """
+        self.ticks = 0
+
+    def tick(self):
+        """
+        Count one tick.
+        """
+        self.ticks += 1
+
+    def advance(self, amount):
+        """
+        Count given amount of ticks at once.
+        :type amount: int
+        """
+        self.ticks += amount
 
 
 class AbstractColony:
@@ -13,7 +38,7 @@ class AbstractColony:
     A colony. Merely logic.
     """
 
-    def __init__(self, race=NullRace(), size=0, def_factor=1, str_factor=1, repr_factor=1, spd_factor=1):
+    def __init__(self, race=NULL_RACE, size=0, def_factor=1, str_factor=1, repr_factor=1, spd_factor=1):
         """
         Construct.
         :param race: Initial race
@@ -29,18 +54,50 @@ class AbstractColony:
         :type spd_factor: float
         """
         self.race = race
-        self.size = size
+        self._size = size
         self.def_factor = def_factor
         self.str_factor = str_factor
         self.repr_factor = repr_factor
         self.spd_factor = spd_factor
         self.time = 0
+        self.timer = TickCounter()
+        self.last_growth = 0
+        self.census = None
 
-    def tick(self):
+    @property
+    def size(self):
         """
-        Grow. 
+        :return: Current size, grown up to current tick
         """
         self.grow()
+        return self._size
+
+    @size.setter
+    def size(self, size):
+        self.grow()
+        self._size = size
+
+    def set_timer(self, timer):
+        """
+        Grow with given timer from now on.
+        :param timer: Timer to share
+        :type timer: TickCounter
+        """
+        self.grow()
+        self.timer = timer
+        self.last_growth = timer.ticks
+
+    def set_census(self, census):
+        """
+        Be counted by given census from now on, and no longer by the former one.
+        :param census: Census to report to, None to stop being counted
+        :type census: RaceCensus
+        """
+        if self.census is not None:
+            self.census.remove_colony(self.race)
+        self.census = census
+        if census is not None:
+            census.add_colony(self.race)
 
     def set_size(self, size):
         """
@@ -54,7 +111,25 @@ class AbstractColony:
         :param race: New race
         :type race: AbstractRace
         """
+        self.grow()
+        if self.census is not None:
+            self.census.change_colony(self.race, race)
+        self.race = race
+
+    def restore(self, race, size, time):
+        """
+        Set state as captured, without growing.
+        :param race: Race
+        :type race: AbstractRace
+        :param size: Size
+        :param time: Ticks since last birth
+        """
+        if self.census is not None:
+            self.census.change_colony(self.race, race)
         self.race = race
+        self._size = size
+        self.time = time
+        self.last_growth = self.timer.ticks
 
     def get_race(self):
         """
@@ -96,9 +171,9 @@ class AbstractColony:
         # Compute difference
         dif = col_bp - pty_bp
 
-        # Write result
-        self.size = max(dif // net_col_def, 0)
-        party.size = max(-dif // net_pty_str, 0)
+        # Write result. Factors may be fractional, sizes are kept whole
+        self.size = int(max(dif // net_col_def, 0))
+        party.size = int(max(-dif // net_pty_str, 0))
 
         # Decide ownership
         self.choose_winner(party)
@@ -111,10 +186,10 @@ class AbstractColony:
         """
         if self.size < party.size:
             self.size = party.size
-            self.race = party.race
+            self.set_race(party.race)
         else:
             if self.size == party.size:
-                self.race = NullRace()
+                self.set_race(NULL_RACE)
 
     def create_party(self):
         """
@@ -127,13 +202,28 @@ class AbstractColony:
 
     def grow(self):
         """
-        Grow once.
+        Grow for every tick since last time, as if grown once per tick. At most one unit is born per tick, one
+        every reproduction time, and time stops while the population limit is reached.
         """
-        if self.size < POPULATION_LIMIT:
-            self.time += 1
-            if (self.time // int(self.race.reproduction_time * self.repr_factor)) > 0:
-                self.size += 1
-                self.time = 0
+        elapsed = self.timer.ticks - self.last_growth
+        if elapsed == 0:
+            return
+        self.last_growth = self.timer.ticks
+        if self._size >= POPULATION_LIMIT:
+            return
+        reproduction_time = int(self.race.reproduction_time * self.repr_factor)
+        if self.time + elapsed < reproduction_time:
+            self.time += elapsed
+            return
+        # Ticks until first birth. Time may already be over reproduction time if the race changed
+        first = max(reproduction_time - self.time, 1)
+        born = 1 + (elapsed - first) // reproduction_time
+        if self._size + born >= POPULATION_LIMIT:
+            self._size = POPULATION_LIMIT
+            self.time = 0
+        else:
+            self._size += born
+            self.time = (elapsed - first) % reproduction_time
 
     def get_color(self):
         """
@@ -152,7 +242,7 @@ class StrengthColony(AbstractColony):
     """
     Colony that increases strength of outgoing parties.
     """
-    def __init__(self, race=NullRace(), size=0):
+    def __init__(self, race=NULL_RACE, size=0):
         super(StrengthColony, self).__init__(race, size, str_factor=1.3)
 
 
@@ -160,7 +250,7 @@ class SpeedColony(AbstractColony):
     """
     Colony that increases speed of outgoing parties.
     """
-    def __init__(self, race=NullRace(), size=0):
+    def __init__(self, race=NULL_RACE, size=0):
         super(SpeedColony, self).__init__(race, size, spd_factor=1.3)
 
 
@@ -168,7 +258,7 @@ class RegularColony(AbstractColony):
     """
     Regular colony, no modifiers.
     """
-    def __init__(self, race=NullRace(), size=0):
+    def __init__(self, race=NULL_RACE, size=0):
         super(RegularColony, self).__init__(race, size)
 
 
@@ -176,7 +266,7 @@ class GrowthColony(AbstractColony):
     """
     Colony with decreased reproduction time.
     """
-    def __init__(self, race=NullRace(), size=0):
+    def __init__(self, race=NULL_RACE, size=0):
         super(GrowthColony, self).__init__(race, size, repr_factor=0.7)
 
 
@@ -184,5 +274,5 @@ class DefenseColony(AbstractColony):
     """
     Colony with increased defense.
     """
-    def __init__(self, race=NullRace(), size=0):
+    def __init__(self, race=NULL_RACE, size=0):
         super(DefenseColony, self).__init__(race, size, def_factor=1.3)
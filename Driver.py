@@ -2,13 +2,21 @@
 Game driver and its stats. 
 """
 
+import os
+import time
+from Settings import GeneralSettings
 from Settings import GUISettings
 from Settings import MenuSettings
 from GUI.Map import Map
 from GUI.Point import Point
+from GUI.ProfilerOverlay import ProfilerOverlay
+from GUI.SpriteAtlas import SPRITE_ATLAS
 from MapLoader import MapLoader
+from Replay import ReplayRecorder
+from MatchState import MatchState
+from Profiler import *
 from Player import *
-from Race import NullRace
+from Race import NULL_RACE
 from SoundDriver import SoundDriver
 from EventHandler import EventHandler
 from RaceManager import RaceManager
@@ -20,29 +28,38 @@ class Driver:
     Game driver. Sets matches, takes input, controls game flow and checks for a winner.
     """
 
-    def __init__(self, map_screen, background_screen, text_screen):
+    def __init__(self, compositor):
         """
         Constructor.
-        :param map_screen: Surface 
-        :param background_screen: Surface
-        :param text_screen: Surface
+        :param compositor: Screen to draw on
+        :type compositor: Compositor
         """
         self.amount_of_enemies = 0
         self.amount_of_empty_colonies = 0
         self.map_to_load = None
+        self.match_seed = None
         self.race_manager = RaceManager()
+        SPRITE_ATLAS.warm(self.get_races_array())
         self.human_players = []
         self.players = []
         self.map = Map(GUISettings.SCREEN_WIDTH, GUISettings.SCREEN_HEIGHT)
+        self.camera_direction = (0, 0)
         self.event_handler = EventHandler(self)
-        self.screen = map_screen
-        self.background_screen = background_screen
+        self.compositor = compositor
+        self.background_layer = compositor.background
+        self.board_layer = compositor.board
+        self.ui_layer = compositor.ui
+        self.screen = compositor.board.surface
+        self.background_screen = compositor.display
         self.player_one = Player()
         self.human_players.append(self.player_one)
         self.sound_driver = SoundDriver()
         self.map_loader = MapLoader(self)
-        self.text_screen = text_screen
+        self.text_screen = compositor.ui.surface
         self.running = True
+        self.profiler = Profiler()
+        self.profiler_overlay = ProfilerOverlay(self.profiler, Point(GUISettings.SCREEN_WIDTH // 2 +
+                                                                    GUISettings.PROFILER_OFFSET, 0))
         self.map_manager = MapManager()
         self.state = MainMenu(self)
         self.menu = MenuSettings.MAIN_MENU(self)
@@ -90,10 +107,14 @@ class Driver:
         """
         # Clear players
         self.players = []
+        # Restart random streams
+        self.map.seed(self.match_seed)
         # Load map
         self.map_loader.load_in_map(self.map_to_load, self.map, self.human_players)
         # Set new players
         self.players = self.map_loader.players
+        # Record match
+        self.map.recorder = ReplayRecorder(self.map, self.players, self.map_to_load[NAME_FIELD])
 
     def add_random_player(self):
         """
@@ -101,6 +122,88 @@ class Driver:
         """
         self.players.append(RandomPlayer())
 
+    def set_match_seed(self, seed):
+        """
+        Set seed for next matches, so they can be repeated.
+        :param seed: Seed, None for fresh entropy on every match
+        :type seed: int
+        """
+        self.match_seed = seed
+
+    def save_replay(self, path=None):
+        """
+        Write current match as a replay.
+        :param path: File path, a new file in replay folder if None
+        """
+        if self.map.recorder is None:
+            return
+        if path is None:
+            os.makedirs(GeneralSettings.REPLAY_FOLDER, exist_ok=True)
+            path = os.path.join(GeneralSettings.REPLAY_FOLDER, time.strftime("%Y%m%d-%H%M%S") + ".rep")
+        self.map.recorder.save(path)
+
+    def save_state(self):
+        """
+        :return: Current match, map, players and random streams included, in binary format
+        :rtype: bytes
+        """
+        return MatchState.capture(self.map, self.players).to_bytes()
+
+    def load_state(self, data):
+        """
+        Continue a saved match exactly where it was left.
+        :param data: A match saved with save_state
+        :type data: bytes
+        """
+        state = MatchState.from_bytes(data)
+        races = self.race_manager.get_races()
+        self.move_alpha_to(self.board_layer, 0, 255)
+        state.restore_map(self.map, races)
+        self.players = state.restore_players(races, self.human_players)
+        self.set_state(InGame(self))
+        self.map.is_over = state.map_state.is_over
+
+    def quick_save(self):
+        """
+        Save current match to quick save file, if there's one being played.
+        """
+        if not (self.state.state_is_ingame() or self.state.state_is_paused()):
+            return
+        os.makedirs(GeneralSettings.SAVE_FOLDER, exist_ok=True)
+        with open(os.path.join(GeneralSettings.SAVE_FOLDER, GeneralSettings.QUICK_SAVE_FILE), "wb") as f:
+            f.write(self.save_state())
+
+    def quick_load(self):
+        """
+        Load match from quick save file, if there's one.
+        """
+        path = os.path.join(GeneralSettings.SAVE_FOLDER, GeneralSettings.QUICK_SAVE_FILE)
+        if not os.path.exists(path):
+            return
+        with open(path, "rb") as f:
+            self.load_state(f.read())
+
+    def toggle_profiler(self):
+        """
+        Show or hide profiler overlay.
+        """
+        self.profiler.toggle()
+
+    def dump_profile(self, path=GeneralSettings.PROFILE_FILE):
+        """
+        Write profiler measures to a file.
+        :param path: File path
+        """
+        self.profiler.dump(path)
+
+    def measure(self, phase):
+        """
+        Measure a phase of current tick or frame.
+        :param phase: Phase name
+        :return: Context manager measuring given phase
+        """
+        return self.profiler.measure(phase)
+
     def set_player_name(self, name):
         """
         Set a name for the player.
@@ -140,16 +243,9 @@ class Driver:
         :return The winner
         :rtype AbstractRace
         """
-        win = NullRace()
-        for gr_col in self.map.graphic_colonies:
-            race = gr_col.colony.race
-            if win.same_type(NullRace()):
-                win = race
-            if not race.same_type(NullRace()) and not race.same_type(win):
-                return NullRace()
-        for gr_pty in self.map.graphic_parties:
-            if not gr_pty.party.race.same_type(win):
-                return NullRace()
+        win = self.map.get_winner()
+        if win is None:
+            return NULL_RACE
         self.won(win)
         return win
 
@@ -171,24 +267,65 @@ class Driver:
 
     def tick(self):
         """
-        Actions to perform every tick.
+        Actions to perform every tick, when simulation and rendering run at the same rate.
         """
         # Handle input
         self.handle_events()
+        # Simulate
+        self.update()
+        # Draw
+        self.render()
+
+    def update(self):
+        """
+        Advance simulation one tick. Runs at a fixed rate, independent from rendering.
+        """
         # Update background
-        self.map.tick_background()
-        # Draw background
-        self.map.draw_background(self.background_screen)
-        # Run main
-        self.run()
+        if self.background_layer.is_enabled():
+            with self.measure(BACKGROUND_TICK_PHASE):
+                self.map.tick_background()
+        # Pan camera, at the same pace whatever the frame rate
+        dx, dy = self.camera_direction
+        if dx != 0 or dy != 0:
+            self.pan_camera(dx, dy)
+        # Update main
+        self.state.update()
         # Check for a winner
-        self.check_winning_condition()
+        with self.measure(WINNER_PHASE):
+            self.check_winning_condition()
+
+    def render(self, interpolation=1):
+        """
+        Draw current state.
+        :param interpolation: Fraction of a tick elapsed since last update. Moving objects are drawn between their
+            last two positions accordingly
+        :type interpolation: float
+        :return: Bounding rectangles of what was drawn
+        :rtype: list
+        """
+        self.map.set_interpolation(interpolation)
+        # Draw background
+        with self.measure(BACKGROUND_DRAW_PHASE):
+            rects = self.background_layer.update(self.map)
+        # Draw main. Background always ticks, the board only in some states
+        self.map.set_interpolation(self.state.board_interpolation(interpolation))
+        return rects + self.state.draw()
+
+    def draw_profiler(self, surface):
+        """
+        Draw profiler overlay, if visible, next to the clock.
+        :type surface: Surface
+        :return: Bounding rectangle, None if hidden
+        :rtype: Rect
+        """
+        return self.profiler_overlay.draw(surface)
 
     def handle_events(self):
         """
         Ask the event handler to handle input. 
         """
-        self.event_handler.handle_events()
+        with self.measure(INPUT_PHASE):
+            self.event_handler.handle_events()
 
     def run(self):
         """
@@ -284,37 +421,64 @@ class Driver:
         """
         self.state.select_key()
 
+    def set_camera_direction(self, dx, dy):
+        """
+        Acknowledge which camera keys are held. Camera pans on every update while any is.
+        :param dx: Horizontal direction, -1, 0 or 1
+        :param dy: Vertical direction, -1, 0 or 1
+        """
+        self.camera_direction = (dx, dy)
+
+    def pan_camera(self, dx, dy):
+        """
+        Pan the camera for one update.
+        :param dx: Horizontal direction, -1, 0 or 1
+        :param dy: Vertical direction, -1, 0 or 1
+        """
+        self.state.pan_camera(dx, dy)
+
+    def zoom_camera(self, steps, position):
+        """
+        Zoom has been requested.
+        :param steps: Zoom steps, positive to zoom in
+        :type steps: int
+        :param position: Screen position to zoom at
+        :type position: tuple
+        """
+        position = Point(position[0], position[1])
+        self.state.zoom_camera(steps, position)
+
     def load_random_map(self):
         """
         Load a random map.
         """
         # Make screen transparent in one tick
-        self.move_alpha_to(self.screen, 0, 255)
+        self.move_alpha_to(self.board_layer, 0, 255)
         # Remove all players
         self.players = []
+        # Restart random streams
+        self.map.seed(self.match_seed)
         # Load map
         # # self.map_loader.load_in_map(FOUR_BASES, self.map, self.human_players)
         self.map_loader.load_random(self.map, self.amount_of_empty_colonies, 40, 60, self.human_players,
                                     self.amount_of_enemies, self.race_manager.get_races_array())
         # Retrieve players for this match
         self.players = self.map_loader.players
+        # Record match
+        self.map.recorder = ReplayRecorder(self.map, self.players)
 
     @staticmethod
-    def move_alpha_to(surface, target, speed=GUISettings.DEFAULT_ALPHA_CHANGE_SPEED):
+    def move_alpha_to(layer, target, speed=GUISettings.DEFAULT_ALPHA_CHANGE_SPEED):
         """
-        Move alpha of a given surface towards a target value. 
-        :param surface: Surface which alpha to change
-        :type surface: Surface
+        Move alpha of a given layer towards a target value. 
+        :param layer: Layer which alpha to change
+        :type layer: Layer
         :param target: Target alpha value
         :type  target: int
         :param speed: Maximum change
         :type speed: int
         """
-        current_alpha = surface.get_alpha()
-        if not current_alpha == target:
-            move_dir = (target - current_alpha) / abs(target - current_alpha)
-            move_amount = min(speed, abs(target - current_alpha))
-            surface.set_alpha(current_alpha + move_dir * move_amount)
+        layer.move_alpha_to(target, speed)
 
     def start_game(self):
         """
@@ -372,10 +536,63 @@ class GameState:
 
     def run(self):
         """
-        Run main. 
+        Run main. Update and draw.
+        """
+        self.update()
+        self.draw()
+
+    def update(self):
+        """
+        Update once.
         """
         pass
 
+    def draw(self):
+        """
+        Draw current state.
+        :return: Bounding rectangles of what was drawn
+        :rtype: list
+        """
+        return []
+
+    def board_interpolation(self, interpolation):
+        """
+        :param interpolation: Fraction of a tick elapsed since last update
+        :type interpolation: float
+        :return: Fraction to draw the board's moving objects at. Last tick, since the map isn't ticked
+        :rtype: float
+        """
+        return 1
+
+    def tick_map(self):
+        """
+        Tick its driver's map.
+        """
+        with self.driver.measure(MAP_TICK_PHASE):
+            self.driver.map.tick()
+
+    def draw_map(self):
+        """
+        Draw its driver's map.
+        :return: Bounding rectangles of what was drawn. Nothing is drawn if its layer is hidden
+        :rtype: list
+        """
+        if not self.driver.board_layer.is_visible():
+            return []
+        with self.driver.measure(MAP_DRAW_PHASE):
+            return self.driver.map.draw(self.driver.screen)
+
+    def draw_menu(self):
+        """
+        Draw its driver's menu.
+        :return: Bounding rectangles of what was drawn. Nothing is drawn if its layer is hidden
+        :rtype: list
+        """
+        if not self.driver.ui_layer.is_visible():
+            return []
+        with self.driver.measure(MENU_DRAW_PHASE):
+            return self.driver.menu.draw(self.driver.text_screen)
+
     def set_state(self, state):
         """
         Set state of its driver.
@@ -498,6 +715,24 @@ class GameState:
         """
         pass
 
+    def pan_camera(self, dx, dy):
+        """
+        Pan the camera for one update.
+        :param dx: Horizontal direction, -1, 0 or 1
+        :param dy: Vertical direction, -1, 0 or 1
+        """
+        pass
+
+    def zoom_camera(self, steps, position):
+        """
+        Zoom has been requested.
+        :param steps: Zoom steps, positive to zoom in
+        :type steps: int
+        :param position: Screen position to zoom at
+        :type position: Point
+        """
+        pass
+
 
 class OnMenuState(GameState):
     """
@@ -506,18 +741,25 @@ class OnMenuState(GameState):
 
     def __init__(self, driver):
         super(OnMenuState, self).__init__(driver)
-        self.driver.text_screen.set_alpha(0)
+        self.driver.ui_layer.set_alpha(0)
 
-    def run(self):
+    def update(self):
         """
-        Run main. Doesn't tick map.
+        Update menu. Doesn't tick map.
         """
         # Move alpha to full opaqueness
-        self.driver.move_alpha_to(self.driver.text_screen, 255, 5)
+        self.driver.move_alpha_to(self.driver.ui_layer, 255, 5)
         # Tick Menu
-        self.driver.menu.tick()
-        # Draw menu
-        self.driver.menu.draw(self.driver.text_screen)
+        with self.driver.measure(MENU_TICK_PHASE):
+            self.driver.menu.tick()
+
+    def draw(self):
+        """
+        Draw menu.
+        :return: Bounding rectangles of what was drawn
+        :rtype: list
+        """
+        return self.draw_menu()
 
     def release_mouse(self, position):
         """
@@ -589,12 +831,6 @@ class MainMenu(OnMenuState):
         """
         return True
 
-    def run(self):
-        """
-        Run parent
-        """
-        super(MainMenu, self).run()
-
 
 class Paused(OnMenuState):
     """
@@ -619,13 +855,20 @@ class Paused(OnMenuState):
         self.set_state(InGame(self.driver))
         self.driver.play_select()
 
-    def run(self):
+    def update(self):
+        """
+        Make map semi-transparent and update parent.
+        """
+        self.driver.move_alpha_to(self.driver.board_layer, GUISettings.PAUSE_ALPHA)
+        super(Paused, self).update()
+
+    def draw(self):
         """
-        Draw static map, make semi-transparent and run parent.
+        Draw static map and parent.
+        :return: Bounding rectangles of what was drawn
+        :rtype: list
         """
-        self.driver.map.draw(self.driver.screen)
-        self.driver.move_alpha_to(self.driver.screen, GUISettings.PAUSE_ALPHA)
-        super(Paused, self).run()
+        return self.draw_map() + super(Paused, self).draw()
 
 
 class MatchFinished(OnMenuState):
@@ -637,16 +880,32 @@ class MatchFinished(OnMenuState):
         super(MatchFinished, self).__init__(driver)
         self.driver.menu = MenuSettings.MATCH_FINISHED_MENU(self.driver, winning_race)
 
-    def run(self):
+    def update(self):
         """
-        Tick map and draw map, clear selection, make map transparent slowly.
+        Tick map, clear selection, make map transparent slowly.
         """
         self.driver.map.is_over = True
-        self.driver.map.tick()
+        self.tick_map()
         self.driver.map.clear_selection()
-        self.driver.map.draw(self.driver.screen)
-        self.driver.move_alpha_to(self.driver.screen, 0, GUISettings.FINISHED_ALPHA_CHANGE_SPEED)
-        super(MatchFinished, self).run()
+        self.driver.move_alpha_to(self.driver.board_layer, 0, GUISettings.FINISHED_ALPHA_CHANGE_SPEED)
+        super(MatchFinished, self).update()
+
+    def draw(self):
+        """
+        Draw map and parent.
+        :return: Bounding rectangles of what was drawn
+        :rtype: list
+        """
+        return self.draw_map() + super(MatchFinished, self).draw()
+
+    def board_interpolation(self, interpolation):
+        """
+        :param interpolation: Fraction of a tick elapsed since last update
+        :type interpolation: float
+        :return: Same fraction, the map is still ticked
+        :rtype: float
+        """
+        return interpolation
 
     def state_is_finished(self):
         """
@@ -676,20 +935,37 @@ class InGame(GameState):
         :param race: Winner
         :type race: AbstractRace
         """
+        if GeneralSettings.RECORD_REPLAYS:
+            self.driver.save_replay()
         self.set_state(MatchFinished(self.driver, race))
 
-    def run(self):
+    def update(self):
+        """
+        Remove text screen, tick map and players.
+        """
+        self.driver.move_alpha_to(self.driver.ui_layer, 0)
+        with self.driver.measure(PLAYERS_PHASE):
+            for p in self.driver.players:
+                p.tick(self.driver.map)
+        self.tick_map()
+        self.driver.move_alpha_to(self.driver.board_layer, 255)
+
+    def draw(self):
+        """
+        Draw the map.
+        :return: Bounding rectangles of what was drawn
+        :rtype: list
+        """
+        return self.draw_map() + self.draw_menu()
+
+    def board_interpolation(self, interpolation):
         """
-        Remove text screen, tick map and players, and draw the map.
-        :return: 
+        :param interpolation: Fraction of a tick elapsed since last update
+        :type interpolation: float
+        :return: Same fraction, the map is ticked
+        :rtype: float
         """
-        self.driver.move_alpha_to(self.driver.text_screen, 0)
-        for p in self.driver.players:
-            p.tick(self.driver.map)
-        self.driver.map.tick()
-        self.driver.map.draw(self.driver.screen)
-        self.driver.menu.draw(self.driver.text_screen)
-        self.driver.move_alpha_to(self.driver.screen, 255)
+        return interpolation
 
     def pause(self):
         """
@@ -699,11 +975,11 @@ class InGame(GameState):
 
     def get_colonies_in(self, position):
         """
-        :param position: Position to scan
+        :param position: Screen position to scan
         :type position: Point
         :return: Colonies that contain given point
         """
-        return self.driver.get_colonies_in(position)
+        return self.driver.get_colonies_in(self.driver.map.camera.to_world(position))
 
     def select(self, position):
         """
@@ -732,4 +1008,22 @@ class InGame(GameState):
         :param position: Current position.
         :type position: Point
         """
-        self.driver.map.update_mouse_position(position)
+        self.driver.map.update_mouse_position(self.driver.map.camera.to_world(position))
+
+    def pan_camera(self, dx, dy):
+        """
+        Move the camera.
+        :param dx: Horizontal direction, -1, 0 or 1
+        :param dy: Vertical direction, -1, 0 or 1
+        """
+        self.driver.map.camera.pan(dx * GUISettings.CAMERA_PAN_SPEED, dy * GUISettings.CAMERA_PAN_SPEED)
+
+    def zoom_camera(self, steps, position):
+        """
+        Zoom the camera.
+        :param steps: Zoom steps, positive to zoom in
+        :type steps: int
+        :param position: Screen position to zoom at
+        :type position: Point
+        """
+        self.driver.map.camera.zoom_at(GUISettings.CAMERA_ZOOM_STEP ** steps, position)
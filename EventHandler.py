@@ -7,6 +7,8 @@ import pygame.mixer
 from pygame.locals import *
 from Settings import KeySettings
 
+WHEEL_BUTTONS = (4, 5)
+
 
 class EventHandler:
     """
@@ -19,21 +21,27 @@ class EventHandler:
         """
         self.driver = driver
         self.mouse_held = False
+        self.panning = False
 
     def handle_events(self):
         """
         Handle input and control driver accordingly
         """
+        camera_moved = False
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.driver.quit()
             if event.type == pygame.MOUSEMOTION:
                 self.driver.update_mouse_position(event.pos)
-            if event.type == pygame.MOUSEBUTTONUP and self.mouse_held:
+            # Wheel buttons zoom instead of clicking
+            if event.type == pygame.MOUSEBUTTONUP and event.button not in WHEEL_BUTTONS and self.mouse_held:
                 self.mouse_held = False
                 self.driver.release_mouse(event.pos)
-            if event.type == pygame.MOUSEBUTTONDOWN:
+            if event.type == pygame.MOUSEBUTTONDOWN and event.button not in WHEEL_BUTTONS:
                 self.mouse_held = True
+            if event.type == pygame.MOUSEWHEEL:
+                self.driver.zoom_camera(event.y, pygame.mouse.get_pos())
+                camera_moved = True
             if event.type == pygame.MOUSEMOTION:
                 if self.mouse_held:
                     self.driver.select(event.pos)
@@ -52,5 +60,29 @@ class EventHandler:
                     self.driver.selection_down()
                 if event.key == KeySettings.SELECTION_UP:
                     self.driver.selection_up()
+                if event.key == KeySettings.QUICK_SAVE:
+                    self.driver.quick_save()
+                if event.key == KeySettings.QUICK_LOAD:
+                    self.driver.quick_load()
+                if event.key == KeySettings.PROFILER_OVERLAY:
+                    self.driver.toggle_profiler()
+                if event.key == KeySettings.PROFILE_DUMP:
+                    self.driver.dump_profile()
+                if event.key == KeySettings.CAMERA_ZOOM_IN:
+                    self.driver.zoom_camera(1, pygame.mouse.get_pos())
+                    camera_moved = True
+                if event.key == KeySettings.CAMERA_ZOOM_OUT:
+                    self.driver.zoom_camera(-1, pygame.mouse.get_pos())
+                    camera_moved = True
                 if event.key == K_RETURN or event.key == K_SPACE:
                     self.driver.select_key()
+        # Camera pans on every update while its keys are held
+        pressed = pygame.key.get_pressed()
+        dx = pressed[KeySettings.CAMERA_RIGHT] - pressed[KeySettings.CAMERA_LEFT]
+        dy = pressed[KeySettings.CAMERA_DOWN] - pressed[KeySettings.CAMERA_UP]
+        self.driver.set_camera_direction(dx, dy)
+        panning = dx != 0 or dy != 0
+        # Mouse is over another part of the map now, or was after last updates
+        if camera_moved or panning or self.panning:
+            self.driver.update_mouse_position(pygame.mouse.get_pos())
+        self.panning = panning
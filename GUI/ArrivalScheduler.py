@@ -0,0 +1,58 @@
+"""
+Arrival scheduler.
+"""
+
+import heapq
+
+
+class ArrivalScheduler:
+    """
+    A priority queue of predicted party arrivals, ordered by tick and then by scheduling order.
+    """
+    def __init__(self):
+        """
+        Constructor.
+        """
+        self.queue = []
+        self.scheduled = 0
+
+    def __len__(self):
+        return len(self.queue)
+
+    def clear(self):
+        """
+        Forget every arrival.
+        """
+        self.queue = []
+
+    def schedule(self, tick, gr_pty):
+        """
+        Schedule an arrival.
+        :param tick: Map tick on which given party arrives
+        :type tick: int
+        :param gr_pty: Arriving party
+        :type gr_pty: ScheduledGraphicParty
+        """
+        heapq.heappush(self.queue, (tick, self.scheduled, gr_pty))
+        self.scheduled += 1
+
+    def next_tick(self):
+        """
+        :return: Tick of next arrival, None if there isn't any
+        """
+        if len(self.queue) == 0:
+            return None
+        return self.queue[0][0]
+
+    def pop_due(self, tick):
+        """
+        Remove arrivals due by given tick.
+        :param tick: Current map tick
+        :type tick: int
+        :return: Arriving parties, in arrival order
+        :rtype: list
+        """
+        result = []
+        while len(self.queue) > 0 and self.queue[0][0] <= tick:
+            result.append(heapq.heappop(self.queue)[2])
+        return result
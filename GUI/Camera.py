@@ -0,0 +1,148 @@
+"""
+Camera.
+"""
+
+from GUI.Point import Point
+from Settings.GUISettings import *
+
+
+class Camera:
+    """
+    Part of a map shown on screen. Pans and zooms within the map, never showing past its borders. On maps as large as
+    the screen it starts showing all of it at its own scale, where converting positions leaves them untouched.
+    """
+
+    def __init__(self, view_width, view_height, world_width=None, world_height=None):
+        """
+        Constructor.
+        :param view_width: Screen width
+        :type view_width: int
+        :param view_height: Screen height
+        :type view_height: int
+        :param world_width: Map width, screen width if None
+        :type world_width: int
+        :param world_height: Map height, screen height if None
+        :type world_height: int
+        """
+        self.view_width = view_width
+        self.view_height = view_height
+        self.world_width = view_width
+        self.world_height = view_height
+        self.x = 0
+        self.y = 0
+        self.zoom = 1
+        self.identity = True
+        self.set_world(view_width if world_width is None else world_width,
+                       view_height if world_height is None else world_height)
+
+    def set_world(self, width, height):
+        """
+        Show a map of given size, starting over.
+        :type width: int
+        :type height: int
+        """
+        self.world_width = width
+        self.world_height = height
+        self.reset()
+
+    def reset(self):
+        """
+        Zoom out as much as possible and center.
+        """
+        self.zoom = self.min_zoom()
+        self.x = (self.world_width - self.view_width / self.zoom) / 2
+        self.y = (self.world_height - self.view_height / self.zoom) / 2
+        self.clamp()
+
+    def min_zoom(self):
+        """
+        :return: Smallest zoom that doesn't show past map borders
+        :rtype: float
+        """
+        return max(self.view_width / self.world_width, self.view_height / self.world_height)
+
+    def clamp(self):
+        """
+        Keep zoom within limits and the view within the map.
+        """
+        self.zoom = max(min(self.zoom, CAMERA_MAX_ZOOM), self.min_zoom())
+        self.x = min(max(self.x, 0), self.world_width - self.view_width / self.zoom)
+        self.y = min(max(self.y, 0), self.world_height - self.view_height / self.zoom)
+        self.identity = self.zoom == 1 and self.x == 0 and self.y == 0
+
+    def pan(self, dx, dy):
+        """
+        Move the view.
+        :param dx: Horizontal movement, in screen pixels
+        :param dy: Vertical movement, in screen pixels
+        """
+        self.x += dx / self.zoom
+        self.y += dy / self.zoom
+        self.clamp()
+
+    def zoom_at(self, factor, anchor):
+        """
+        Zoom keeping what's under a screen position in place.
+        :param factor: Zoom multiplier, more than 1 to zoom in
+        :type factor: float
+        :param anchor: Screen position
+        :type anchor: Point
+        """
+        target = self.to_world(anchor)
+        self.zoom = max(min(self.zoom * factor, CAMERA_MAX_ZOOM), self.min_zoom())
+        self.x = target.x - anchor.x / self.zoom
+        self.y = target.y - anchor.y / self.zoom
+        self.clamp()
+
+    def bounds(self, margin=0):
+        """
+        :param margin: Amount to extend the view by on every side, in map units
+        :return: Left, top, right and bottom map coordinates shown
+        :rtype: tuple
+        """
+        return (self.x - margin, self.y - margin, self.x + self.view_width / self.zoom + margin,
+                self.y + self.view_height / self.zoom + margin)
+
+    def sees_everything(self):
+        """
+        :return: True if the whole map is shown, so nothing needs culling
+        :rtype: bool
+        """
+        x_min, y_min, x_max, y_max = self.bounds()
+        return x_min <= 0 and y_min <= 0 and x_max >= self.world_width and y_max >= self.world_height
+
+    def to_screen(self, position):
+        """
+        :param position: Map position. Isn't modified
+        :type position: Point
+        :return: Screen position. Same point if the view is the map at its own scale
+        :rtype: Point
+        """
+        if self.identity:
+            return position
+        return Point((position.x - self.x) * self.zoom, (position.y - self.y) * self.zoom)
+
+    def to_world(self, position):
+        """
+        :param position: Screen position. Isn't modified
+        :type position: Point
+        :return: Map position. Same point if the view is the map at its own scale
+        :rtype: Point
+        """
+        if self.identity:
+            return position
+        return Point(position.x / self.zoom + self.x, position.y / self.zoom + self.y)
+
+    def scale(self, length):
+        """
+        :param length: Map length
+        :return: Screen length
+        """
+        return length * self.zoom
+
+    def state(self):
+        """
+        :return: Position and zoom. Changing any changes the whole board
+        :rtype: tuple
+        """
+        return self.x, self.y, self.zoom
@@ -0,0 +1,209 @@
+"""
+Compositor.
+"""
+
+import pygame
+from Settings.GUISettings import BACKGROUND_QUALITY
+
+
+def display_format(surface, per_pixel_alpha=False):
+    """
+    :param surface: Surface to convert
+    :type surface: Surface
+    :param per_pixel_alpha: Flag to keep per pixel alpha
+    :type per_pixel_alpha: bool
+    :return: Copy in display pixel format, which blits without conversion. Same surface if there's no display yet
+    :rtype: Surface
+    """
+    if pygame.display.get_surface() is None:
+        return surface
+    if per_pixel_alpha:
+        return surface.convert_alpha()
+    return surface.convert()
+
+
+class Layer:
+    """
+    Full screen surface composed over the display. Pixels of its colorkey are see-through. Surface alpha is only
+    applied while partially transparent: opaque layers blit with colorkey alone, which is many times faster than
+    blending, and hidden layers aren't blitted at all.
+    """
+
+    def __init__(self, size, colorkey, alpha=255):
+        """
+        Constructor.
+        :param size: Width and height
+        :type size: tuple
+        :param colorkey: See-through color, also used to clear it
+        :type colorkey: tuple
+        :param alpha: Initial alpha, from 0 to 255
+        :type alpha: int
+        """
+        self.surface = display_format(pygame.Surface(size))
+        self.surface.set_colorkey(colorkey)
+        self.colorkey = colorkey
+        self.alpha = alpha
+        self.applied_alpha = None
+
+    def get_alpha(self):
+        """
+        :return: Current alpha
+        :rtype: int
+        """
+        return self.alpha
+
+    def set_alpha(self, alpha):
+        """
+        :param alpha: New alpha, from 0 to 255. Truncated like surface alphas are
+        :type alpha: float
+        """
+        self.alpha = int(alpha)
+
+    def move_alpha_to(self, target, speed):
+        """
+        Move alpha towards a target value.
+        :param target: Target alpha value
+        :type target: int
+        :param speed: Maximum change
+        :type speed: int
+        """
+        if not self.alpha == target:
+            move_dir = (target - self.alpha) / abs(target - self.alpha)
+            move_amount = min(speed, abs(target - self.alpha))
+            self.set_alpha(self.alpha + move_dir * move_amount)
+
+    def is_visible(self):
+        """
+        :return: True if anything drawn on it would show
+        :rtype: bool
+        """
+        return self.alpha > 0
+
+    def clear(self, rect):
+        """
+        Make a part of it see-through.
+        :type rect: Rect
+        """
+        self.surface.fill(self.colorkey, rect)
+
+    def compose(self, display, rects):
+        """
+        Blit parts of it on the display.
+        :type display: Surface
+        :param rects: Parts to blit, in the same place on both surfaces
+        :type rects: list
+        """
+        if not self.is_visible():
+            return
+        alpha = None if self.alpha >= 255 else self.alpha
+        if alpha != self.applied_alpha:
+            self.surface.set_alpha(alpha)
+            self.applied_alpha = alpha
+        display.blits([(self.surface, rect, rect) for rect in rects], False)
+
+
+class BackgroundLayer:
+    """
+    Full screen opaque surface kept between frames, with the decorative background drawn on it. Redrawn once every
+    few frames according to quality, instead of on the display every frame: erasing the display copies from it, so
+    frames in between only refresh what moved on the layers above.
+    """
+
+    def __init__(self, size, color, interval=BACKGROUND_QUALITY):
+        """
+        Constructor.
+        :param size: Width and height
+        :type size: tuple
+        :param color: Color behind the background objects
+        :type color: tuple
+        :param interval: Frames between redraws. Zero hides background objects
+        :type interval: int
+        """
+        self.surface = display_format(pygame.Surface(size))
+        self.surface.fill(color)
+        self.color = color
+        self.interval = interval
+        self.frames = 0
+        self.rects = []
+
+    def is_enabled(self):
+        """
+        :return: True if background objects are shown
+        :rtype: bool
+        """
+        return self.interval > 0
+
+    def update(self, a_map):
+        """
+        Redraw given map's background if it's time to.
+        :type a_map: Map
+        :return: Rectangles that changed, covering the old and new background objects. Empty if not redrawn
+        :rtype: list
+        """
+        if not self.is_enabled():
+            return []
+        self.frames += 1
+        if self.frames < self.interval:
+            return []
+        self.frames = 0
+        old_rects = self.rects
+        # Background objects are big and overlap, so filling it all is faster than filling each of them
+        if len(old_rects) > 0:
+            self.surface.fill(self.color)
+        self.rects = a_map.draw_background(self.surface)
+        return old_rects + self.rects
+
+    def erase(self, display, rects):
+        """
+        Restore parts of the display to the background.
+        :type display: Surface
+        :type rects: list
+        """
+        display.blits([(self.surface, rect, rect) for rect in rects], False)
+
+
+class Compositor:
+    """
+    Screen made of the background, the board layer with the map and the ui layer with menus, bottom to top.
+    """
+
+    def __init__(self, display, background_color, colorkey):
+        """
+        Constructor. Board and ui start hidden.
+        :param display: Display surface
+        :type display: Surface
+        :param background_color: Color of the background
+        :type background_color: tuple
+        :param colorkey: See-through color of layers
+        :type colorkey: tuple
+        """
+        self.display = display
+        self.background = BackgroundLayer(display.get_size(), background_color)
+        self.board = Layer(display.get_size(), colorkey, 0)
+        self.ui = Layer(display.get_size(), colorkey, 0)
+        self.layers = [self.board, self.ui]
+
+    def state(self):
+        """
+        :return: Alpha of every layer. Changing any changes the whole screen
+        :rtype: tuple
+        """
+        return tuple(layer.get_alpha() for layer in self.layers)
+
+    def erase(self, rects):
+        """
+        Restore parts of the display to the background and clear every layer.
+        :type rects: list
+        """
+        self.background.erase(self.display, rects)
+        for rect in rects:
+            for layer in self.layers:
+                layer.clear(rect)
+
+    def compose(self, rects):
+        """
+        Blit parts of every visible layer on the display.
+        :type rects: list
+        """
+        for layer in self.layers:
+            layer.compose(self.display, rects)
@@ -0,0 +1,118 @@
+"""
+Dirty region.
+"""
+
+import numpy as np
+import pygame
+from Settings.GUISettings import *
+
+
+class DirtyRegion:
+    """
+    Parts of the screen that changed between two frames, kept as a grid of tiles. Whatever was drawn last frame must
+    be erased and whatever is drawn now must be shown, so both frames' tiles are refreshed. Tiles never overlap,
+    which matters when composing semi-transparent surfaces: blitting the same pixel twice would blend it twice.
+    """
+
+    def __init__(self, width, height, tile_size=DIRTY_TILE_SIZE):
+        """
+        Constructor. First frame is a full one.
+        :type width: int
+        :type height: int
+        :param tile_size: Side of a tile, in pixels
+        :type tile_size: int
+        """
+        self.width = width
+        self.height = height
+        self.tile_size = tile_size
+        self.columns = -(-width // tile_size)
+        self.rows = -(-height // tile_size)
+        self.previous = np.ones((self.rows, self.columns), dtype=bool)
+        self.current = np.zeros((self.rows, self.columns), dtype=bool)
+        self.full = True
+        self.state = None
+
+    def invalidate(self):
+        """
+        Refresh the whole screen on next frame.
+        """
+        self.full = True
+
+    def begin(self, state):
+        """
+        Start a frame.
+        :param state: Anything changing every pixel when it changes, like surface alphas. Compared to last frame's
+        :return: Rectangles to erase before drawing, covering everything drawn last frame
+        :rtype: list
+        """
+        if state != self.state:
+            self.state = state
+            self.full = True
+        if self.full:
+            self.previous[:] = True
+        return self.rects(self.previous)
+
+    def mark(self, rects):
+        """
+        Mark given rectangles as drawn this frame.
+        :param rects: Bounding rectangles of what was drawn. None are ignored
+        :type rects: list
+        """
+        self.mark_tiles(self.current, rects)
+
+    def mark_late(self, rects):
+        """
+        Mark given rectangles as drawn after this frame ended, straight on screen. They are erased next frame.
+        :param rects: Bounding rectangles of what was drawn. None are ignored
+        :type rects: list
+        """
+        self.mark_tiles(self.previous, rects)
+
+    def mark_tiles(self, tiles, rects):
+        """
+        Mark tiles covered by given rectangles.
+        :param tiles: Tiles to mark
+        :type tiles: ndarray
+        :param rects: Rectangles. None are ignored
+        :type rects: list
+        """
+        size = self.tile_size
+        for rect in rects:
+            if rect is None:
+                continue
+            x0 = max(rect.left // size, 0)
+            y0 = max(rect.top // size, 0)
+            x1 = min((rect.right - 1) // size + 1, self.columns)
+            y1 = min((rect.bottom - 1) // size + 1, self.rows)
+            if x0 < x1 and y0 < y1:
+                tiles[y0:y1, x0:x1] = True
+
+    def end(self):
+        """
+        Finish a frame.
+        :return: Rectangles to refresh, covering what was drawn last frame and this one
+        :rtype: list
+        """
+        result = self.rects(self.previous | self.current)
+        self.previous, self.current = self.current, self.previous
+        self.current[:] = False
+        self.full = False
+        return result
+
+    def rects(self, tiles):
+        """
+        :param tiles: Tiles to cover
+        :type tiles: ndarray
+        :return: One rectangle per horizontal run of given tiles, clipped to the screen
+        :rtype: list
+        """
+        size = self.tile_size
+        screen = pygame.Rect(0, 0, self.width, self.height)
+        result = []
+        for y in np.flatnonzero(tiles.any(axis=1)):
+            row = np.concatenate(([False], tiles[y], [False]))
+            edges = np.flatnonzero(row[1:] != row[:-1])
+            for start, stop in zip(edges[::2], edges[1::2]):
+                result.append(pygame.Rect(int(start) * size, int(y) * size, int(stop - start) * size,
+                                          size).clip(screen))
+        return result
@@ -0,0 +1,47 @@
+"""
+Font pool.
+"""
+
+import pygame
+
+
+class FontPool:
+    """
+    Loads every font once and shares it. Fonts are never changed after loading, so styles are part of the key:
+    objects that underline their text on hover ask for the underlined font instead.
+    """
+
+    def __init__(self):
+        """
+        Constructor.
+        """
+        self.fonts = {}
+
+    def __len__(self):
+        return len(self.fonts)
+
+    def get(self, file, size, bold=False, underline=False):
+        """
+        :param file: Font file
+        :type file: str
+        :param size: Font size
+        :type size: int
+        :param bold: Flag to make bold
+        :type bold: bool
+        :param underline: Flag to underline
+        :type underline: bool
+        :return: Shared font with given style. Don't change it
+        :rtype: Font
+        """
+        key = (file, size, bold, underline)
+        font = self.fonts.get(key)
+        if font is None:
+            font = pygame.font.Font(file, size)
+            font.set_bold(bold)
+            font.set_underline(underline)
+            self.fonts[key] = font
+        return font
+
+
+# Shared by every graphic object and menu
+FONT_POOL = FontPool()
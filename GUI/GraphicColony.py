@@ -2,19 +2,21 @@
 Graphic colony.
 """
 
-import pygame
 from Settings import ColonySettings
 from Settings import GUISettings
 from GUI.GraphicObject import MovingObject
 from GUI.Functions import draw_ngon
-from GUI.GraphicParty import GraphicParty
-from GUI.Point import Point
+from GUI.FontPool import FONT_POOL
+from GUI.TextCache import TEXT_CACHE
 
 
 class GraphicColony(MovingObject):
     """
     Graphic abstraction of a Colony.
     """
+    # Shared by every colony, so their counts are rendered once for all of them
+    font = None
+
     def __init__(self, a_map, colony, position, radius):
         """
         Constructor.
@@ -27,11 +29,12 @@ class GraphicColony(MovingObject):
         """
         super(GraphicColony, self).__init__(a_map, position, radius, position, GUISettings.COLONY_MAX_SPEED)
         self.colony = colony
+        self.colony.set_timer(a_map.timer)
+        self.colony.set_census(a_map.census)
         self.theta = 0
+        self.last_spin = a_map.ticks
         self.hitbox = int(self.hitbox * 5 / 6)
         self.text = ""
-        self.font = pygame.font.Font("res/Cabin-Bold.ttf", 25)
-        self.font.set_bold(True)
 
     def arrived(self):
         """
@@ -49,12 +52,16 @@ class GraphicColony(MovingObject):
 
     def tick(self):
         """
-        Update graphic colony.
+        Do nothing. Colonies grow with their map's timer and spin when drawn, so idle colonies cost nothing.
         """
-        if not self.map.is_over:
-            self.colony.tick()
-        self.text = str(self.colony.size)
-        self.theta += self.get_rot_speed()
+        pass
+
+    def spin(self):
+        """
+        Rotate for every map tick since last spin.
+        """
+        self.theta += self.get_rot_speed() * (self.map.ticks - self.last_spin)
+        self.last_spin = self.map.ticks
 
     def collide(self, o):
         """
@@ -67,11 +74,27 @@ class GraphicColony(MovingObject):
         Draw on given surface.
         :param surface: Surface to draw on
         :type surface: Surface
+        :return: Bounding rectangle
+        :rtype: Rect
+        """
+        self.spin()
+        self.text = str(self.colony.size)
+        camera = self.map.camera
+        position = camera.to_screen(self.position)
+        rect = draw_ngon(surface, self.colony.get_color(), 4, camera.scale(self.radius), position, self.theta)
+        self.load_font()
+        label = TEXT_CACHE.render(GraphicColony.font, self.text, GUISettings.COLONY_NUMBER_COLOR)
+        return rect.union(surface.blit(label, (position.x - label.get_width() / 2,
+                                               position.y - label.get_height() / 2)))
+
+    def load_font(self):
+        """
+        Load font on first draw, so colonies can be used without a display. Every possible count is rendered then.
         """
-        draw_ngon(surface, self.colony.get_color(), 4, self.radius, self.position, self.theta)
-        label = self.font.render(self.text, 1, GUISettings.COLONY_NUMBER_COLOR)
-        font_point = Point(self.font.size(self.text)[0], self.font.size(self.text)[1]).scale(0.5)
-        surface.blit(label, (self.position - font_point).to_tuple())
+        if GraphicColony.font is None:
+            GraphicColony.font = FONT_POOL.get(GUISettings.BOLD_FONT_FILE, GUISettings.COLONY_FONT_SIZE, bold=True)
+            TEXT_CACHE.warm(GraphicColony.font, [str(size) for size in range(ColonySettings.POPULATION_LIMIT + 1)],
+                            GUISettings.COLONY_NUMBER_COLOR)
 
     def add_to_map(self):
         """
@@ -91,10 +114,12 @@ class GraphicColony(MovingObject):
         :param destination: Target colony
         :type destination: GraphicColony
         """
-        return GraphicParty(self.map, self.colony.create_party(), self.position,
-                            (GUISettings.MAX_PARTY_COLONY_RATIO * self.radius - GUISettings.MIN_PARTY_SIZE) *
-                            self.colony.size / ColonySettings.POPULATION_LIMIT + GUISettings.MIN_PARTY_SIZE,
-                            destination)
+        if self.map.recorder is not None:
+            self.map.recorder.record(self, destination)
+        return self.map.create_party(self.colony.create_party(), self.position,
+                                     (GUISettings.MAX_PARTY_COLONY_RATIO * self.radius - GUISettings.MIN_PARTY_SIZE) *
+                                     self.colony.size / ColonySettings.POPULATION_LIMIT + GUISettings.MIN_PARTY_SIZE,
+                                     destination)
 
     def get_race(self):
         """
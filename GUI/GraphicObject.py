@@ -50,6 +50,8 @@ class AbstractGraphicObject:
         """
         Draw on given surface.
         :type surface: Surface
+        :return: Bounding rectangle of what was drawn, None if nothing was
+        :rtype: Rect
         """
         pass
 
@@ -89,6 +91,7 @@ class MovingObject(AbstractGraphicObject):
         self.acceleration = Point(0, 0)
         self.max_speed = max_speed
         self.external = Point(0, 0)
+        self.previous_position = self.position.copy()
 
     def tick(self):
         """
@@ -110,16 +113,22 @@ class MovingObject(AbstractGraphicObject):
         Update position
         """
         # Set speed towards destination
-        self.speed = (self.destination.position - self.position).limit_size(self.max_speed)
+        speed = self.speed.scale_into(self.destination.position).isub(self.position).limit_size(self.max_speed)
         # Add external speed and adjust to avoid getting stuck
-        self.speed += self.external.limit_size(self.max_speed).copy().scale(
-            Settings.GUISettings.PARTY_EXTERNAL_SPEED_ADJUST
-        )
+        speed.iadd(self.external.limit_size(self.max_speed), Settings.GUISettings.PARTY_EXTERNAL_SPEED_ADJUST)
         # Normalize speed
-        self.speed.normalize(self.max_speed)
+        speed.normalize(self.max_speed)
 
         # Effectively move
-        self.position = self.position + self.speed
+        self.previous_position.scale_into(self.position)
+        self.position.iadd(speed)
+
+    def render_position(self):
+        """
+        :return: Position to draw, between the last two ticks according to its map's interpolation
+        :rtype: Point
+        """
+        return self.previous_position.lerp(self.position, self.map.interpolation)
 
     @abc.abstractmethod
     def arrived(self):
@@ -7,7 +7,7 @@ from GUI.GraphicObject import MovingObject
 from GUI.Functions import draw_ngon
 from GUI.Point import Point
 from Party import Party
-from Race import NullRace
+from Race import NULL_RACE
 
 
 class GraphicParty(MovingObject):
@@ -27,7 +27,7 @@ class GraphicParty(MovingObject):
         """
         self.party = party
         super(GraphicParty, self).__init__(
-            a_map, position_i, radius, destination, self.party.get_max_speed() * Settings.GUISettings.PARTY_SPEED_FACTOR
+            a_map, position_i.copy(), radius, destination, self.party.get_max_speed() * Settings.GUISettings.PARTY_SPEED_FACTOR
         )
         self.theta = 0
         self.hitbox = int(self.radius / 2)
@@ -43,11 +43,26 @@ class GraphicParty(MovingObject):
 
     def draw(self, surface):
         """
-        Draw on given surface.
+        Draw on given surface, as seen by its map's camera.
+        :param surface: Surface to draw on
+        :type surface: Surface
+        :return: Bounding rectangle
+        :rtype: Rect
+        """
+        camera = self.map.camera
+        return self.party.draw(surface, camera.scale(self.radius), camera.to_screen(self.render_position()), self.theta,
+                               self.parameter, self.speed)
+
+    def draw_static(self, surface):
+        """
+        Draw on given surface without animation, as seen by its map's camera.
         :param surface: Surface to draw on
         :type surface: Surface
+        :return: Bounding rectangle
+        :rtype: Rect
         """
-        self.party.draw(surface, self.radius, self.position, self.theta, self.parameter, self.speed)
+        camera = self.map.camera
+        return self.party.draw_static(surface, camera.scale(self.radius), camera.to_screen(self.render_position()))
 
     def collide(self, o):
         """
@@ -97,7 +112,7 @@ class BackgroundParty(GraphicParty):
     Graphic party for Background.
     """
     def __init__(self, a_map, position_i, position_f, radius, max_speed):
-        super(BackgroundParty, self).__init__(a_map, Party(NullRace(), 0), position_i, radius, position_f)
+        super(BackgroundParty, self).__init__(a_map, Party(NULL_RACE, 0), position_i, radius, position_f)
         self.max_speed = max_speed
 
     def add_to_map(self):
@@ -124,19 +139,229 @@ class BackgroundParty(GraphicParty):
         Draw on given surface.
         :param surface: Surface to draw on
         :type surface: Surface
+        :return: Bounding rectangle, None if it left the screen
+        :rtype: Rect
         """
-        if not (-self.radius < self.position.x < self.map.width + self.radius
-                and -self.radius < self.position.y < self.map.height + self.radius):
+        camera = self.map.camera
+        if not (-self.radius < self.position.x < camera.view_width + self.radius
+                and -self.radius < self.position.y < camera.view_height + self.radius):
             self.remove()
-        else:
-            draw_ngon(surface, Settings.GUISettings.BACKGROUND_COLOR, 3, self.radius, self.position, self.theta)
+            return None
+        return draw_ngon(surface, Settings.GUISettings.BACKGROUND_COLOR, 3, self.radius, self.render_position(),
+                         self.theta)
 
     def move(self):
         """
         Update position.
         """
-        self.acceleration = (self.destination - self.position).limit_size(1).scale(
+        self.acceleration.scale_into(self.destination).isub(self.position).limit_size(1).scale(
             Settings.GUISettings.PARTY_ACCELERATION_FACTOR)
-        self.speed = self.speed + self.acceleration
-        self.speed.limit_size(self.max_speed)
-        self.position = self.position + self.speed
+        self.speed.iadd(self.acceleration).limit_size(self.max_speed)
+        self.previous_position.scale_into(self.position)
+        self.position.iadd(self.speed)
+
+
+class StoredGraphicParty(GraphicParty):
+    """
+    Graphic party whose moving state lives in its map's PartyStore. Moved all at once by the store.
+    """
+    def __init__(self, a_map, party, position_i, radius, destination):
+        """
+        Constructor.
+        :param a_map: Map which this object belongs to. Must have a party store
+        :type a_map: Map
+        :param party: Logic colony
+        :type party: Party
+        :param position_i: Initial position
+        :type position_i: Point
+        :param destination: Destination
+        """
+        self.store = a_map.party_store
+        self.slot = self.store.allocate(self)
+        self._destination = None
+        super(StoredGraphicParty, self).__init__(a_map, party, position_i, radius, destination)
+
+    @property
+    def position(self):
+        x, y = self.store.positions[self.slot].tolist()
+        return Point(x, y)
+
+    @position.setter
+    def position(self, position):
+        self.store.positions[self.slot] = position.x, position.y
+        self.store.previous_positions[self.slot] = position.x, position.y
+
+    @property
+    def previous_position(self):
+        x, y = self.store.previous_positions[self.slot].tolist()
+        return Point(x, y)
+
+    @previous_position.setter
+    def previous_position(self, position):
+        self.store.previous_positions[self.slot] = position.x, position.y
+
+    @property
+    def speed(self):
+        x, y = self.store.speeds[self.slot].tolist()
+        return Point(x, y)
+
+    @speed.setter
+    def speed(self, speed):
+        self.store.speeds[self.slot] = speed.x, speed.y
+
+    @property
+    def external(self):
+        x, y = self.store.externals[self.slot].tolist()
+        return Point(x, y)
+
+    @external.setter
+    def external(self, external):
+        self.store.externals[self.slot] = external.x, external.y
+
+    @property
+    def max_speed(self):
+        return self.store.max_speeds[self.slot].item()
+
+    @max_speed.setter
+    def max_speed(self, max_speed):
+        self.store.max_speeds[self.slot] = max_speed
+
+    @property
+    def destination(self):
+        return self._destination
+
+    @destination.setter
+    def destination(self, destination):
+        self._destination = destination
+        self.store.destinations[self.slot] = self.store.colony_index(destination)
+
+    def move(self):
+        """
+        Do nothing. The store moves every party at once.
+        """
+        pass
+
+    def reset_ext_forces(self):
+        """
+        Do nothing. The store resets every party at once.
+        """
+        pass
+
+    def arrived(self):
+        """
+        Remove from its map and free its slot.
+        """
+        super(StoredGraphicParty, self).arrived()
+        self.store.release(self)
+
+    def unstored(self):
+        """
+        Create a party moving on its own in the same state. It's added to its map, this one isn't removed.
+        :return: New graphic party
+        :rtype: GraphicParty
+        """
+        gr_pty = GraphicParty(self.map, self.party, self.position, self.radius, self.destination)
+        gr_pty.previous_position = self.previous_position
+        gr_pty.speed = self.speed
+        gr_pty.external = self.external
+        gr_pty.max_speed = self.max_speed
+        gr_pty.theta = self.theta
+        gr_pty.parameter = self.parameter
+        return gr_pty
+
+
+class ScheduledGraphicParty(GraphicParty):
+    """
+    Graphic party flying straight to its destination. Its arrival is predicted when sent and resolved by its map's
+    ArrivalScheduler, and its position is only computed when asked for, from ticks since departure.
+    """
+    def __init__(self, a_map, party, position_i, radius, destination, start_tick=None):
+        """
+        Constructor.
+        :param a_map: Map which this object belongs to. Must have an arrival scheduler
+        :type a_map: Map
+        :param party: Logic colony
+        :type party: Party
+        :param position_i: Initial position
+        :type position_i: Point
+        :param destination: Destination
+        :param start_tick: Map tick in which it left initial position, current tick if None
+        :type start_tick: int
+        """
+        self.start = position_i.copy()
+        self.start_tick = a_map.ticks if start_tick is None else start_tick
+        self.landed = False
+        self.distance = 0
+        self.direction = Point(0, 0)
+        super(ScheduledGraphicParty, self).__init__(a_map, party, position_i, radius, destination)
+        delta = destination.position - self.start
+        self.distance = delta.length()
+        self.direction = delta.scale(1 / self.distance) if self.distance > 0 else delta
+        self.speed = self.direction.copy().scale(self.max_speed)
+        self.arrival_tick = self.start_tick + self.flight_ticks()
+        a_map.arrival_scheduler.schedule(self.arrival_tick, self)
+
+    @property
+    def position(self):
+        travelled = min((self.map.ticks - self.start_tick) * self.max_speed, self.distance)
+        return self.start.copy().iadd(self.direction, travelled)
+
+    @position.setter
+    def position(self, position):
+        self.start = position.copy()
+
+    def render_position(self):
+        """
+        :return: Position to draw, between the last two ticks according to its map's interpolation
+        :rtype: Point
+        """
+        age = max(self.map.ticks - self.start_tick - 1 + self.map.interpolation, 0)
+        return self.start.copy().iadd(self.direction, min(age * self.max_speed, self.distance))
+
+    def flight_ticks(self):
+        """
+        :return: Moves needed to be within collision range of destination
+        """
+        reach = self.hitbox + self.destination.hitbox
+        if self.distance < reach:
+            return 0
+        return int((self.distance - reach) // self.max_speed) + 1
+
+    def tick(self):
+        """
+        Do nothing. Position and animation are computed from ticks since departure.
+        """
+        pass
+
+    def reset_ext_forces(self):
+        """
+        Do nothing. Scheduled parties don't avoid colonies.
+        """
+        pass
+
+    def collide(self, o):
+        """
+        Do nothing. Arrival is resolved by the scheduler.
+        """
+        pass
+
+    def arrived(self):
+        """
+        Enter destination, only once.
+        """
+        if not self.landed:
+            self.landed = True
+            super(ScheduledGraphicParty, self).arrived()
+
+    def draw(self, surface):
+        """
+        Draw on given surface.
+        :param surface: Surface to draw on
+        :type surface: Surface
+        :return: Bounding rectangle
+        :rtype: Rect
+        """
+        age = self.map.ticks - self.start_tick
+        camera = self.map.camera
+        return self.party.draw(surface, camera.scale(self.radius), camera.to_screen(self.render_position()),
+                               age * Settings.GUISettings.COLONY_SPIN_SPEED, age, self.speed)
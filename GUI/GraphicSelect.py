@@ -47,11 +47,16 @@ class GraphicSelect(AbstractGraphicObject):
         """
         Draw on given surface.
         :type surface: Surface
+        :return: Bounding rectangle
+        :rtype: Rect
         """
-        pygame.draw.circle(surface, self.get_color(), self.position.discretize().to_tuple(),
-                           int(np.floor(self.radius + self.anim_radius)), self.get_width())
-        pygame.draw.line(surface, self.get_color(), self.position.discretize().to_tuple(),
-                         self.map.mouse_position.to_tuple(), self.get_line_width())
+        camera = self.map.camera
+        position = camera.to_screen(self.position).discretize().to_tuple()
+        rect = pygame.draw.circle(surface, self.get_color(), position,
+                                  int(np.floor(camera.scale(self.radius + self.anim_radius))), self.get_width())
+        return rect.union(pygame.draw.line(surface, self.get_color(), position,
+                                            camera.to_screen(self.map.mouse_position).to_tuple(),
+                                            self.get_line_width()))
 
     def get_color(self):
         """
@@ -110,11 +115,14 @@ class Hover(GraphicSelect):
         """
         Draw on given surface.
         :type surface: Surface
-        """
-        pygame.draw.circle(surface, self.get_color(),
-                           self.position.discretize().to_tuple(),
-                           int(self.radius + self.anim_radius + HOVER_AMP),
-                           self.get_width())
+        :return: Bounding rectangle
+        :rtype: Rect
+        """
+        camera = self.map.camera
+        return pygame.draw.circle(surface, self.get_color(),
+                                  camera.to_screen(self.position).discretize().to_tuple(),
+                                  int(camera.scale(self.radius + self.anim_radius + HOVER_AMP)),
+                                  self.get_width())
 
     def add_to_map(self):
         """
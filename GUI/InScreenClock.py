@@ -3,7 +3,8 @@ In screen clock
 """
 
 from Settings.GeneralSettings import *
-from GUI.Point import Point
+from GUI.FontPool import FONT_POOL
+from GUI.TextCache import TEXT_CACHE
 import pygame
 from Settings.GUISettings import *
 
@@ -23,7 +24,17 @@ class InScreenClock:
         self.ticks = 0
         self.time = 0
         self.upper_center_point = upper_center_point
-        self.font = pygame.font.Font("res/Cabin-Bold.ttf", CLOCK_FONT_SIZE)
+        self.font = None
+        self.box = None
+
+    def load_font(self):
+        """
+        Load font on first draw, so clocks can be used without a display. Its box fits the widest time.
+        """
+        if self.font is None:
+            self.font = FONT_POOL.get(BOLD_FONT_FILE, CLOCK_FONT_SIZE)
+            width, height = self.font.size("00:00")
+            self.box = pygame.Rect(self.upper_center_point.x - width // 2, self.upper_center_point.y, width, height)
 
     def reset(self):
         """
@@ -54,21 +65,25 @@ class InScreenClock:
                 self.ticks = 0
                 self.time += 1
 
+    def skip(self, amount):
+        """
+        Update time for given amount of ticks at once.
+        :type amount: int
+        """
+        if not self.map.is_over:
+            self.ticks += amount
+            self.time += self.ticks // GAME_TICKS_PER_SECOND
+            self.ticks %= GAME_TICKS_PER_SECOND
+
     def draw(self, surface):
         """
         Draw on given surface
         :type surface: Surface
+        :return: Bounding rectangle
+        :rtype: Rect
         """
-        label = self.font.render(self.time_as_text(), 1, CLOCK_TEXT_COLOR)
-        text_max_size = Point(self.font.size("00:00")[0], self.font.size("00:00")[1])
-        text_size = Point(self.font.size(self.time_as_text())[0], self.font.size(self.time_as_text())[1])
-        top_left_corner = self.upper_center_point - Point(text_size.copy().scale(0.5).x, 0)
-        p1 = (self.upper_center_point + Point(-text_max_size.copy().scale(0.5).x, 0)).to_tuple()
-        p2 = (self.upper_center_point + Point(text_max_size.copy().scale(0.5).x, 0)).to_tuple()
-        p3 = (self.upper_center_point + Point(text_max_size.copy().scale(0.5).x,
-                                              text_max_size.copy().y)).to_tuple()
-        p4 = (self.upper_center_point + Point(-text_max_size.copy().scale(0.5).x,
-                                              text_max_size.copy().y)).to_tuple()
-
-        pygame.draw.polygon(surface, CLOCK_RECT_COLOR, [p1, p2, p3, p4])
-        surface.blit(label, top_left_corner.to_tuple())
+        self.load_font()
+        label = TEXT_CACHE.render(self.font, self.time_as_text(), CLOCK_TEXT_COLOR)
+        rect = pygame.draw.rect(surface, CLOCK_RECT_COLOR, self.box)
+        return rect.union(surface.blit(label, (self.upper_center_point.x - label.get_width() / 2,
+                                               self.upper_center_point.y)))
@@ -0,0 +1,117 @@
+"""
+Level of detail.
+"""
+
+import math
+from Settings.GUISettings import *
+
+# Detail levels, from most to least detailed
+FULL_DETAIL = 0
+STATIC_DETAIL = 1
+DOT_DETAIL = 2
+
+
+class LevelOfDetail:
+    """
+    Chooses how much detail parties are drawn with. Full detail animates them as their race does, static detail
+    blits a single cached polygon and dot detail merges parties of the same race that are close on screen into one
+    dot, sized by how many they are. Level depends on how many parties are on screen, and on how big each one looks.
+    """
+
+    def __init__(self, static_count=LOD_STATIC_COUNT, dot_count=LOD_DOT_COUNT, static_radius=LOD_STATIC_RADIUS,
+                 dot_radius=LOD_DOT_RADIUS):
+        """
+        Constructor.
+        :param static_count: Parties on screen above which animation stops
+        :type static_count: int
+        :param dot_count: Parties on screen above which they're drawn as dots
+        :type dot_count: int
+        :param static_radius: Screen radius below which a party isn't animated
+        :param dot_radius: Screen radius below which a party is drawn as a dot
+        """
+        self.static_count = static_count
+        self.dot_count = dot_count
+        self.static_radius = static_radius
+        self.dot_radius = dot_radius
+        self.count_level = FULL_DETAIL
+
+    def level_for_count(self, count):
+        """
+        Counts must drop somewhat below a threshold to get detail back, so crowds around it don't flicker.
+        :param count: Parties on screen
+        :type count: int
+        :return: Detail level allowed by given amount of parties
+        :rtype: int
+        """
+        thresholds = [self.static_count, self.dot_count]
+        level = FULL_DETAIL
+        for i, threshold in enumerate(thresholds):
+            if i < self.count_level:
+                threshold *= LOD_HYSTERESIS
+            if count > threshold:
+                level = i + 1
+        self.count_level = level
+        return level
+
+    def level_for_radius(self, radius):
+        """
+        :param radius: Screen radius of a party
+        :return: Detail level allowed by given size
+        :rtype: int
+        """
+        if radius < self.dot_radius:
+            return DOT_DETAIL
+        if radius < self.static_radius:
+            return STATIC_DETAIL
+        return FULL_DETAIL
+
+    def draw(self, parties, surface, camera):
+        """
+        Draw given parties with as much detail as allowed.
+        :param parties: Parties on screen
+        :type parties: list
+        :type surface: Surface
+        :param camera: Camera they're seen by
+        :type camera: Camera
+        :return: Bounding rectangles of what was drawn
+        :rtype: list
+        """
+        count_level = self.level_for_count(len(parties))
+        rects = []
+        clusters = {}
+        for p in list(parties):
+            level = count_level
+            if level < DOT_DETAIL:
+                level = max(level, self.level_for_radius(camera.scale(p.radius)))
+            if level == FULL_DETAIL:
+                rects.append(p.draw(surface))
+            elif level == STATIC_DETAIL:
+                rects.append(p.draw_static(surface))
+            else:
+                position = camera.to_screen(p.render_position())
+                key = (int(position.x // LOD_CLUSTER_CELL), int(position.y // LOD_CLUSTER_CELL), p.party.race)
+                cluster = clusters.get(key)
+                if cluster is None:
+                    clusters[key] = [position.x, position.y, 1]
+                else:
+                    cluster[0] += position.x
+                    cluster[1] += position.y
+                    cluster[2] += 1
+        return rects + self.draw_clusters(surface, clusters)
+
+    @staticmethod
+    def draw_clusters(surface, clusters):
+        """
+        Draw one dot per cluster, on its average position and growing with its amount of parties.
+        :type surface: Surface
+        :param clusters: Sum of positions and amount of parties, by cell and race
+        :type clusters: dict
+        :return: Bounding rectangles of what was drawn
+        :rtype: list
+        """
+        rects = []
+        for (i, j, race), (x, y, amount) in clusters.items():
+            size = min(LOD_DOT_SIZE + int(math.sqrt(amount - 1)), LOD_MAX_DOT_SIZE)
+            rects.append(surface.fill(race.get_color(), (int(x / amount) - size // 2, int(y / amount) - size // 2,
+                                                         size, size)))
+        return rects
@@ -9,7 +9,18 @@ from GUI.GraphicObject import AbstractGraphicObject
 from GUI.GraphicSelect import GraphicSelect
 from GUI.GraphicSelect import Hover
 from GUI.GraphicParty import BackgroundParty
+from GUI.GraphicParty import GraphicParty
+from GUI.GraphicParty import StoredGraphicParty
+from GUI.GraphicParty import ScheduledGraphicParty
+from GUI.ArrivalScheduler import ArrivalScheduler
+from GUI.Camera import Camera
+from GUI.PartyStore import PartyStore
+from GUI.RaceCensus import RaceCensus
+from GUI.SpatialHash import SpatialHash
+from GUI.SpriteAtlas import SPRITE_ATLAS
 from GUI.InScreenClock import InScreenClock
+from GUI.LevelOfDetail import LevelOfDetail
+from Colony import TickCounter
 from Settings.GUISettings import *
 from Settings.GeneralSettings import *
 
@@ -18,14 +29,18 @@ class Map:
     """
     A wrapper for all current graphic objects. Updates them and draws them.
     """
-    def __init__(self, width, height):
+    def __init__(self, width, height, seed=None):
         """
-        Constructor
+        Constructor. Given size is also the size of its view.
         :type width: int
         :type height: int 
+        :param seed: Seed for random streams, fresh entropy if None
+        :type seed: int
         """
         self.width = width
         self.height = height
+        self.camera = Camera(width, height)
+        self.level_of_detail = LevelOfDetail() if LEVEL_OF_DETAIL else None
 
         self.graphic_colonies = []
         self.graphic_parties = []
@@ -37,6 +52,88 @@ class Map:
         self.mouse_position = Point(0, 0)
 
         self.is_over = False
+        self.ticks = 0
+        self.interpolation = 1
+        self.timer = TickCounter()
+        self.census = RaceCensus()
+
+        self.seed_value = None
+        self.random = None
+        self.background_random = None
+        self.seed(seed)
+
+        self.party_store = None
+        self.set_party_store(PARTY_STORE)
+
+        self.collision_mode = COLLISION_MODE
+        self.arrival_scheduler = ArrivalScheduler()
+        self.colony_grid = None
+        self.colony_arrays = None
+        self.recorder = None
+
+    def seed(self, seed=None):
+        """
+        Restart random streams. Gameplay and background draw from separate streams, so cosmetic effects never
+        change the outcome of a match.
+        :param seed: Seed for both streams, fresh entropy if None
+        :type seed: int
+        """
+        sequence = np.random.SeedSequence(seed)
+        gameplay, cosmetic = sequence.spawn(2)
+        self.seed_value = sequence.entropy
+        self.random = np.random.default_rng(gameplay)
+        self.background_random = np.random.default_rng(cosmetic)
+
+    def resize(self, width, height):
+        """
+        Change map size. Its view keeps its size and starts over.
+        :type width: int
+        :type height: int
+        """
+        self.width = width
+        self.height = height
+        self.camera.set_world(width, height)
+
+    def set_party_store(self, enabled):
+        """
+        Choose whether new parties are kept in a PartyStore and moved all at once. Parties already on the map
+        keep moving on their own when enabling it, and are taken out of the store when disabling it.
+        :param enabled: True to store new parties, False to let each of them move on its own
+        :type enabled: bool
+        """
+        if enabled and self.party_store is None:
+            self.party_store = PartyStore()
+            for gr_col in self.graphic_colonies:
+                self.party_store.add_colony(gr_col)
+        if not enabled and self.party_store is not None:
+            self.party_store = None
+            parties = self.graphic_parties
+            self.graphic_parties = []
+            for p in parties:
+                if isinstance(p, StoredGraphicParty):
+                    self.census.remove_party(p.party.race)
+                    p.unstored()
+                else:
+                    self.graphic_parties.append(p)
+
+    def create_party(self, party, position, radius, destination):
+        """
+        Create a graphic party on this map, stored if there's a party store.
+        :param party: Logic party
+        :type party: Party
+        :param position: Initial position
+        :type position: Point
+        :param radius: Party radius
+        :param destination: Destination
+        :type destination: GraphicColony
+        :return: New graphic party
+        :rtype: GraphicParty
+        """
+        if self.collision_mode == EVENT_COLLISIONS:
+            return ScheduledGraphicParty(self, party, position, radius, destination)
+        if self.party_store is None:
+            return GraphicParty(self, party, position, radius, destination)
+        return StoredGraphicParty(self, party, position, radius, destination)
 
     def empty(self):
         """
@@ -48,18 +145,35 @@ class Map:
         self.selection = []
         self.hover = []
         self.mouse_position = Point(0, 0)
+        self.census = RaceCensus()
+        if self.party_store is not None:
+            self.party_store.clear()
+        self.arrival_scheduler.clear()
+        self.invalidate_colonies()
+        self.recorder = None
 
     def insert_graphic_colony(self, graphic_colony):
         """
         Insert a graphic object in corresponding array. 
         """
         self.graphic_colonies.append(graphic_colony)
+        if self.party_store is not None:
+            self.party_store.add_colony(graphic_colony)
+        self.invalidate_colonies()
+
+    def invalidate_colonies(self):
+        """
+        Forget structures built from colonies. Rebuilt when needed.
+        """
+        self.colony_grid = None
+        self.colony_arrays = None
 
     def insert_graphic_party(self, graphic_party):
         """
         Insert a graphic object in corresponding array. 
         """
         self.graphic_parties.append(graphic_party)
+        self.census.add_party(graphic_party.party.race)
 
     def insert_selection(self, a_selection):
         """
@@ -92,38 +206,40 @@ class Map:
         Generate new background objects if there aren't enough.
         """
         if len(self.background) < MAX_BACKGROUND_ELEMENTS:
-            rad = np.random.randint(0, MAX_BACKGROUND_SIZE)
+            random = self.background_random
+            rad = random.integers(0, MAX_BACKGROUND_SIZE)
             pos_i = Point(0, 0)
             pos_f = Point(0, 0)
-            side_i = np.random.randint(0, 3)
-            side_f = np.random.randint(0, 3)
+            side_i = random.integers(0, 3)
+            side_f = random.integers(0, 3)
             if side_i == 0:  # Left side
-                pos_i = Point(-rad, np.random.randint(0, SCREEN_HEIGHT))
+                pos_i = Point(-rad, random.integers(0, SCREEN_HEIGHT))
             if side_i == 1:  # Right side
-                pos_i = Point(SCREEN_WIDTH + rad, np.random.randint(0, SCREEN_HEIGHT))
+                pos_i = Point(SCREEN_WIDTH + rad, random.integers(0, SCREEN_HEIGHT))
             if side_i == 2:  # Upper side
-                pos_i = Point(np.random.randint(0, SCREEN_WIDTH), -rad)
+                pos_i = Point(random.integers(0, SCREEN_WIDTH), -rad)
             if side_i == 3:  # Bottom side
-                pos_i = Point(np.random.randint(0, SCREEN_WIDTH), SCREEN_HEIGHT + rad)
+                pos_i = Point(random.integers(0, SCREEN_WIDTH), SCREEN_HEIGHT + rad)
 
             if side_f == 0:  # Left side
-                pos_f = Point(-rad, np.random.randint(0, SCREEN_WIDTH))
+                pos_f = Point(-rad, random.integers(0, SCREEN_WIDTH))
             if side_f == 1:  # Right side
-                pos_f = Point(SCREEN_WIDTH + rad, np.random.randint(0, SCREEN_HEIGHT))
+                pos_f = Point(SCREEN_WIDTH + rad, random.integers(0, SCREEN_HEIGHT))
             if side_f == 2:  # Upper side
-                pos_f = Point(np.random.randint(0, SCREEN_WIDTH), -rad)
+                pos_f = Point(random.integers(0, SCREEN_WIDTH), -rad)
             if side_f == 3:  # Bottom side
-                pos_f = Point(np.random.randint(0, SCREEN_WIDTH), SCREEN_HEIGHT + rad)
+                pos_f = Point(random.integers(0, SCREEN_WIDTH), SCREEN_HEIGHT + rad)
 
-            speed = np.random.rand(1) * MAX_BACKGROUND_SPEED * 7 / 10 + MAX_BACKGROUND_SPEED * 3 / 10
+            speed = random.random() * MAX_BACKGROUND_SPEED * 7 / 10 + MAX_BACKGROUND_SPEED * 3 / 10
             BackgroundParty(self, pos_i, pos_f, rad, speed)
 
     def draw_background(self, surface):
         """
         Draw background on given surface.
+        :return: Bounding rectangles of what was drawn
+        :rtype: list
         """
-        for b in self.background:
-            b.draw(surface)
+        return self.draw_array(self.background, surface)
 
     def tick(self):
         """
@@ -132,24 +248,121 @@ class Map:
         """
         self.clock.tick()
         self.create_hovers()
+        self.resolve_arrivals()
+        if self.party_store is not None:
+            self.party_store.reset_external()
         for p in self.graphic_parties:
             p.reset_ext_forces()
         self.check_collisions()
 
-        self.tick_array(self.graphic_colonies)
+        self.ticks += 1
+        if not self.is_over:
+            self.timer.tick()
+        if self.party_store is not None:
+            self.party_store.move()
         self.tick_array(self.graphic_parties)
         self.tick_array(self.selection)
         self.tick_array(self.hover)
+        if self.recorder is not None:
+            self.recorder.tick()
 
-    def draw(self, surface):
+    def skip(self, amount):
+        """
+        Advance given amount of ticks at once. Only valid when nothing would happen meanwhile, which is the case
+        when every party is scheduled and no arrival is due.
+        :param amount: Amount of ticks
+        :type amount: int
+        """
+        self.clock.skip(amount)
+        self.ticks += amount
+        if not self.is_over:
+            self.timer.advance(amount)
+
+    def can_skip(self):
+        """
+        :return: True if every party on the map arrives through the scheduler, False otherwise
+        """
+        return len(self.arrival_scheduler) == len(self.graphic_parties)
+
+    def ticks_until_arrival(self):
+        """
+        :return: Amount of ticks until the one resolving next arrival, 1 being next tick. None if none is scheduled
         """
-        Draw everything that's not background.
+        next_tick = self.arrival_scheduler.next_tick()
+        if next_tick is None:
+            return None
+        return max(next_tick - self.ticks + 1, 1)
+
+    def resolve_arrivals(self):
+        """
+        Make scheduled parties due by now arrive.
+        """
+        for gr_pty in self.arrival_scheduler.pop_due(self.ticks):
+            gr_pty.arrived()
+
+    def set_interpolation(self, interpolation):
         """
-        self.draw_array(self.graphic_parties, surface)
-        self.draw_array(self.graphic_colonies, surface)
-        self.draw_array(self.selection, surface)
-        self.draw_array(self.hover, surface)
-        self.clock.draw(surface)
+        Set how far between the last two ticks moving objects are drawn.
+        :param interpolation: 0 for previous tick, 1 for last one
+        :type interpolation: float
+        """
+        self.interpolation = interpolation
+
+    def draw(self, surface):
+        """
+        Draw everything that's not background, as seen by its camera. Parties are blitted all at once, with less
+        detail when crowded.
+        :return: Bounding rectangles of what was drawn
+        :rtype: list
+        """
+        if self.camera.sees_everything():
+            parties = self.graphic_parties
+            colonies = self.graphic_colonies
+        else:
+            parties = self.visible_parties()
+            colonies = self.visible_colonies()
+        SPRITE_ATLAS.begin(surface)
+        if self.level_of_detail is None:
+            rects = self.draw_array(parties, surface)
+        else:
+            rects = self.level_of_detail.draw(parties, surface, self.camera)
+        SPRITE_ATLAS.end()
+        rects += self.draw_array(colonies, surface)
+        rects += self.draw_array(self.selection, surface)
+        rects += self.draw_array(self.hover, surface)
+        rects.append(self.clock.draw(surface))
+        return rects
+
+    def visible_colonies(self):
+        """
+        :return: Colonies that may be seen by its camera, found in the colony grid
+        :rtype: list
+        """
+        if self.colony_grid is None:
+            self.build_colony_grid()
+        x_min, y_min, x_max, y_max = self.camera.bounds(CAMERA_CULL_MARGIN)
+        return [self.graphic_colonies[i] for i in self.colony_grid.query_rect(x_min, y_min, x_max, y_max)]
+
+    def visible_parties(self):
+        """
+        Parties move every tick, so they're tested against the view instead of being bucketed. Stored ones are tested
+        all at once.
+        :return: Parties that may be seen by its camera
+        :rtype: list
+        """
+        x_min, y_min, x_max, y_max = self.camera.bounds(CAMERA_CULL_MARGIN)
+        store = self.party_store
+        if store is not None and store.count == len(self.graphic_parties):
+            positions = store.positions[:store.count]
+            inside = ((positions[:, 0] >= x_min) & (positions[:, 0] <= x_max) &
+                      (positions[:, 1] >= y_min) & (positions[:, 1] <= y_max))
+            return [store.parties[i] for i in np.flatnonzero(inside)]
+        result = []
+        for p in self.graphic_parties:
+            position = p.position
+            if x_min <= position.x <= x_max and y_min <= position.y <= y_max:
+                result.append(p)
+        return result
 
     @staticmethod
     def tick_array(array):
@@ -163,28 +376,143 @@ class Map:
     def draw_array(array, surface):
         """
         Draw given array on given surface.
+        :return: Bounding rectangles of what was drawn
+        :rtype: list
         """
-        for item in array:
-            item.draw(surface)
+        rects = []
+        for item in list(array):
+            rect = item.draw(surface)
+            if rect is not None:
+                rects.append(rect)
+        return rects
+
+    def set_collision_mode(self, mode):
+        """
+        Choose how parties are collided with colonies.
+        :param mode: NAIVE_COLLISIONS to test every pair, GRID_COLLISIONS to test only nearby ones,
+            VECTOR_COLLISIONS to test every pair at once with NumPy, EVENT_COLLISIONS to send parties straight
+            and resolve their predicted arrivals without testing anything. Meant to be changed between matches
+        :type mode: str
+        """
+        self.collision_mode = mode
 
     def check_collisions(self):
         """
         Collide parties with colonies. 
         """
+        if self.collision_mode == GRID_COLLISIONS:
+            self.check_collisions_grid()
+        elif self.collision_mode == VECTOR_COLLISIONS:
+            self.check_collisions_vectorized()
+        elif self.collision_mode == EVENT_COLLISIONS:
+            pass
+        else:
+            self.check_collisions_naive()
+
+    def check_collisions_naive(self):
+        """
+        Collide every party with every colony.
+        """
         for c in self.graphic_colonies:
             for p in self.graphic_parties:
                 self.collision(p, c)
 
+    def check_collisions_grid(self):
+        """
+        Collide every party with the colonies sharing a grid cell with it. Colonies are tested in the same order
+        as the naive check, and a party stops colliding once it arrives.
+        """
+        if self.colony_grid is None:
+            self.build_colony_grid()
+        for p in list(self.graphic_parties):
+            for i in self.colony_grid.query(p.position, p.hitbox):
+                c = self.graphic_colonies[i]
+                if self.collision(p, c) and c is p.destination:
+                    break
+
+    def check_collisions_vectorized(self):
+        """
+        Collide every party with every colony in a single distance matrix. Avoidance is added for every colony
+        touched besides the destination, then parties touching their destination arrive. Colonies don't react to
+        collisions, so only parties are told.
+        """
+        if len(self.graphic_parties) == 0 or len(self.graphic_colonies) == 0:
+            return
+        if self.colony_arrays is None:
+            self.build_colony_arrays()
+        colony_positions, colony_hitboxes, colony_indices = self.colony_arrays
+
+        store = self.party_store
+        stored = store is not None and store.count == len(self.graphic_parties)
+        if stored:
+            parties = store.parties[:store.count]
+            party_positions = store.positions[:store.count]
+        else:
+            parties = list(self.graphic_parties)
+            party_positions = np.array([p.position.to_tuple() for p in parties], dtype=float)
+        party_hitboxes = np.array([p.hitbox for p in parties], dtype=float)
+        destinations = np.array([colony_indices.get(p.destination, -1) for p in parties])
+
+        # Distance from every party to every colony
+        deltas = party_positions[:, np.newaxis, :] - colony_positions[np.newaxis, :, :]
+        distances = np.hypot(deltas[:, :, 0], deltas[:, :, 1])
+        touching = distances < party_hitboxes[:, np.newaxis] + colony_hitboxes[np.newaxis, :]
+
+        rows = np.flatnonzero(destinations >= 0)
+        arrived = np.zeros(len(parties), dtype=bool)
+        arrived[rows] = touching[rows, destinations[rows]]
+        touching[rows, destinations[rows]] = False
+
+        # Avoid every other colony touched
+        external = (deltas * touching[:, :, np.newaxis]).sum(axis=1)
+        if stored:
+            store.externals[:store.count] += external
+        else:
+            for i in np.flatnonzero(touching.any(axis=1)):
+                parties[i].external += Point(external[i, 0], external[i, 1])
+
+        for i in np.flatnonzero(arrived):
+            parties[i].arrived()
+
+    def build_colony_arrays(self):
+        """
+        Keep colony positions, hitboxes and indices as arrays for vectorized collisions.
+        """
+        positions = np.array([c.position.to_tuple() for c in self.graphic_colonies], dtype=float)
+        hitboxes = np.array([c.hitbox for c in self.graphic_colonies], dtype=float)
+        indices = {c: i for i, c in enumerate(self.graphic_colonies)}
+        self.colony_arrays = positions, hitboxes, indices
+
+    def build_colony_grid(self):
+        """
+        Bucket colonies in a grid with cells as large as the largest colony hitbox allows.
+        """
+        max_hitbox = max([c.hitbox for c in self.graphic_colonies] + [MIN_COLLISION_CELL_SIZE])
+        self.colony_grid = SpatialHash(max_hitbox * COLLISION_CELL_FACTOR)
+        for i, c in enumerate(self.graphic_colonies):
+            self.colony_grid.insert(i, c.position, c.hitbox)
+
+    def get_winner(self):
+        """
+        A race is the winning race when there are no other races on the map.
+        :return: The winning race, None if there's no winner yet
+        :rtype: AbstractRace
+        """
+        return self.census.winner()
+
     def remove(self, o):
         """
         Remove object from map. Try every array.
         """
         try:
             self.graphic_colonies.remove(o)
+            o.colony.set_census(None)
+            self.invalidate_colonies()
         except ValueError:
             pass
         try:
             self.graphic_parties.remove(o)
+            self.census.remove_party(o.party.race)
         except ValueError:
             pass
         try:
@@ -206,10 +534,14 @@ class Map:
         Collide two graphic objects. 
         :type gobj1: AbstractGraphicObject
         :type gobj2: AbstractGraphicObject
+        :return: True if they collided, False otherwise
         """
-        if gobj1.position.distance(gobj2.position) < (gobj1.hitbox + gobj2.hitbox):
+        reach = gobj1.hitbox + gobj2.hitbox
+        if gobj1.position.distance_squared(gobj2.position) < reach * reach:
             gobj1.collide(gobj2)
             gobj2.collide(gobj1)
+            return True
+        return False
 
     def get_colonies_in(self, position):
         """
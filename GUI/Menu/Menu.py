@@ -57,6 +57,8 @@ class Menu:
         Draw menu centered on the screen.
         :param surface: Surface to draw
         :type surface: Surface
+        :return: Bounding rectangles of what was drawn
+        :rtype: list
         """
         v_size = self.get_vertical_size()
         center = Point(surface.get_size()[0], surface.get_size()[1]).scale(0.5)
@@ -64,8 +66,7 @@ class Menu:
         for item in self.menu_items:
             item.set_position(current_position.copy())
             current_position = current_position + Point(0, item.get_size().y).copy()
-        for item in self.menu_items:
-            item.draw(surface)
+        return [item.draw(surface) for item in self.menu_items]
 
     def get_vertical_size(self):
         """
@@ -59,7 +59,7 @@ class NextMenuHandler(MenuHandler):
         Handle.
         """
         self.driver.set_menu(self.next_menu(self.driver))
-        self.driver.move_alpha_to(self.driver.text_screen, 0, 255)
+        self.driver.move_alpha_to(self.driver.ui_layer, 0, 255)
 
 
 class QuitGameHandler(MenuHandler):
@@ -4,7 +4,8 @@ Menu items.
 
 from GUI.Point import Point
 import abc
-import pygame
+from GUI.FontPool import FONT_POOL
+from GUI.TextCache import TEXT_CACHE
 from GUI.Menu.MenuHandler import NullHandler
 from Settings.GUISettings import *
 from MapManager import NAME_FIELD
@@ -27,10 +28,19 @@ class MenuItem:
         self.text = ""
         self.menu = menu
         self.handler = handler
-        self.font = pygame.font.Font("res/Cabin-Regular.ttf", size)
-        self.font.set_bold(bold)
+        self.font_size = size
+        self.bold = bold
+        self.underline = False
         self.position = Point(0, 0)
 
+    @property
+    def font(self):
+        """
+        :return: Shared font for current style
+        :rtype: Font
+        """
+        return FONT_POOL.get(REGULAR_FONT_FILE, self.font_size, self.bold, self.underline)
+
     def set_position(self, position):
         """
         Set position.
@@ -57,6 +67,8 @@ class MenuItem:
         Draw on given surface.
         :param surface: Surface to draw
         :type surface: Surface
+        :return: Bounding rectangle
+        :rtype: Rect
         """
         pass
 
@@ -138,23 +150,25 @@ class Button(MenuItem):
         """
         Update item. Sets underline off (later turned back on if hovered)
         """
-        self.font.set_underline(False)
+        self.underline = False
 
     def hover(self):
         """
         Hover item. Currently set to underline text.
         """
-        self.font.set_underline(True)
+        self.underline = True
 
     def draw(self, surface):
         """
         Draw on given surface.
         :param surface: Surface to draw
         :type surface: Surface
+        :return: Bounding rectangle
+        :rtype: Rect
         """
-        label = self.font.render(self.text, 1, GUI_TEXT_COLOR)
+        label = TEXT_CACHE.render(self.font, self.text, GUI_TEXT_COLOR)
         font_point = self.get_size().scale(0.5)
-        surface.blit(label, (self.position - font_point).to_tuple())
+        return surface.blit(label, (self.position - font_point).to_tuple())
 
     def animate(self):
         """
@@ -216,10 +230,12 @@ class Label(MenuItem):
         Draw on given surface.
         :param surface: Surface to draw
         :type surface: Surface
+        :return: Bounding rectangle
+        :rtype: Rect
         """
-        label = self.font.render(self.text, 1, GUI_TEXT_COLOR)
+        label = TEXT_CACHE.render(self.font, self.text, GUI_TEXT_COLOR)
         font_point = self.get_size().scale(0.5)
-        surface.blit(label, (self.position - font_point).to_tuple())
+        return surface.blit(label, (self.position - font_point).to_tuple())
 
     def get_size(self):
         """
@@ -278,7 +294,7 @@ class Setting(MenuItem):
         """
         Update item and options.
         """
-        self.font.set_underline(False)
+        self.underline = False
         for option in self.options:
             option.tick()
 
@@ -286,7 +302,7 @@ class Setting(MenuItem):
         """
         Hover item and options. 
         """
-        self.font.set_underline(True)
+        self.underline = True
         for option in self.options:
             option.hover()
 
@@ -295,12 +311,15 @@ class Setting(MenuItem):
         Draw on given surface.
         :param surface: Surface to draw
         :type surface: Surface
+        :return: Bounding rectangle
+        :rtype: Rect
         """
-        label = self.font.render(self.text, 1, GUI_TEXT_COLOR)
+        label = TEXT_CACHE.render(self.font, self.text, GUI_TEXT_COLOR)
         font_point = self.get_size().scale(0.5)
         top_left_corner = self.position - font_point
-        surface.blit(label, top_left_corner.to_tuple())
-        self.options[self.active_option].draw(surface, self.position + Point(self.font.size(self.text)[0] / 2, 0))
+        rect = surface.blit(label, top_left_corner.to_tuple())
+        return rect.union(self.options[self.active_option].draw(
+            surface, self.position + Point(self.font.size(self.text)[0] / 2, 0)))
 
     def get_size(self):
         """
@@ -363,9 +382,17 @@ class SettingOption:
         :type parent: Setting
         """
         self.driver = driver
-        self.font = pygame.font.Font("res/Cabin-Regular.ttf", DEFAULT_FONT_SIZE)
+        self.underline = False
         self.parent = parent
 
+    @property
+    def font(self):
+        """
+        :return: Shared font for current style
+        :rtype: Font
+        """
+        return FONT_POOL.get(REGULAR_FONT_FILE, DEFAULT_FONT_SIZE, underline=self.underline)
+
     @abc.abstractmethod
     def select(self):
         """
@@ -388,6 +415,8 @@ class SettingOption:
         :type surface: Surface
         :param position: Position to draw
         :type position: Point
+        :return: Bounding rectangle
+        :rtype: Rect
         """
         pass
 
@@ -395,13 +424,13 @@ class SettingOption:
         """
         Update. 
         """
-        self.font.set_underline(False)
+        self.underline = False
 
     def hover(self):
         """
         Hover. 
         """
-        self.font.set_underline(True)
+        self.underline = True
 
     def get_text(self):
         """
@@ -460,11 +489,13 @@ class PlayerRaceOption(SettingOption):
         :type surface: Surface
         :param position: Position to draw
         :type position: Point
+        :return: Bounding rectangle
+        :rtype: Rect
         """
-        label = self.font.render(self.get_text(), 1, self.race.get_color())
+        label = TEXT_CACHE.render(self.font, self.get_text(), self.race.get_color())
         font_point = self.get_size().scale(0.5)
         top_left_corner = position - font_point
-        surface.blit(label, top_left_corner.to_tuple())
+        return surface.blit(label, top_left_corner.to_tuple())
 
 
 class MapToLoadOption(SettingOption):
@@ -510,11 +541,13 @@ class MapToLoadOption(SettingOption):
         :type surface: Surface
         :param position: Position to draw
         :type position: Point
+        :return: Bounding rectangle
+        :rtype: Rect
         """
-        label = self.font.render(self.get_text(), 1, THECOLORS['black'])
+        label = TEXT_CACHE.render(self.font, self.get_text(), THECOLORS['black'])
         font_point = self.get_size().scale(0.5)
         top_left_corner = position - font_point
-        surface.blit(label, top_left_corner.to_tuple())
+        return surface.blit(label, top_left_corner.to_tuple())
 
 
 class AmountOption(SettingOption):
@@ -563,11 +596,13 @@ class AmountOption(SettingOption):
         :type surface: Surface
         :param position: Position to draw
         :type position: Point
+        :return: Bounding rectangle
+        :rtype: Rect
         """
-        label = self.font.render(self.get_text(), 1, THECOLORS['black'])
+        label = TEXT_CACHE.render(self.font, self.get_text(), THECOLORS['black'])
         font_point = self.get_size().scale(0.5)
         top_left_corner = position - font_point
-        surface.blit(label, top_left_corner.to_tuple())
+        return surface.blit(label, top_left_corner.to_tuple())
 
 
 class EnemyAmount(AmountOption):
@@ -0,0 +1,166 @@
+"""
+Party store.
+"""
+
+import numpy as np
+from Settings.GUISettings import *
+
+
+class PartyStore:
+    """
+    Keeps positions, previous positions, speeds, external forces, max speeds and destinations of moving parties in
+    contiguous arrays, so all of them can be moved at once. Parties stored here are views into these arrays.
+    """
+    def __init__(self, capacity=PARTY_STORE_INITIAL_CAPACITY):
+        """
+        Constructor.
+        :param capacity: Initial amount of parties that fit without growing
+        :type capacity: int
+        """
+        self.count = 0
+        self.parties = []
+        self.positions = np.zeros((capacity, 2))
+        self.previous_positions = np.zeros((capacity, 2))
+        self.speeds = np.zeros((capacity, 2))
+        self.externals = np.zeros((capacity, 2))
+        self.max_speeds = np.zeros(capacity)
+        self.destinations = np.zeros(capacity, dtype=np.intp)
+
+        self.colonies = {}
+        self.colony_positions = np.zeros((0, 2))
+
+    def clear(self):
+        """
+        Forget every party and colony.
+        """
+        for gr_pty in self.parties:
+            gr_pty.slot = None
+        self.count = 0
+        self.parties = []
+        self.colonies = {}
+        self.colony_positions = np.zeros((0, 2))
+
+    def add_colony(self, gr_col):
+        """
+        Register a colony as a possible destination.
+        :type gr_col: GraphicColony
+        """
+        self.colonies[gr_col] = len(self.colonies)
+        self.colony_positions = np.append(self.colony_positions, [[gr_col.position.x, gr_col.position.y]], axis=0)
+
+    def colony_index(self, gr_col):
+        """
+        :type gr_col: GraphicColony
+        :return: Index of given colony in colony arrays
+        """
+        if gr_col not in self.colonies:
+            self.add_colony(gr_col)
+        return self.colonies[gr_col]
+
+    def allocate(self, gr_pty):
+        """
+        Reserve a slot for a party.
+        :param gr_pty: Party to store
+        :type gr_pty: StoredGraphicParty
+        :return: Slot for given party
+        :rtype: int
+        """
+        if self.count == len(self.max_speeds):
+            self.grow()
+        slot = self.count
+        self.positions[slot] = 0
+        self.previous_positions[slot] = 0
+        self.speeds[slot] = 0
+        self.externals[slot] = 0
+        self.max_speeds[slot] = 0
+        self.destinations[slot] = 0
+        self.parties.append(gr_pty)
+        self.count += 1
+        return slot
+
+    def release(self, gr_pty):
+        """
+        Free slot of given party. Last party is moved into the freed slot to keep arrays contiguous.
+        :type gr_pty: StoredGraphicParty
+        """
+        slot = gr_pty.slot
+        if slot is None:
+            return
+        last = self.count - 1
+        if not slot == last:
+            moved = self.parties[last]
+            self.positions[slot] = self.positions[last]
+            self.previous_positions[slot] = self.previous_positions[last]
+            self.speeds[slot] = self.speeds[last]
+            self.externals[slot] = self.externals[last]
+            self.max_speeds[slot] = self.max_speeds[last]
+            self.destinations[slot] = self.destinations[last]
+            self.parties[slot] = moved
+            moved.slot = slot
+        self.parties.pop()
+        self.count -= 1
+        gr_pty.slot = None
+
+    def grow(self):
+        """
+        Double capacity.
+        """
+        capacity = max(len(self.max_speeds) * 2, 1)
+        self.positions = self.resized(self.positions, capacity)
+        self.previous_positions = self.resized(self.previous_positions, capacity)
+        self.speeds = self.resized(self.speeds, capacity)
+        self.externals = self.resized(self.externals, capacity)
+        self.max_speeds = self.resized(self.max_speeds, capacity)
+        self.destinations = self.resized(self.destinations, capacity)
+
+    @staticmethod
+    def resized(array, capacity):
+        """
+        :return: A copy of given array with given amount of rows
+        """
+        result = np.zeros((capacity,) + array.shape[1:], dtype=array.dtype)
+        result[:len(array)] = array
+        return result
+
+    def reset_external(self):
+        """
+        Reset external forces of every party.
+        """
+        self.externals[:self.count] = 0
+
+    def move(self):
+        """
+        Update position of every party. Same as MovingObject.move, for all of them at once.
+        """
+        n = self.count
+        if n == 0:
+            return
+        positions = self.positions[:n]
+        max_speeds = self.max_speeds[:n, np.newaxis]
+
+        # Set speed towards destination
+        speeds = self.limit_size(self.colony_positions[self.destinations[:n]] - positions, max_speeds)
+        # Add external speed and adjust to avoid getting stuck
+        self.externals[:n] = self.limit_size(self.externals[:n], max_speeds)
+        speeds += self.externals[:n] * PARTY_EXTERNAL_SPEED_ADJUST
+        # Normalize speed
+        sizes = np.hypot(speeds[:, 0], speeds[:, 1])[:, np.newaxis]
+        np.divide(speeds * max_speeds, sizes, out=speeds, where=sizes > 0)
+
+        # Effectively move
+        self.speeds[:n] = speeds
+        self.previous_positions[:n] = positions
+        positions += speeds
+
+    @staticmethod
+    def limit_size(vectors, sizes):
+        """
+        Reduce size of every vector to its given value.
+        :param vectors: Array of vectors, one per row
+        :param sizes: Column of maximum sizes
+        :return: Limited vectors
+        """
+        current = np.hypot(vectors[:, 0], vectors[:, 1])[:, np.newaxis]
+        factor = np.ones_like(current)
+        np.divide(sizes, current, out=factor, where=current > sizes)
+        return vectors * factor
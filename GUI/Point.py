@@ -2,6 +2,7 @@
 Point.
 """
 
+import math
 import numpy as np
 
 
@@ -10,6 +11,8 @@ class Point(object):
     A point in the two dimensional space.
     """
 
+    __slots__ = ("x", "y")
+
     def __init__(self, x, y):
         """
         Constructor.
@@ -39,7 +42,17 @@ class Point(object):
         :param p: Another point
         :type p: Point
         """
-        return pow(pow(self.x - p.x, 2) + pow(self.y - p.y, 2), 1 / 2)
+        return math.hypot(self.x - p.x, self.y - p.y)
+
+    def distance_squared(self, p):
+        """
+        Get squared distance between two points. Cheaper, useful for comparisons.
+        :param p: Another point
+        :type p: Point
+        """
+        dx = self.x - p.x
+        dy = self.y - p.y
+        return dx * dx + dy * dy
 
     def mid_point(self, p):
         """
@@ -51,6 +64,18 @@ class Point(object):
         """
         return Point((p.x + self.x) / 2, (p.y + self.y) / 2)
 
+    def lerp(self, p, t):
+        """
+        Return a new point between two.
+        :param p: Another point
+        :type p: Point
+        :param t: 0 for this point, 1 for the other one
+        :type t: float
+        :return: Interpolated point
+        :rtype: Point
+        """
+        return Point(self.x + (p.x - self.x) * t, self.y + (p.y - self.y) * t)
+
     def move(self, direction, amount):
         """
         Move point in given direction a given amount.
@@ -133,6 +158,41 @@ class Point(object):
         """
         return Point(self.x - other.x, self.y - other.y)
 
+    def iadd(self, other, factor=1):
+        """
+        Add another point in place, optionally scaled.
+        :param other: Another point
+        :type other: Point
+        :param factor: Factor for other point
+        :return: Self, for chaining
+        """
+        self.x += other.x * factor
+        self.y += other.y * factor
+        return self
+
+    def isub(self, other):
+        """
+        Subtract another point in place.
+        :param other: Another point
+        :type other: Point
+        :return: Self, for chaining
+        """
+        self.x -= other.x
+        self.y -= other.y
+        return self
+
+    def scale_into(self, other, factor=1):
+        """
+        Overwrite coordinates with another point's, scaled.
+        :param other: Another point
+        :type other: Point
+        :param factor: Factor for other point
+        :return: Self, for chaining
+        """
+        self.x = other.x * factor
+        self.y = other.y * factor
+        return self
+
     def scale(self, factor):
         """
         Scale point to origin in given factor.
@@ -149,14 +209,27 @@ class Point(object):
         """
         :return: Distance from (0, 0) 
         """
-        return self.distance(Point(0, 0))
+        return math.hypot(self.x, self.y)
+
+    def length(self):
+        """
+        :return: Distance from (0, 0)
+        """
+        return math.hypot(self.x, self.y)
+
+    def length_squared(self):
+        """
+        :return: Squared distance from (0, 0)
+        """
+        return self.x * self.x + self.y * self.y
 
     def limit_size(self, size):
         """
         Reduce size to given value.
         """
-        if self.size() > size:
-            self.scale(size / self.size())
+        length = math.hypot(self.x, self.y)
+        if length > size:
+            self.scale(size / length)
         return self
 
     def to_tuple(self):
@@ -170,5 +243,5 @@ class Point(object):
         Change size to given value.
         :return: Self, for chaining 
         """
-        self.scale(size / self.size())
+        self.scale(size / math.hypot(self.x, self.y))
         return self
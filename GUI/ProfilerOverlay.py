@@ -0,0 +1,67 @@
+"""
+Profiler overlay.
+"""
+
+import pygame
+from GUI.FontPool import FONT_POOL
+from Settings.GUISettings import *
+
+
+class ProfilerOverlay:
+    """
+    Shows a profiler's rolling measures on screen, one line per phase.
+    """
+    def __init__(self, profiler, upper_left_point):
+        """
+        Constructor.
+        :param profiler: Profiler to show
+        :type profiler: Profiler
+        :param upper_left_point: Upper left position of the overlay
+        :type upper_left_point: Point
+        """
+        self.profiler = profiler
+        self.upper_left_point = upper_left_point
+        self.font = None
+
+    def load_font(self):
+        """
+        Load font on first draw.
+        """
+        if self.font is None:
+            self.font = FONT_POOL.get(BOLD_FONT_FILE, PROFILER_FONT_SIZE)
+
+    def rows(self):
+        """
+        :return: Cells to show, a header and then one row per phase
+        :rtype: list
+        """
+        result = [("phase", "avg ms", "p99 ms", "blocks")]
+        for phase, stats in self.profiler.report().items():
+            result.append((phase, "%.3f" % stats["mean_ms"], "%.3f" % stats["p99_ms"],
+                           "%.1f" % stats["allocations"]))
+        return result
+
+    def draw(self, surface):
+        """
+        Draw on given surface, if its profiler is visible. Every column is left aligned at a fixed offset.
+        :type surface: Surface
+        :return: Bounding rectangle, None if hidden
+        :rtype: Rect
+        """
+        if not self.profiler.visible:
+            return None
+        self.load_font()
+        rows = self.rows()
+        line_height = self.font.get_linesize()
+        x, y = self.upper_left_point.to_tuple()
+        width = sum(PROFILER_COLUMN_WIDTHS) + 2 * PROFILER_MARGIN
+        height = len(rows) * line_height + 2 * PROFILER_MARGIN
+        rect = pygame.draw.rect(surface, PROFILER_RECT_COLOR, (x, y, width, height))
+        y += PROFILER_MARGIN
+        for row in rows:
+            column_x = x + PROFILER_MARGIN
+            for cell, column_width in zip(row, PROFILER_COLUMN_WIDTHS):
+                surface.blit(self.font.render(cell, 1, PROFILER_TEXT_COLOR), (column_x, y))
+                column_x += column_width
+            y += line_height
+        return rect
@@ -0,0 +1,120 @@
+"""
+Race census.
+"""
+
+from Race import NULL_RACE
+from Race import NULL_INDEX
+
+
+class RaceCensus:
+    """
+    Live amount of colonies and parties of every race on a map. Kept up to date as colonies change owner and parties
+    are sent or arrive, so asking for a winner or a race's territory doesn't walk the map. Races are counted by
+    index, which every race gets when built.
+    """
+
+    def __init__(self):
+        """
+        Constructor.
+        """
+        self.colonies = {}
+        self.parties = {}
+        self.races = {}
+
+    @staticmethod
+    def increase(counts, race_index, amount):
+        """
+        Change a count, forgetting races that reach zero.
+        :param counts: Counts by race index
+        :type counts: dict
+        :param race_index: Race index
+        :param amount: Amount to add, may be negative
+        :type amount: int
+        """
+        count = counts.get(race_index, 0) + amount
+        if count == 0:
+            del counts[race_index]
+        else:
+            counts[race_index] = count
+
+    def add_colony(self, race):
+        """
+        Count a colony.
+        :param race: Its race
+        :type race: AbstractRace
+        """
+        self.races[race.index] = race
+        self.increase(self.colonies, race.index, 1)
+
+    def remove_colony(self, race):
+        """
+        Stop counting a colony.
+        :param race: Its race
+        :type race: AbstractRace
+        """
+        self.increase(self.colonies, race.index, -1)
+
+    def change_colony(self, old_race, new_race):
+        """
+        Count a colony for its new owner.
+        :param old_race: Former race
+        :type old_race: AbstractRace
+        :param new_race: New race
+        :type new_race: AbstractRace
+        """
+        if old_race is not new_race:
+            self.remove_colony(old_race)
+            self.add_colony(new_race)
+
+    def add_party(self, race):
+        """
+        Count a party.
+        :param race: Its race
+        :type race: AbstractRace
+        """
+        self.races[race.index] = race
+        self.increase(self.parties, race.index, 1)
+
+    def remove_party(self, race):
+        """
+        Stop counting a party.
+        :param race: Its race
+        :type race: AbstractRace
+        """
+        self.increase(self.parties, race.index, -1)
+
+    def colonies_of(self, race):
+        """
+        :param race: A race
+        :type race: AbstractRace
+        :return: Amount of colonies owned by given race
+        :rtype: int
+        """
+        return self.colonies.get(race.index, 0)
+
+    def parties_of(self, race):
+        """
+        :param race: A race
+        :type race: AbstractRace
+        :return: Amount of parties of given race in flight
+        :rtype: int
+        """
+        return self.parties.get(race.index, 0)
+
+    def winner(self):
+        """
+        A race is the winning race when there are no other races on the map. Takes time proportional to the amount
+        of races on the map.
+        :return: The winning race, null race if nobody owns anything, None if there's no winner yet
+        :rtype: AbstractRace
+        """
+        owners = [race_index for race_index in self.colonies if race_index != NULL_INDEX]
+        if len(owners) > 1:
+            return None
+        winner_index = owners[0] if len(owners) == 1 else NULL_INDEX
+        for race_index in self.parties:
+            if race_index != winner_index:
+                return None
+        if winner_index == NULL_INDEX:
+            return NULL_RACE
+        return self.races[winner_index]
@@ -0,0 +1,81 @@
+"""
+Spatial hash.
+"""
+
+import math
+
+
+class SpatialHash:
+    """
+    A uniform grid. Buckets keys by the cells their circle overlaps, so nearby objects are found without testing
+    every one of them.
+    """
+    def __init__(self, cell_size):
+        """
+        Constructor.
+        :param cell_size: Side of every cell
+        :type cell_size: float
+        """
+        self.cell_size = cell_size
+        self.cells = {}
+
+    def clear(self):
+        """
+        Remove everything.
+        """
+        self.cells = {}
+
+    def cells_around(self, position, radius):
+        """
+        :param position: Circle center
+        :type position: Point
+        :param radius: Circle radius
+        :return: Keys of every cell overlapped by the bounding box of given circle
+        :rtype: list
+        """
+        x_min = math.floor((position.x - radius) / self.cell_size)
+        x_max = math.floor((position.x + radius) / self.cell_size)
+        y_min = math.floor((position.y - radius) / self.cell_size)
+        y_max = math.floor((position.y + radius) / self.cell_size)
+        return [(i, j) for i in range(x_min, x_max + 1) for j in range(y_min, y_max + 1)]
+
+    def insert(self, key, position, radius):
+        """
+        Insert a circle.
+        :param key: What to return when queried
+        :param position: Circle center
+        :type position: Point
+        :param radius: Circle radius
+        """
+        for cell in self.cells_around(position, radius):
+            self.cells.setdefault(cell, []).append(key)
+
+    def query(self, position, radius):
+        """
+        Get keys of circles that may overlap given one. Candidates still need an exact test.
+        :param position: Circle center
+        :type position: Point
+        :param radius: Circle radius
+        :return: Sorted candidate keys, without repetitions
+        :rtype: list
+        """
+        result = set()
+        for cell in self.cells_around(position, radius):
+            bucket = self.cells.get(cell)
+            if bucket is not None:
+                result.update(bucket)
+        return sorted(result)
+
+    def query_rect(self, x_min, y_min, x_max, y_max):
+        """
+        Get keys of circles that may overlap given rectangle. Candidates still need an exact test.
+        :return: Sorted candidate keys, without repetitions
+        :rtype: list
+        """
+        result = set()
+        for i in range(math.floor(x_min / self.cell_size), math.floor(x_max / self.cell_size) + 1):
+            for j in range(math.floor(y_min / self.cell_size), math.floor(y_max / self.cell_size) + 1):
+                bucket = self.cells.get((i, j))
+                if bucket is not None:
+                    result.update(bucket)
+        return sorted(result)
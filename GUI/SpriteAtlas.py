@@ -0,0 +1,183 @@
+"""
+Sprite atlas.
+"""
+
+import collections
+import math
+import pygame
+from Settings.GUISettings import *
+from GUI.Compositor import display_format
+
+
+class SpriteAtlas:
+    """
+    Polygons rendered once at a fixed amount of rotation steps, by color, number of sides and radius bucket.
+    Drawing a polygon is then a single blit of the nearest step. Regular polygons repeat every turn divided by their
+    sides, so steps only cover that period. Least recently used polygons are forgotten when the atlas is full, and
+    polygons too big to be worth keeping are drawn directly.
+    """
+
+    def __init__(self, steps=SPRITE_ROTATION_STEPS, radius_step=SPRITE_RADIUS_STEP, max_radius=SPRITE_MAX_RADIUS,
+                 max_pixels=SPRITE_ATLAS_MAX_PIXELS):
+        """
+        Constructor.
+        :param steps: Rotation steps per period
+        :type steps: int
+        :param radius_step: Radii are rounded to multiples of this
+        :param max_radius: Bigger polygons are drawn directly
+        :param max_pixels: Maximum amount of pixels kept
+        :type max_pixels: int
+        """
+        self.steps = steps
+        self.radius_step = radius_step
+        self.max_radius = max_radius
+        self.max_pixels = max_pixels
+        self.sprites = collections.OrderedDict()
+        self.pixels = 0
+        self.batch_surface = None
+        self.batch = []
+
+    def clear(self):
+        """
+        Forget every rendered polygon.
+        """
+        self.sprites.clear()
+        self.pixels = 0
+
+    def warm(self, races, min_radius=SPRITE_WARM_MIN_RADIUS, max_radius=SPRITE_WARM_MAX_RADIUS):
+        """
+        Render every rotation step of given races' polygons ahead of time, for usual party radii.
+        :param races: Races to render
+        :type races: list
+        :param min_radius: Smallest radius to render
+        :param max_radius: Biggest radius to render
+        """
+        for race in races:
+            radius = min_radius
+            while radius <= max_radius:
+                period = 2 * math.pi / race.n_sides
+                for i in range(self.steps):
+                    self.frame(race.get_color(), race.n_sides, radius, i * period / self.steps)
+                radius += self.radius_step
+
+    def frame(self, color, n, radius, theta):
+        """
+        :param color: Polygon color
+        :param n: Number of sides
+        :param radius: Polygon radius
+        :param theta: Rotation angle
+        :return: Polygon at nearest rotation step, centered on the surface. None if it's too big to keep
+        :rtype: Surface
+        """
+        bucket = int(round(radius / self.radius_step))
+        if bucket <= 0 or bucket * self.radius_step > self.max_radius:
+            return None
+        key = (color, n, bucket)
+        frames = self.sprites.get(key)
+        if frames is None:
+            frames = [None] * self.steps
+            self.sprites[key] = frames
+        else:
+            self.sprites.move_to_end(key)
+        period = 2 * math.pi / n
+        index = int(round(theta % period / period * self.steps)) % self.steps
+        sprite = frames[index]
+        if sprite is None:
+            sprite = self.render(color, n, bucket * self.radius_step, index * period / self.steps)
+            frames[index] = sprite
+            self.pixels += sprite.get_width() * sprite.get_height()
+            self.evict()
+        return sprite
+
+    @staticmethod
+    def render(color, n, radius, theta):
+        """
+        :return: Surface with given polygon drawn on its center, transparent elsewhere. Color keyed and run length
+            encoded, which blits sparse line art much faster than per pixel alpha
+        :rtype: Surface
+        """
+        half = int(math.ceil(radius)) + POLYGON_OUTER_WIDTH
+        key = SPRITE_COLORKEY if tuple(color)[:3] != SPRITE_COLORKEY else SPRITE_ALTERNATIVE_COLORKEY
+        sprite = display_format(pygame.Surface((2 * half + 1, 2 * half + 1)))
+        sprite.fill(key)
+        SpriteAtlas.draw_lines(sprite, color, n, radius, half, half, theta)
+        sprite.set_colorkey(key, pygame.RLEACCEL)
+        return sprite
+
+    def evict(self):
+        """
+        Forget least recently used polygons until within maximum amount of pixels.
+        """
+        while self.pixels > self.max_pixels and len(self.sprites) > 1:
+            key, frames = self.sprites.popitem(last=False)
+            for sprite in frames:
+                if sprite is not None:
+                    self.pixels -= sprite.get_width() * sprite.get_height()
+
+    @staticmethod
+    def draw_lines(surface, color, n, radius, x, y, theta):
+        """
+        Draw a polygon with lines from its center to every vertex.
+        :return: Bounding rectangle
+        :rtype: Rect
+        """
+        step = 2 * math.pi / n
+        vertices = [(math.cos(i * step + theta) * radius + x, math.sin(i * step + theta) * radius + y)
+                    for i in range(0, n)]
+        for vertex in vertices:
+            pygame.draw.line(surface, color, (x, y), vertex, POLYGON_INNER_WIDTH)
+        return pygame.draw.lines(surface, color, True, vertices, POLYGON_OUTER_WIDTH)
+
+    def draw(self, surface, color, n, radius, position, theta=0.0):
+        """
+        Draw a polygon with n sides. Queued instead if batching on given surface.
+        :param surface: Surface to draw
+        :param color: Polygon color
+        :param n: Number of sides
+        :param radius: Polygon radius
+        :param position: Position. Isn't modified
+        :param theta: Rotation angle
+        :return: Bounding rectangle
+        :rtype: Rect
+        """
+        x = int(position.x)
+        y = int(position.y)
+        sprite = self.frame(color, n, radius, theta)
+        if sprite is None:
+            if surface is self.batch_surface:
+                self.flush()
+            return self.draw_lines(surface, color, n, radius, x, y, theta)
+        half = sprite.get_width() // 2
+        destination = (x - half, y - half)
+        if surface is self.batch_surface:
+            self.batch.append((sprite, destination))
+        else:
+            surface.blit(sprite, destination)
+        return pygame.Rect(destination, sprite.get_size())
+
+    def begin(self, surface):
+        """
+        Queue polygons drawn on given surface, to blit them all at once on end.
+        :type surface: Surface
+        """
+        self.end()
+        self.batch_surface = surface
+
+    def flush(self):
+        """
+        Blit queued polygons.
+        """
+        if len(self.batch) > 0:
+            self.batch_surface.blits(self.batch, False)
+            self.batch = []
+
+    def end(self):
+        """
+        Blit queued polygons and stop queueing.
+        """
+        self.flush()
+        self.batch_surface = None
+
+
+# Shared by every graphic object
+SPRITE_ATLAS = SpriteAtlas()
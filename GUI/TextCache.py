@@ -0,0 +1,70 @@
+"""
+Text cache.
+"""
+
+import collections
+from Settings.GUISettings import *
+from GUI.Compositor import display_format
+
+
+class TextCache:
+    """
+    Rendered texts, by font, text and color. Least recently used ones are forgotten when full, so texts drawn every
+    frame are only rasterized once.
+    """
+
+    def __init__(self, capacity=TEXT_CACHE_SIZE):
+        """
+        Constructor.
+        :param capacity: Maximum amount of rendered texts kept
+        :type capacity: int
+        """
+        self.capacity = capacity
+        self.surfaces = collections.OrderedDict()
+
+    def __len__(self):
+        return len(self.surfaces)
+
+    def clear(self):
+        """
+        Forget every rendered text.
+        """
+        self.surfaces.clear()
+
+    def render(self, font, text, color):
+        """
+        :param font: Font to render with
+        :type font: Font
+        :param text: Text to render
+        :type text: str
+        :param color: Text color
+        :type color: tuple
+        :return: Antialiased surface with given text, in display pixel format. Shared, don't draw on it
+        :rtype: Surface
+        """
+        key = (font, text, color)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            return surface
+        surface = display_format(font.render(text, 1, color), True)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.capacity:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def warm(self, font, texts, color):
+        """
+        Render given texts ahead of time.
+        :param font: Font to render with
+        :type font: Font
+        :param texts: Texts to render
+        :param color: Text color
+        :type color: tuple
+        """
+        for text in texts:
+            self.render(font, text, color)
+
+
+# Shared by every graphic object
+TEXT_CACHE = TextCache()
@@ -6,7 +6,7 @@ from Settings.GUISettings import *
 from GUI.GraphicColony import GraphicColony
 from GUI.Point import Point
 from Player import RandomPlayer
-from Race import NullRace
+from Race import NULL_RACE
 from MapManager import *
 
 class MapLoader:
@@ -17,13 +17,17 @@ class MapLoader:
     def load_in_map(self, map_data, a_map, human_players):
         print("LOADING MAP")
         a_map.empty()
+        # Maps larger than the screen keep colonies as big as on screen sized ones
+        scale = map_data.get(SCALE_FIELD, 1)
+        a_map.resize(int(a_map.camera.view_width * scale), int(a_map.camera.view_height * scale))
         players = human_players.copy()
         enemies = []
         scale_ratio = a_map.width / 1600
+        radius_ratio = a_map.camera.view_width / 1600
         for i in range(map_data[N_ENEMIES_FIELD]):
             new = RandomPlayer()
             print("ADDING " + str(new.name))
-            new.random_race(players, self.driver.get_races_array())
+            new.random_race(players, self.driver.get_races_array(), a_map.random)
             players.append(new)
             enemies.append(new)
         for i in map_data[PLAYER_COL_FIELD]:
@@ -32,29 +36,31 @@ class MapLoader:
             colony.empty()
             colony.set_size(INITIAL_PLAYER_COLONY_SIZE)
             colony.set_race(players[i[1]].race)
-            GraphicColony(a_map, colony, i[2].copy().scale(scale_ratio), i[3] * scale_ratio)
+            GraphicColony(a_map, colony, i[2].copy().scale(scale_ratio), i[3] * radius_ratio)
         for i in map_data[ENEMY_COL_FIELD]:
             print("ADDING ENEMY COLONY")
             colony = i[0]
             colony.empty()
             colony.set_size(INITIAL_PLAYER_COLONY_SIZE)
             colony.set_race(enemies[i[1]].race)
-            GraphicColony(a_map, colony, i[2].copy().scale(scale_ratio), i[3] * scale_ratio)
+            GraphicColony(a_map, colony, i[2].copy().scale(scale_ratio), i[3] * radius_ratio)
         for i in map_data[EMPTY_COL_FIELD]:
             print("ADDING EMPTY COLONY")
             colony = i[0]
             colony.empty()
             colony.set_size(INITIAL_NULL_COLONY_SIZE)
-            colony.set_race(NullRace())
-            GraphicColony(a_map, colony, i[2].copy().scale(scale_ratio), i[3] * scale_ratio)
+            colony.set_race(NULL_RACE)
+            GraphicColony(a_map, colony, i[2].copy().scale(scale_ratio), i[3] * radius_ratio)
 
         self.players = players
         print("LOADED")
 
     def load_random(self, a_map, n_colonies, min_size, max_size, human_players, n_enemies, possible_races):
         a_map.empty()
+        a_map.resize(a_map.camera.view_width, a_map.camera.view_height)
+        random = a_map.random
         n_players = len(human_players) + n_enemies
-        theta = np.random.rand(1)[0] * 2 * np.pi
+        theta = random.random() * 2 * np.pi
         center = Point(a_map.width / 2, a_map.height / 2)
         for human in human_players:
             position = Point(
@@ -69,8 +75,8 @@ class MapLoader:
                 np.cos(theta) * (a_map.width / 2 - INITIAL_COLONIES_RADIUS),
                 np.sin(theta) * (a_map.height / 2 - INITIAL_COLONIES_RADIUS),
             ) + center
-            enemy = RandomPlayer(other_players)
-            enemy.random_race(other_players, possible_races)
+            enemy = RandomPlayer()
+            enemy.random_race(other_players, possible_races, random)
             other_players.append(enemy)
             GraphicColony(a_map, RegularColony(enemy.race, INITIAL_PLAYER_COLONY_SIZE), position, INITIAL_COLONIES_RADIUS)
 
@@ -78,13 +84,13 @@ class MapLoader:
         self.players = other_players
         for i in range(n_colonies):
             while True:
-                radius = np.random.randint(min_size, max_size)
+                radius = random.integers(min_size, max_size)
                 position = Point(
-                    np.random.randint(radius, a_map.width - radius),
-                    np.random.randint(radius, a_map.height - radius)
+                    random.integers(radius, a_map.width - radius),
+                    random.integers(radius, a_map.height - radius)
                 )
                 if a_map.can_place_colony(radius, position):
-                    GraphicColony(a_map, RegularColony(NullRace(), INITIAL_NULL_COLONY_SIZE), position, radius)
+                    GraphicColony(a_map, RegularColony(NULL_RACE, INITIAL_NULL_COLONY_SIZE), position, radius)
                     break
                 else:
                     print("Can't place random colony. Generating a new one.")
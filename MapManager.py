@@ -11,6 +11,7 @@ PLAYER_COL_FIELD = "PLAYER_COL"
 ENEMY_COL_FIELD = "ENEMY_COL"
 NAME_FIELD = "NAME"
 N_ENEMIES_FIELD = "N_ENEMIES"
+SCALE_FIELD = "SCALE"
 
 INSTRUCTION_FILENAME = "INSTRUCTIONS.txt"
 
@@ -22,7 +23,7 @@ class MapManager:
 
     def __init__(self):
         self.maps = {}
-        self.read_files("\\data\\maps\\")
+        self.read_files(os.path.join("data", "maps"))
 
     def read_files(self, sub_folder):
         """
@@ -30,13 +31,14 @@ class MapManager:
         :param sub_folder: Sub folder where the data is
         :type sub_folder: str
         """
-        for file in os.listdir(os.getcwd() + sub_folder):
+        for file in os.listdir(os.path.join(os.getcwd(), sub_folder)):
             if file == INSTRUCTION_FILENAME:
                 continue
-            f = open(os.getcwd() + sub_folder + file)
+            f = open(os.path.join(os.getcwd(), sub_folder, file))
             map_data = dict()
             map_data[NAME_FIELD] = ""
             map_data[N_ENEMIES_FIELD] = 0
+            map_data[SCALE_FIELD] = 1
             map_data[EMPTY_COL_FIELD] = []
             map_data[ENEMY_COL_FIELD] = []
             map_data[PLAYER_COL_FIELD] = []
@@ -46,6 +48,8 @@ class MapManager:
                 if len(elements) == 2:
                     if elements[0] == NAME_FIELD:
                         map_data[NAME_FIELD] = elements[1]
+                    if elements[0] == SCALE_FIELD:
+                        map_data[SCALE_FIELD] = float(elements[1])
                     if elements[0] == N_ENEMIES_FIELD:
                         map_data[N_ENEMIES_FIELD] = int(elements[1])
                     else:
@@ -69,6 +73,18 @@ class MapManager:
         """
         return self.maps
 
+    def get_map(self, name):
+        """
+        Get a map by its name. Quotes around the name are optional.
+        :param name: Map name
+        :type name: str
+        :return: Map data
+        :rtype: dict
+        """
+        if name in self.maps:
+            return self.maps[name]
+        return self.maps['"' + name + '"']
+
     def get_maps_array(self):
         """
         :return: Stored maps as Array
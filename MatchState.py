@@ -0,0 +1,351 @@
+"""
+Match state. Captures what changes during a match so it can be restored later.
+"""
+
+import struct
+import Colony
+import Player
+from GUI.GraphicColony import GraphicColony
+from GUI.GraphicParty import GraphicParty
+from GUI.GraphicParty import StoredGraphicParty
+from GUI.GraphicParty import ScheduledGraphicParty
+from GUI.Point import Point
+from Party import Party
+from Race import NULL_RACE
+from Serialization import *
+from Settings.GUISettings import COLLISION_MODE
+
+MATCH_STATE_MAGIC = b"BACTOSAV"
+MATCH_STATE_VERSION = 2
+
+MATCH_HEADER_FORMAT = "<8sHHHHq"
+RANDOM_STATE_FORMAT = "<BI"
+PLAYER_STATE_FORMAT = "<HHHd"
+LAYOUT_FORMAT = "<Hddd"
+MAP_STATE_FORMAT = "<qIIBII"
+COLONY_STATE_FORMAT = "<HII"
+PARTY_STATE_FORMAT = "<BHHIddd7dIq"
+
+MOVING_PARTY = 0
+SCHEDULED_PARTY = 1
+
+
+class MapState:
+    """
+    State of a map in a given tick: ticks, clock, race, size and growth time of every colony, and every party in
+    flight. Colony positions aren't part of it, they never change during a match.
+    """
+
+    def __init__(self, ticks=0, clock_ticks=0, clock_time=0, is_over=False):
+        """
+        Constructor.
+        :param ticks: Ticks since match start
+        :param clock_ticks: Ticks of the clock's current second
+        :param clock_time: Seconds shown by the clock
+        :param is_over: Whether the match was over
+        """
+        self.ticks = ticks
+        self.clock_ticks = clock_ticks
+        self.clock_time = clock_time
+        self.is_over = is_over
+        # (race id, size, time)
+        self.colonies = []
+        # (kind, race id, destination index, size, strength factor, speed factor, radius, x, y, previous x,
+        #  previous y, speed x, speed y, theta, parameter, start tick)
+        self.parties = []
+
+    @staticmethod
+    def capture(a_map, start=0):
+        """
+        :param a_map: Map to capture
+        :type a_map: Map
+        :param start: Map tick in which the match began
+        :return: Current state of given map
+        :rtype: MapState
+        """
+        state = MapState(a_map.ticks - start, a_map.clock.ticks, a_map.clock.time, a_map.is_over)
+        indices = {}
+        for i, gr_col in enumerate(a_map.graphic_colonies):
+            colony = gr_col.colony
+            state.colonies.append((colony.race.id, int(colony.size), colony.time))
+            indices[gr_col] = i
+        for gr_pty in a_map.graphic_parties:
+            party = gr_pty.party
+            common = (party.race.id, indices[gr_pty.destination], int(party.size), party.str_factor, party.spd_factor,
+                      gr_pty.radius)
+            if isinstance(gr_pty, ScheduledGraphicParty):
+                state.parties.append((SCHEDULED_PARTY,) + common + (
+                    gr_pty.start.x, gr_pty.start.y, 0, 0, gr_pty.speed.x, gr_pty.speed.y, 0, 0,
+                    gr_pty.start_tick - start))
+            else:
+                position = gr_pty.position
+                previous = gr_pty.previous_position
+                speed = gr_pty.speed
+                state.parties.append((MOVING_PARTY,) + common + (
+                    position.x, position.y, previous.x, previous.y, speed.x, speed.y, gr_pty.theta,
+                    gr_pty.parameter, 0))
+        return state
+
+    def restore(self, a_map, races, start=0):
+        """
+        Bring given map to this state.
+        :param a_map: Map with the same colonies and no parties
+        :type a_map: Map
+        :param races: Available races by id
+        :type races: dict
+        :param start: Map tick in which the match began
+        """
+        a_map.ticks = self.ticks + start
+        a_map.clock.ticks = self.clock_ticks
+        a_map.clock.time = self.clock_time
+        a_map.is_over = self.is_over
+        for gr_col, (race_id, size, time) in zip(a_map.graphic_colonies, self.colonies):
+            gr_col.colony.restore(find_race(race_id, races), size, time)
+        for (kind, race_id, destination, size, str_factor, spd_factor, radius, x, y, previous_x, previous_y,
+             speed_x, speed_y, theta, parameter, start_tick) in self.parties:
+            party = Party(find_race(race_id, races), size, str_factor, spd_factor)
+            gr_col = a_map.graphic_colonies[destination]
+            if kind == SCHEDULED_PARTY:
+                ScheduledGraphicParty(a_map, party, Point(x, y), radius, gr_col, start_tick + start)
+                continue
+            if a_map.party_store is None:
+                gr_pty = GraphicParty(a_map, party, Point(x, y), radius, gr_col)
+            else:
+                gr_pty = StoredGraphicParty(a_map, party, Point(x, y), radius, gr_col)
+            gr_pty.previous_position = Point(previous_x, previous_y)
+            gr_pty.speed = Point(speed_x, speed_y)
+            gr_pty.theta = theta
+            gr_pty.parameter = parameter
+
+    def to_bytes(self, table):
+        """
+        :param table: Table where race ids are written
+        :type table: StringTable
+        :return: This state in binary format
+        :rtype: bytes
+        """
+        data = bytearray(struct.pack(MAP_STATE_FORMAT, self.ticks, self.clock_ticks, self.clock_time,
+                                     self.is_over, len(self.colonies), len(self.parties)))
+        for race_id, size, time in self.colonies:
+            data += struct.pack(COLONY_STATE_FORMAT, table.index(race_id), size, time)
+        for party in self.parties:
+            data += struct.pack(PARTY_STATE_FORMAT, party[0], table.index(party[1]), *party[2:])
+        return bytes(data)
+
+    @staticmethod
+    def read(reader, table):
+        """
+        :param reader: Reader positioned at a state
+        :type reader: Reader
+        :param table: Table where race ids were written
+        :type table: StringTable
+        :return: Read state
+        :rtype: MapState
+        """
+        ticks, clock_ticks, clock_time, is_over, n_colonies, n_parties = reader.unpack(MAP_STATE_FORMAT)
+        state = MapState(ticks, clock_ticks, clock_time, bool(is_over))
+        for i in range(n_colonies):
+            race, size, time = reader.unpack(COLONY_STATE_FORMAT)
+            state.colonies.append((table.get(race), size, time))
+        for i in range(n_parties):
+            party = reader.unpack(PARTY_STATE_FORMAT)
+            state.parties.append((party[0], table.get(party[1])) + party[2:])
+        return state
+
+    @staticmethod
+    def from_bytes(data, table):
+        """
+        :param data: A state in binary format
+        :param table: Table where race ids were written
+        :type table: StringTable
+        :return: Read state
+        :rtype: MapState
+        """
+        return MapState.read(Reader(data), table)
+
+
+class MatchState:
+    """
+    Whole state of a match: map size, seed, collision mode and random streams, where every colony is, every
+    player and the state of the map. Enough to continue a match exactly where it was left.
+    """
+
+    def __init__(self, width, height, seed=None, collision_mode=COLLISION_MODE, timer_ticks=0):
+        """
+        Constructor.
+        :param width: Map width
+        :param height: Map height
+        :param seed: Seed of the match
+        :type seed: int
+        :param collision_mode: Collision mode of the match
+        :type collision_mode: str
+        :param timer_ticks: Ticks of the map's growth timer
+        """
+        self.width = width
+        self.height = height
+        self.seed = seed
+        self.collision_mode = collision_mode
+        self.timer_ticks = timer_ticks
+        # Bit generator states, gameplay first
+        self.random_states = []
+        # (type name, player name, race id, time)
+        self.players = []
+        # (type name, x, y, radius)
+        self.colonies = []
+        self.map_state = MapState()
+
+    @staticmethod
+    def capture(a_map, players):
+        """
+        :param a_map: Map to capture
+        :type a_map: Map
+        :param players: Players of the match
+        :type players: list
+        :return: Current state of given match
+        :rtype: MatchState
+        """
+        state = MatchState(a_map.width, a_map.height, a_map.seed_value, a_map.collision_mode, a_map.timer.ticks)
+        state.random_states = [a_map.random.bit_generator.state, a_map.background_random.bit_generator.state]
+        for p in players:
+            state.players.append((type(p).__name__, p.name, p.race.id, p.time))
+        for gr_col in a_map.graphic_colonies:
+            state.colonies.append((type(gr_col.colony).__name__, gr_col.position.x, gr_col.position.y,
+                                   gr_col.radius))
+        state.map_state = MapState.capture(a_map)
+        return state
+
+    def restore_map(self, a_map, races):
+        """
+        Bring given map to this state.
+        :param a_map: Map to restore. Emptied first
+        :type a_map: Map
+        :param races: Available races by id
+        :type races: dict
+        """
+        a_map.empty()
+        a_map.resize(self.width, self.height)
+        a_map.seed(self.seed)
+        a_map.random.bit_generator.state = self.random_states[0]
+        a_map.background_random.bit_generator.state = self.random_states[1]
+        a_map.set_collision_mode(self.collision_mode)
+        a_map.timer.ticks = self.timer_ticks
+        for kind, x, y, radius in self.colonies:
+            GraphicColony(a_map, colony_type(kind)(), Point(x, y), radius)
+        self.map_state.restore(a_map, races)
+
+    def restore_players(self, races, humans=None):
+        """
+        :param races: Available races by id
+        :type races: dict
+        :param humans: Players to reuse for human players, in order. Humans are replaced by RandomPlayers if None
+        :type humans: list
+        :return: Players as they were
+        :rtype: list
+        """
+        humans = None if humans is None else list(humans)
+        result = []
+        for kind, name, race_id, time in self.players:
+            if kind == Player.Player.__name__ and humans is None:
+                player = Player.RandomPlayer(name)
+            elif kind == Player.Player.__name__ and len(humans) > 0:
+                player = humans.pop(0)
+                player.set_name(name)
+            else:
+                player = player_type(kind)(name=name)
+            player.set_race(find_race(race_id, races))
+            player.time = time
+            result.append(player)
+        return result
+
+    def to_bytes(self):
+        """
+        :return: This state in versioned binary format
+        :rtype: bytes
+        """
+        table = StringTable([self.collision_mode])
+        body = bytearray()
+        for random_state in self.random_states:
+            body += write_string(random_state["bit_generator"])
+            body += write_bytes(int_to_bytes(random_state["state"]["state"]))
+            body += write_bytes(int_to_bytes(random_state["state"]["inc"]))
+            body += struct.pack(RANDOM_STATE_FORMAT, random_state["has_uint32"], random_state["uinteger"])
+        body += struct.pack("<I", len(self.players))
+        for kind, name, race_id, time in self.players:
+            body += struct.pack(PLAYER_STATE_FORMAT, table.index(kind), table.index(name), table.index(race_id), time)
+        body += struct.pack("<I", len(self.colonies))
+        for kind, x, y, radius in self.colonies:
+            body += struct.pack(LAYOUT_FORMAT, table.index(kind), x, y, radius)
+        body += self.map_state.to_bytes(table)
+
+        data = bytearray(struct.pack(MATCH_HEADER_FORMAT, MATCH_STATE_MAGIC, MATCH_STATE_VERSION, self.width,
+                                     self.height, table.index(self.collision_mode), self.timer_ticks))
+        data += write_bytes(int_to_bytes(self.seed))
+        data += table.to_bytes()
+        data += body
+        return bytes(data)
+
+    @staticmethod
+    def from_bytes(data):
+        """
+        :param data: A state in binary format
+        :type data: bytes
+        :return: Read state
+        :rtype: MatchState
+        """
+        reader = Reader(data)
+        magic, version, width, height, collision_mode, timer_ticks = reader.unpack(MATCH_HEADER_FORMAT)
+        if not magic == MATCH_STATE_MAGIC:
+            raise ValueError("Not a saved match")
+        if not version == MATCH_STATE_VERSION:
+            raise ValueError("Unsupported saved match version: " + str(version))
+        seed = int_from_bytes(reader.read_bytes())
+        table = StringTable.read(reader)
+        state = MatchState(width, height, seed, table.get(collision_mode), timer_ticks)
+        for i in range(2):
+            bit_generator = reader.read_string()
+            inner = {"state": int_from_bytes(reader.read_bytes()), "inc": int_from_bytes(reader.read_bytes())}
+            has_uint32, uinteger = reader.unpack(RANDOM_STATE_FORMAT)
+            state.random_states.append({"bit_generator": bit_generator, "state": inner, "has_uint32": has_uint32,
+                                        "uinteger": uinteger})
+        for i in range(reader.unpack("<I")[0]):
+            kind, name, race_id, time = reader.unpack(PLAYER_STATE_FORMAT)
+            state.players.append((table.get(kind), table.get(name), table.get(race_id), time))
+        for i in range(reader.unpack("<I")[0]):
+            kind, x, y, radius = reader.unpack(LAYOUT_FORMAT)
+            state.colonies.append((colony_type(table.get(kind)).__name__, x, y, radius))
+        state.map_state = MapState.read(reader, table)
+        return state
+
+
+def colony_type(kind):
+    """
+    :param kind: Name of a colony class
+    :return: Colony class with given name
+    """
+    result = getattr(Colony, kind, None)
+    if not (isinstance(result, type) and issubclass(result, Colony.AbstractColony)):
+        raise ValueError("Unknown colony type: " + kind)
+    return result
+
+
+def player_type(kind):
+    """
+    :param kind: Name of a player class that can be built from a name
+    :return: Player class with given name
+    """
+    result = getattr(Player, kind, None)
+    if result not in (Player.Player, Player.RandomPlayer):
+        raise ValueError("Unknown player type: " + kind)
+    return result
+
+
+def find_race(race_id, races):
+    """
+    :param race_id: Race id
+    :param races: Available races by id
+    :type races: dict
+    :return: Race with given id, NullRace if it isn't available
+    """
+    if race_id in races:
+        return races[race_id]
+    return NULL_RACE
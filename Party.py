@@ -58,5 +58,20 @@ class Party:
         :param parameter: Animation parameter
         :param direction: Current moving direction
         :type direction: Point
+        :return: Bounding rectangle
+        :rtype: Rect
         """
-        self.race.draw_party(surface, radius, position, theta, parameter, direction)
+        return self.race.draw_party(surface, radius, position, theta, parameter, direction)
+
+    def draw_static(self, surface, radius, position):
+        """
+        Make race to draw a party without animation.
+        :param surface: Surface to draw
+        :type surface: Surface
+        :param radius: Party radius
+        :param position: Party position
+        :type position: Point
+        :return: Bounding rectangle
+        :rtype: Rect
+        """
+        return self.race.draw_static_party(surface, radius, position)
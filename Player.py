@@ -2,6 +2,8 @@
 Players.
 """
 
+import bisect
+import math
 from Settings import PlayerSettings
 from Race import *
 
@@ -10,7 +12,7 @@ class Player:
     """
     A human player.
     """
-    def __init__(self, name="Player 1", race=NullRace()):
+    def __init__(self, name="Player 1", race=NULL_RACE):
         """
         
         :param name: 
@@ -39,6 +41,19 @@ class Player:
         """
         pass
 
+    def ticks_until_action(self):
+        """
+        :return: Amount of ticks until the one in which this player acts, 1 being next tick. None if unknown
+        """
+        return None
+
+    def skip(self, amount):
+        """
+        Let given amount of ticks pass without acting.
+        :type amount: int
+        """
+        pass
+
     def get_race(self):
         """
         :return: Race 
@@ -51,7 +66,7 @@ class NullPlayer(Player):
     An NPC.
     """
     def __init__(self):
-        super(NullPlayer, self).__init__("NullPlayer", NullRace())
+        super(NullPlayer, self).__init__("NullPlayer", NULL_RACE)
 
 
 class RandomPlayer(Player):
@@ -59,12 +74,14 @@ class RandomPlayer(Player):
     An enemy. Sets and plays randomly
     """
     def __init__(self, name="Enemy"):
-        super(RandomPlayer, self).__init__(name, NullRace())
+        super(RandomPlayer, self).__init__(name, NULL_RACE)
 
-    def random_race(self, player_array, possible_races):
+    def random_race(self, player_array, possible_races, random):
         """
         Set race randomly, different from existent ones.
         :param player_array: Array with existent players.
+        :param random: Gameplay random stream
+        :type random: Generator
         """
         possible_races = possible_races.copy()
         for player in player_array:
@@ -72,7 +89,7 @@ class RandomPlayer(Player):
                 if player.race.same_type(r):
                     possible_races.remove(r)
         if not len(possible_races) == 0:
-            self.race = possible_races[np.random.randint(0, len(possible_races))]
+            self.race = possible_races[random.integers(0, len(possible_races))]
             print("New enemy: " + str(self.race))
         else:
             raise IndexError
@@ -83,22 +100,90 @@ class RandomPlayer(Player):
         :param a_map: Current map
         :type a_map: Map
         """
-        if self.race.same_type(NullRace()):
+        if self.race.same_type(NULL_RACE):
             return
         self.time += 1
         if (self.time // PlayerSettings.ATTACK_EVERY) > 0:
             for c in a_map.graphic_colonies:
                 if c.colony.race.same_type(self.race):
-                    random = np.random.rand(1)
-                    if random > PlayerSettings.ATTACK_PROBABILITY:
+                    if a_map.random.random() > PlayerSettings.ATTACK_PROBABILITY:
                         enemy_colonies = self.get_enemy_colonies(a_map)
-                        target = enemy_colonies[np.random.randint(0, len(enemy_colonies))]
+                        if len(enemy_colonies) == 0:
+                            break
+                        target = enemy_colonies[a_map.random.integers(0, len(enemy_colonies))]
                         c.send_party(target)
             self.time = 0
 
+    def ticks_until_action(self):
+        """
+        :return: Amount of ticks until the one in which this player attacks, 1 being next tick. None if it never does
+        """
+        if self.race.same_type(NULL_RACE):
+            return None
+        return max(int(math.ceil(PlayerSettings.ATTACK_EVERY - self.time)), 1)
+
+    def skip(self, amount):
+        """
+        Let given amount of ticks pass. Must be less than ticks until next attack.
+        :type amount: int
+        """
+        if not self.race.same_type(NULL_RACE):
+            self.time += amount
+
     def get_enemy_colonies(self, a_map):
         result = []
         for c in a_map.graphic_colonies:
             if not c.colony.race.same_type(self.race):
                 result.append(c)
         return result
+
+
+class RecordedPlayer(Player):
+    """
+    Plays back recorded commands. Sends parties exactly when they were sent, whoever sent them.
+    """
+    def __init__(self, commands, name="Replay"):
+        """
+        Constructor.
+        :param commands: Parties sent, as (tick, source colony index, destination colony index), sorted by tick
+        :type commands: list
+        """
+        super(RecordedPlayer, self).__init__(name, NULL_RACE)
+        self.commands = commands
+        self.next_command = 0
+
+    def seek(self, tick):
+        """
+        Continue from given tick, as if every command before it had been sent.
+        :param tick: Ticks since match start
+        :type tick: int
+        """
+        self.time = tick
+        self.next_command = bisect.bisect_left(self.commands, (tick,))
+
+    def tick(self, a_map):
+        """
+        Send every party recorded for this tick.
+        :param a_map: Current map
+        :type a_map: Map
+        """
+        while self.next_command < len(self.commands) and self.commands[self.next_command][0] <= self.time:
+            tick, source, destination = self.commands[self.next_command]
+            a_map.graphic_colonies[source].send_party(a_map.graphic_colonies[destination])
+            self.next_command += 1
+        self.time += 1
+
+    def ticks_until_action(self):
+        """
+        :return: Amount of ticks until next recorded command, 1 being next tick. None if there are no more
+        """
+        if self.next_command == len(self.commands):
+            return None
+        return max(self.commands[self.next_command][0] - self.time + 1, 1)
+
+    def skip(self, amount):
+        """
+        Let given amount of ticks pass. Must be less than ticks until next command.
+        :type amount: int
+        """
+        self.time += amount
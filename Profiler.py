@@ -0,0 +1,158 @@
+"""
+Profiler. Measures how long every phase of a tick takes, and how many memory blocks it leaves allocated.
+"""
+
+import collections
+import json
+import sys
+import time
+import numpy as np
+from Settings.GeneralSettings import *
+
+INPUT_PHASE = "input"
+BACKGROUND_TICK_PHASE = "background tick"
+PLAYERS_PHASE = "players"
+MAP_TICK_PHASE = "map tick"
+MENU_TICK_PHASE = "menu tick"
+WINNER_PHASE = "winner check"
+BACKGROUND_DRAW_PHASE = "background draw"
+MAP_DRAW_PHASE = "map draw"
+MENU_DRAW_PHASE = "menu draw"
+PRESENT_PHASE = "present"
+PHASES = [INPUT_PHASE, BACKGROUND_TICK_PHASE, PLAYERS_PHASE, MAP_TICK_PHASE, MENU_TICK_PHASE, WINNER_PHASE,
+          BACKGROUND_DRAW_PHASE, MAP_DRAW_PHASE, MENU_DRAW_PHASE, PRESENT_PHASE]
+
+
+class Profiler:
+    """
+    Keeps the last few durations of every phase, to show rolling averages and percentiles. Allocations are counted
+    as memory blocks still allocated when a phase ends, which is cheap enough to measure on every tick.
+    """
+
+    def __init__(self, window=PROFILER_WINDOW, enabled=PROFILER_ENABLED):
+        """
+        Constructor.
+        :param window: Amount of last measures kept per phase
+        :type window: int
+        :param enabled: Whether to measure at all
+        :type enabled: bool
+        """
+        self.window = window
+        self.enabled = enabled
+        self.visible = False
+        self.durations = {}
+        self.allocations = {}
+        self.calls = {}
+
+    def measure(self, phase):
+        """
+        Measure a phase. Use as a context manager around it.
+        :param phase: Phase name
+        :type phase: str
+        :return: Context manager measuring given phase
+        """
+        if not self.enabled:
+            return NULL_MEASURE
+        return Measure(self, phase)
+
+    def record(self, phase, duration, allocations):
+        """
+        Record a measure.
+        :param phase: Phase name
+        :param duration: Seconds taken
+        :param allocations: Memory blocks left allocated
+        """
+        if phase not in self.durations:
+            self.durations[phase] = collections.deque(maxlen=self.window)
+            self.allocations[phase] = collections.deque(maxlen=self.window)
+            self.calls[phase] = 0
+        self.durations[phase].append(duration)
+        self.allocations[phase].append(allocations)
+        self.calls[phase] += 1
+
+    def toggle(self):
+        """
+        Show or hide measures.
+        """
+        self.visible = not self.visible
+
+    def phases(self):
+        """
+        :return: Measured phases, known ones first
+        :rtype: list
+        """
+        return [p for p in PHASES if p in self.durations] + [p for p in self.durations if p not in PHASES]
+
+    def statistics(self, phase):
+        """
+        :param phase: Phase name
+        :return: Calls, mean, p99 and max milliseconds, and mean memory blocks left allocated over last measures
+        :rtype: dict
+        """
+        durations = np.array(self.durations[phase]) * 1000
+        return {
+            "calls": self.calls[phase],
+            "mean_ms": float(durations.mean()),
+            "p99_ms": float(np.percentile(durations, 99)),
+            "max_ms": float(durations.max()),
+            "allocations": float(np.mean(self.allocations[phase])),
+        }
+
+    def report(self):
+        """
+        :return: Statistics of every measured phase
+        :rtype: dict
+        """
+        return {phase: self.statistics(phase) for phase in self.phases()}
+
+    def dump(self, path=PROFILE_FILE):
+        """
+        Write statistics of every measured phase as JSON.
+        :param path: File path
+        """
+        with open(path, "w") as f:
+            json.dump({"window": self.window, "phases": self.report()}, f, indent=2)
+
+
+class Measure:
+    """
+    Measures one run of a phase.
+    """
+    __slots__ = ("profiler", "phase", "start", "blocks")
+
+    def __init__(self, profiler, phase):
+        """
+        Constructor.
+        :param profiler: Profiler to report to
+        :type profiler: Profiler
+        :param phase: Phase name
+        """
+        self.profiler = profiler
+        self.phase = phase
+        self.start = 0
+        self.blocks = 0
+
+    def __enter__(self):
+        self.blocks = sys.getallocatedblocks()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *args):
+        duration = time.perf_counter() - self.start
+        self.profiler.record(self.phase, duration, sys.getallocatedblocks() - self.blocks)
+        return False
+
+
+class NullMeasure:
+    """
+    Measures nothing.
+    """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
+NULL_MEASURE = NullMeasure()
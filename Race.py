@@ -2,11 +2,16 @@
 Races. Represent unit category, with their stats, color, name and animation function.
 """
 
+import itertools
 from GUI.Functions import *
 from Settings.RaceSettings import *
 from Settings.GUISettings import *
 from GUI.colordict import THECOLORS
 
+NULL_INDEX = 0
+# Every race built gets the next one. Null race has its own
+RACE_INDICES = itertools.count(NULL_INDEX + 1)
+
 
 class Race:
     """
@@ -23,13 +28,15 @@ class Race:
         self.animation_id = animation_id
         self.n_sides = int(n_sides)
         self.color = color
+        self.index = next(RACE_INDICES)
 
     def same_type(self, other):
         """
         :type other: Race
-        :return: True if both race are same type, False otherwise 
+        :return: True if both race are same type, False otherwise. Races are interned by the registry, so there's
+            one instance per id and they're compared by identity
         """
-        return self.id == other.id
+        return self is other
 
     def set_speed(self, speed):
         """
@@ -81,11 +88,26 @@ class Race:
         :param parameter: Animation parameter
         :param direction: Current moving direction
         :type direction: Point
+        :return: Bounding rectangle
+        :rtype: Rect
         """
-        DRAW_FUNCTIONS[self.animation_id](
+        return DRAW_FUNCTIONS[self.animation_id](
             surface, radius, position, theta, parameter, direction, self.get_color(), self.n_sides
         )
 
+    def draw_static_party(self, surface, radius, position):
+        """
+        Draw a party as a single unrotated polygon, without animation.
+        :param surface: Surface to draw
+        :type surface: Surface
+        :param radius: Party radius
+        :param position: Party position
+        :type position: Point
+        :return: Bounding rectangle
+        :rtype: Rect
+        """
+        return draw_ngon(surface, self.get_color(), self.n_sides, radius, position)
+
     def __str__(self):
         return self.name
 
@@ -106,3 +128,8 @@ class NullRace(Race):
             NULL_COLOR,
             NULL_SIDES
         )
+        self.index = NULL_INDEX
+
+
+# Canonical null race. Use it instead of building new ones
+NULL_RACE = NullRace()
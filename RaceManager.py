@@ -3,7 +3,7 @@ Race reader.
 """
 
 import os
-from Race import Race
+from Race import *
 from Settings.GeneralSettings import *
 
 RACE_ID_FIELD = "ID"
@@ -20,6 +20,41 @@ NULL_RACE_ID = "null_race"
 
 INSTRUCTION_FILENAME = "INSTRUCTIONS.txt"
 
+
+class RaceRegistry:
+    """
+    Owns one canonical instance per race, the null race included. Races read more than once are interned, so races
+    with the same id are the same object and can be compared by identity.
+    """
+
+    def __init__(self):
+        """
+        Constructor. Null race is always registered.
+        """
+        self.by_id = {NULL_RACE.id: NULL_RACE}
+
+    def __len__(self):
+        return len(self.by_id)
+
+    def intern(self, race):
+        """
+        Register a race, unless one with the same id already is.
+        :param race: Race to register
+        :type race: Race
+        :return: Canonical instance for given race's id
+        :rtype: Race
+        """
+        known = self.by_id.get(race.id)
+        if known is not None:
+            return known
+        self.by_id[race.id] = race
+        return race
+
+
+# Every race of this process, shared by all race managers
+RACE_REGISTRY = RaceRegistry()
+
+
 class RaceManager:
     """
     Reads and stores Races.
@@ -27,7 +62,7 @@ class RaceManager:
 
     def __init__(self):
         self.races = {}
-        self.read_files("\\data\\races\\")
+        self.read_files(os.path.join("data", "races"))
 
     def read_files(self, sub_folder):
         """
@@ -35,10 +70,10 @@ class RaceManager:
         :param sub_folder: Sub folder where the data is
         :type sub_folder: str
         """
-        for file in os.listdir(os.getcwd() + sub_folder):
+        for file in os.listdir(os.path.join(os.getcwd(), sub_folder)):
             if file == INSTRUCTION_FILENAME:
                 continue
-            f = open(os.getcwd() + sub_folder + file)
+            f = open(os.path.join(os.getcwd(), sub_folder, file))
 
             race_data = {}
             for line in f:
@@ -47,16 +82,16 @@ class RaceManager:
                 if len(elements) == 2:
                     race_data[elements[0]] = elements[1]
             try:
-                self.races[race_data[RACE_ID_FIELD]] = Race(race_data[RACE_ID_FIELD],
-                                                            race_data[RACE_NAME_FIELD],
-                                                            race_data[RACE_STRENGTH_FIELD],
-                                                            race_data[RACE_DEFENSE_FIELD],
-                                                            int(race_data[RACE_SPEED_FIELD]) * GAME_SPEED_FACTOR,
-                                                            int(race_data[
-                                                                    RACE_REPRODUCTION_TIME_FIELD]) / GAME_SPEED_FACTOR,
-                                                            race_data[RACE_ANIMATION_ID_FIELD],
-                                                            race_data[RACE_COLOR_FIELD],
-                                                            race_data[RACE_N_SIDES_FIELD])
+                race = Race(race_data[RACE_ID_FIELD],
+                            race_data[RACE_NAME_FIELD],
+                            race_data[RACE_STRENGTH_FIELD],
+                            race_data[RACE_DEFENSE_FIELD],
+                            int(race_data[RACE_SPEED_FIELD]) * GAME_SPEED_FACTOR,
+                            int(race_data[RACE_REPRODUCTION_TIME_FIELD]) / GAME_SPEED_FACTOR,
+                            race_data[RACE_ANIMATION_ID_FIELD],
+                            race_data[RACE_COLOR_FIELD],
+                            race_data[RACE_N_SIDES_FIELD])
+                self.races[race.id] = RACE_REGISTRY.intern(race)
 
             except KeyError:
                 print("Not enough information in file")
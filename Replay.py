@@ -0,0 +1,435 @@
+"""
+Replays. Matches recorded as their initial layout and the parties sent during them, a few KB each, plus periodic
+keyframes so any tick can be reached without simulating from the start.
+
+e.g. python Replay.py replays/match.rep --speed 4
+     python Replay.py replays/match.rep --headless --start 3000
+"""
+
+import argparse
+import bisect
+import mmap
+import struct
+from GUI.GraphicColony import GraphicColony
+from GUI.Point import Point
+from MatchState import MapState
+from MatchState import colony_type
+from MatchState import find_race
+from Race import NULL_RACE
+from Serialization import *
+from Settings import GUISettings
+from Settings.GeneralSettings import *
+
+REPLAY_MAGIC = b"BACTOREP"
+REPLAY_VERSION = 3
+
+HEADER_FORMAT = "<8sHHH"
+COUNT_FORMAT = "<I"
+PLAYER_FORMAT = "<H"
+COLONY_FORMAT = "<HdddHII"
+COMMAND_FORMAT = "<IHH"
+INDEX_ENTRY_FORMAT = "<qQ"
+FOOTER_FORMAT = "<Q"
+
+
+class Replay:
+    """
+    A recorded match. Holds map size, seed, collision mode, races of every player, the state of every colony when
+    the match began, every party sent, as (tick, source colony index, destination colony index), and keyframes
+    with the whole state of the map every few ticks.
+
+    File layout: header, colonies, commands, keyframes, an index with tick and offset of every keyframe, and the
+    offset of that index as the last 8 bytes.
+    """
+
+    def __init__(self, width, height, map_name="", seed=None, collision_mode=GUISettings.COLLISION_MODE):
+        """
+        Constructor.
+        :param width: Map width
+        :param height: Map height
+        :param map_name: Name of custom map, empty for random maps
+        :type map_name: str
+        :param seed: Seed of the match
+        :type seed: int
+        :param collision_mode: Collision mode of the match
+        :type collision_mode: str
+        """
+        self.width = width
+        self.height = height
+        self.map_name = map_name
+        self.seed = seed
+        self.collision_mode = collision_mode
+        self.races = []
+        self.colonies = []
+        self.commands = []
+        self.keyframes = []
+
+    @staticmethod
+    def from_map(a_map, players, map_name=""):
+        """
+        Start a replay from a freshly loaded map.
+        :param a_map: Loaded map
+        :type a_map: Map
+        :param players: Players of the match
+        :type players: list
+        :param map_name: Name of custom map, empty for random maps
+        :return: Replay without commands
+        :rtype: Replay
+        """
+        replay = Replay(a_map.width, a_map.height, map_name, a_map.seed_value, a_map.collision_mode)
+        replay.races = [p.race.id for p in players]
+        for gr_col in a_map.graphic_colonies:
+            colony = gr_col.colony
+            replay.colonies.append((type(colony).__name__, gr_col.position.x, gr_col.position.y, gr_col.radius,
+                                    colony.race.id, int(colony.size), colony.time))
+        return replay
+
+    def build(self, a_map, races):
+        """
+        Place colonies on given map as they were when the match began.
+        :param a_map: Empty map
+        :type a_map: Map
+        :param races: Available races by id
+        :type races: dict
+        """
+        a_map.set_collision_mode(self.collision_mode)
+        for kind, x, y, radius, race_id, size, time in self.colonies:
+            colony = colony_type(kind)(find_race(race_id, races), size)
+            colony.time = time
+            GraphicColony(a_map, colony, Point(x, y), radius)
+
+    def keyframe_ticks(self):
+        """
+        :return: Tick of every keyframe, in order
+        :rtype: list
+        """
+        return [keyframe.ticks for keyframe in self.keyframes]
+
+    def keyframe_before(self, tick):
+        """
+        :param tick: Ticks since match start
+        :return: Last keyframe not after given tick, None if there isn't any
+        :rtype: MapState
+        """
+        i = bisect.bisect_right(self.keyframe_ticks(), tick)
+        if i == 0:
+            return None
+        return self.keyframes[i - 1]
+
+    def to_bytes(self):
+        """
+        :return: This replay in binary format
+        :rtype: bytes
+        """
+        table = StringTable([self.map_name, self.collision_mode, NULL_RACE.id] + self.races)
+        colonies = bytearray(struct.pack(COUNT_FORMAT, len(self.colonies)))
+        for kind, x, y, radius, race_id, size, time in self.colonies:
+            colonies += struct.pack(COLONY_FORMAT, table.index(kind), x, y, radius, table.index(race_id), size, time)
+        keyframes = [keyframe.to_bytes(table) for keyframe in self.keyframes]
+
+        data = bytearray(struct.pack(HEADER_FORMAT, REPLAY_MAGIC, REPLAY_VERSION, self.width, self.height))
+        data += write_bytes(int_to_bytes(self.seed))
+        data += table.to_bytes()
+        data += struct.pack("<HH", table.index(self.map_name), table.index(self.collision_mode))
+        data += struct.pack(COUNT_FORMAT, len(self.races))
+        for race_id in self.races:
+            data += struct.pack(PLAYER_FORMAT, table.index(race_id))
+        data += colonies
+        data += struct.pack(COUNT_FORMAT, len(self.commands))
+        for command in self.commands:
+            data += struct.pack(COMMAND_FORMAT, *command)
+        index = []
+        for keyframe, keyframe_data in zip(self.keyframes, keyframes):
+            index.append((keyframe.ticks, len(data)))
+            data += keyframe_data
+        index_offset = len(data)
+        data += struct.pack(COUNT_FORMAT, len(index))
+        for entry in index:
+            data += struct.pack(INDEX_ENTRY_FORMAT, *entry)
+        data += struct.pack(FOOTER_FORMAT, index_offset)
+        return bytes(data)
+
+    @staticmethod
+    def from_bytes(data):
+        """
+        :param data: A replay in binary format
+        :type data: bytes
+        :return: Read replay, with every command and keyframe
+        :rtype: Replay
+        """
+        view = ReplayFile(data)
+        replay = Replay(view.width, view.height, view.map_name, view.seed, view.collision_mode)
+        replay.races = view.races
+        replay.colonies = view.colonies
+        replay.commands = list(view.commands)
+        replay.keyframes = list(view.keyframes)
+        return replay
+
+    def save(self, path):
+        """
+        Write to a file.
+        :param path: File path
+        """
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @staticmethod
+    def load(path):
+        """
+        Read a whole file. Use ReplayFile.open to read only what's needed.
+        :param path: File path
+        :return: Read replay
+        :rtype: Replay
+        """
+        with open(path, "rb") as f:
+            return Replay.from_bytes(f.read())
+
+
+class ReplayFile(Replay):
+    """
+    A replay read in place. Only the header and keyframe index are read up front; commands and keyframes are read
+    when asked for, so seeking in a memory mapped file doesn't load all of it.
+    """
+
+    def __init__(self, data):
+        """
+        Constructor.
+        :param data: A replay in binary format, usually a memory map
+        """
+        reader = Reader(data)
+        magic, version, width, height = reader.unpack(HEADER_FORMAT)
+        if not magic == REPLAY_MAGIC:
+            raise ValueError("Not a replay")
+        if not version == REPLAY_VERSION:
+            raise ValueError("Unsupported replay version: " + str(version))
+        seed = int_from_bytes(reader.read_bytes())
+        table = StringTable.read(reader)
+        map_name, collision_mode = reader.unpack("<HH")
+        super(ReplayFile, self).__init__(width, height, table.get(map_name), seed, table.get(collision_mode))
+        self.data = data
+        self.file = None
+        for i in range(reader.unpack(COUNT_FORMAT)[0]):
+            self.races.append(table.get(reader.unpack(PLAYER_FORMAT)[0]))
+        for i in range(reader.unpack(COUNT_FORMAT)[0]):
+            kind, x, y, radius, race_id, size, time = reader.unpack(COLONY_FORMAT)
+            colony_type(table.get(kind))
+            self.colonies.append((table.get(kind), x, y, radius, table.get(race_id), size, time))
+        self.commands = CommandView(data, reader.offset + struct.calcsize(COUNT_FORMAT),
+                                    reader.unpack(COUNT_FORMAT)[0])
+
+        index = Reader(data, struct.unpack_from(FOOTER_FORMAT, data, len(data) - struct.calcsize(FOOTER_FORMAT))[0])
+        entries = [index.unpack(INDEX_ENTRY_FORMAT) for i in range(index.unpack(COUNT_FORMAT)[0])]
+        self.keyframes = KeyframeView(data, table, entries)
+
+    @staticmethod
+    def open(path):
+        """
+        Memory map a replay file.
+        :param path: File path
+        :return: Replay read in place. Close when done
+        :rtype: ReplayFile
+        """
+        with open(path, "rb") as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        replay = ReplayFile(data)
+        replay.file = data
+        return replay
+
+    def keyframe_ticks(self):
+        """
+        :return: Tick of every keyframe, in order
+        :rtype: list
+        """
+        return self.keyframes.ticks
+
+    def close(self):
+        """
+        Release memory map, if any.
+        """
+        if self.file is not None:
+            self.commands = list(self.commands)
+            self.keyframes = list(self.keyframes)
+            self.file.close()
+            self.file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class CommandView:
+    """
+    Commands of a replay, read in place when indexed.
+    """
+
+    def __init__(self, data, offset, count):
+        """
+        Constructor.
+        :param data: Replay data
+        :param offset: Offset of first command
+        :param count: Amount of commands
+        """
+        self.data = data
+        self.offset = offset
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, i):
+        if not 0 <= i < self.count:
+            raise IndexError(i)
+        return struct.unpack_from(COMMAND_FORMAT, self.data, self.offset + i * struct.calcsize(COMMAND_FORMAT))
+
+
+class KeyframeView:
+    """
+    Keyframes of a replay, read in place when indexed.
+    """
+
+    def __init__(self, data, table, entries):
+        """
+        Constructor.
+        :param data: Replay data
+        :param table: Table where race ids were written
+        :type table: StringTable
+        :param entries: Index entries, as (tick, offset)
+        """
+        self.data = data
+        self.table = table
+        self.ticks = [tick for tick, offset in entries]
+        self.offsets = [offset for tick, offset in entries]
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __getitem__(self, i):
+        return MapState.read(Reader(self.data, self.offsets[i]), self.table)
+
+
+class ReplayRecorder:
+    """
+    Records a match while it's played. Maps keep one, tell it about every party sent and let it capture a keyframe
+    every few ticks.
+    """
+
+    def __init__(self, a_map, players, map_name="", keyframe_interval=REPLAY_KEYFRAME_INTERVAL):
+        """
+        Constructor. Start recording a freshly loaded map.
+        :param a_map: Loaded map
+        :type a_map: Map
+        :param players: Players of the match
+        :type players: list
+        :param map_name: Name of custom map, empty for random maps
+        :param keyframe_interval: Minimum ticks between keyframes
+        :type keyframe_interval: int
+        """
+        self.map = a_map
+        self.start = a_map.ticks
+        self.replay = Replay.from_map(a_map, players, map_name)
+        self.indices = {gr_col: i for i, gr_col in enumerate(a_map.graphic_colonies)}
+        self.keyframe_interval = keyframe_interval
+        self.next_keyframe = keyframe_interval
+
+    def record(self, source, destination):
+        """
+        Record a party sent.
+        :param source: Sending colony
+        :type source: GraphicColony
+        :param destination: Target colony
+        :type destination: GraphicColony
+        """
+        self.replay.commands.append((self.map.ticks - self.start, self.indices[source], self.indices[destination]))
+
+    def tick(self):
+        """
+        Capture a keyframe if it's time to. Called by the map after every tick.
+        """
+        ticks = self.map.ticks - self.start
+        if ticks >= self.next_keyframe:
+            self.replay.keyframes.append(MapState.capture(self.map, self.start))
+            self.next_keyframe = ticks + self.keyframe_interval
+
+    def save(self, path):
+        """
+        Write recorded match to a file.
+        :param path: File path
+        """
+        self.replay.save(path)
+
+
+def play(replay, speed):
+    """
+    Show a replay on screen. Left and right arrows seek backwards and forwards.
+    :param replay: Replay to show
+    :type replay: Replay
+    :param speed: Ticks per game tick time, 1 being real time
+    :type speed: float
+    """
+    import pygame
+    from Simulation import Simulation
+
+    pygame.init()
+    # Maps larger than the screen are shown zoomed out
+    size = min(replay.width, GUISettings.SCREEN_WIDTH), min(replay.height, GUISettings.SCREEN_HEIGHT)
+    screen = pygame.display.set_mode(size)
+    pygame.display.set_caption("Bacto replay")
+    clock = pygame.time.Clock()
+
+    simulation = Simulation(size[0], size[1])
+    simulation.load_replay(replay)
+    tick_time = 1 / (GAME_TICKS_PER_SECOND * speed)
+    accumulator = 0
+    running = True
+    while running:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_LEFT:
+                simulation.load_replay(replay, max(simulation.ticks - REPLAY_SEEK_STEP, 0))
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_RIGHT:
+                simulation.load_replay(replay, simulation.ticks + REPLAY_SEEK_STEP)
+        accumulator += min(clock.tick(FRAMES_PER_SECOND) / 1000, MAX_FRAME_TIME)
+        while accumulator >= tick_time:
+            simulation.map.tick_background()
+            if not simulation.is_over():
+                simulation.tick()
+            accumulator -= tick_time
+        screen.fill(GUISettings.THECOLORS['gray80'])
+        simulation.map.set_interpolation(accumulator / tick_time)
+        simulation.map.draw_background(screen)
+        # Board stops once the match is over, background doesn't
+        if simulation.is_over():
+            simulation.map.set_interpolation(1)
+        simulation.draw(screen)
+        pygame.display.flip()
+    pygame.quit()
+
+
+def main():
+    """
+    Parse arguments and play a replay.
+    """
+    parser = argparse.ArgumentParser(description="Play a recorded Bacto match.")
+    parser.add_argument("path", help="replay file")
+    parser.add_argument("--speed", type=float, default=1, help="playback speed, 1 being real time")
+    parser.add_argument("--start", type=int, default=0, help="tick to start from")
+    parser.add_argument("--headless", action="store_true", help="simulate at full speed and print the result")
+    parser.add_argument("--max-ticks", type=int, default=100000, help="ticks before giving up when headless")
+    args = parser.parse_args()
+
+    with ReplayFile.open(args.path) as replay:
+        if args.headless:
+            from Simulation import Simulation
+            simulation = Simulation(replay.width, replay.height)
+            simulation.load_replay(replay, args.start)
+            winner = simulation.run(args.max_ticks)
+            print("Winner: " + str(winner) + " after " + str(simulation.ticks) + " ticks")
+        else:
+            play(replay, args.speed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+Binary serialization helpers shared by replays and saved matches.
+"""
+
+import struct
+
+
+class Reader:
+    """
+    Reads binary data sequentially. Works on bytes and memory maps alike.
+    """
+
+    def __init__(self, data, offset=0):
+        """
+        Constructor.
+        :param data: Data to read
+        :param offset: Where to start reading
+        """
+        self.data = data
+        self.offset = offset
+
+    def unpack(self, fmt):
+        """
+        :param fmt: Struct format
+        :return: Values read with given format
+        :rtype: tuple
+        """
+        values = struct.unpack_from(fmt, self.data, self.offset)
+        self.offset += struct.calcsize(fmt)
+        return values
+
+    def read_bytes(self):
+        """
+        :return: Length prefixed bytes
+        :rtype: bytes
+        """
+        length = self.unpack("<I")[0]
+        result = bytes(self.data[self.offset:self.offset + length])
+        self.offset += length
+        return result
+
+    def read_string(self):
+        """
+        :return: Length prefixed UTF-8 string
+        :rtype: str
+        """
+        return self.read_bytes().decode("utf-8")
+
+
+def write_bytes(data):
+    """
+    :param data: Bytes to write
+    :return: Given bytes, length prefixed
+    """
+    return struct.pack("<I", len(data)) + data
+
+
+def write_string(string):
+    """
+    :param string: String to write
+    :return: Given string as UTF-8, length prefixed
+    """
+    return write_bytes(string.encode("utf-8"))
+
+
+def int_to_bytes(value):
+    """
+    :param value: A non negative integer of any size, or None
+    :return: Integer as little endian bytes, empty if None
+    """
+    if value is None:
+        return b""
+    return value.to_bytes(max((value.bit_length() + 7) // 8, 1), "little")
+
+
+def int_from_bytes(data):
+    """
+    :param data: Integer as little endian bytes
+    :return: Integer, None if empty
+    """
+    if len(data) == 0:
+        return None
+    return int.from_bytes(data, "little")
+
+
+class StringTable:
+    """
+    Strings written once and referred to by index.
+    """
+
+    def __init__(self, strings=()):
+        """
+        Constructor.
+        :param strings: Initial strings
+        """
+        self.strings = []
+        self.indices = {}
+        for s in strings:
+            self.index(s)
+
+    def index(self, string):
+        """
+        :param string: A string, added if it isn't there yet
+        :return: Index of given string
+        :rtype: int
+        """
+        if string not in self.indices:
+            self.indices[string] = len(self.strings)
+            self.strings.append(string)
+        return self.indices[string]
+
+    def get(self, index):
+        """
+        :param index: Index of a string
+        :return: String with given index
+        :rtype: str
+        """
+        return self.strings[index]
+
+    def to_bytes(self):
+        """
+        :return: Every string, count prefixed
+        :rtype: bytes
+        """
+        data = bytearray(struct.pack("<I", len(self.strings)))
+        for s in self.strings:
+            data += write_string(s)
+        return bytes(data)
+
+    @staticmethod
+    def read(reader):
+        """
+        :param reader: Reader positioned at a table
+        :type reader: Reader
+        :return: Read table
+        :rtype: StringTable
+        """
+        return StringTable([reader.read_string() for i in range(reader.unpack("<I")[0])])
@@ -7,9 +7,21 @@ from GUI.colordict import THECOLORS
 SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 720
 
+DIRTY_RECTS = True
+DIRTY_TILE_SIZE = 32
+
 POLYGON_INNER_WIDTH = 2
 POLYGON_OUTER_WIDTH = 2
 
+SPRITE_ROTATION_STEPS = 32
+SPRITE_RADIUS_STEP = 1
+SPRITE_MAX_RADIUS = 100
+SPRITE_ATLAS_MAX_PIXELS = 16000000
+SPRITE_COLORKEY = (255, 0, 255)
+SPRITE_ALTERNATIVE_COLORKEY = (0, 255, 0)
+SPRITE_WARM_MIN_RADIUS = 10
+SPRITE_WARM_MAX_RADIUS = 30
+
 COLONY_SPIN_SPEED = 0.05
 COLONY_SPIN_SPEED_LOW = 0.05
 COLONY_SPIN_SPEED_MEDIUM = 0.1
@@ -17,6 +29,9 @@ COLONY_SPIN_SPEED_HIGH = 0.2
 COLONY_SPIN_SPEED_FULL = 0.3
 
 COLONY_NUMBER_COLOR = THECOLORS['black']
+COLONY_FONT_SIZE = 25
+
+TEXT_CACHE_SIZE = 512
 
 PARTY_ACCELERATION_FACTOR = 0.2
 PARTY_SPEED_FACTOR = 0.6
@@ -26,6 +41,16 @@ PARTY_COLONY_REPEL_FORCE = 0.03  # TODO: Use?
 COLONY_COLONY_REPEL_FORCE = 0  # TODO: Use?
 PARTY_SPEED_DECREASE_FACTOR = 0
 PARTY_EXTERNAL_SPEED_ADJUST = 0.8
+PARTY_STORE = False
+PARTY_STORE_INITIAL_CAPACITY = 64
+
+NAIVE_COLLISIONS = "naive"
+GRID_COLLISIONS = "grid"
+VECTOR_COLLISIONS = "vectorized"
+EVENT_COLLISIONS = "events"
+COLLISION_MODE = GRID_COLLISIONS
+COLLISION_CELL_FACTOR = 2
+MIN_COLLISION_CELL_SIZE = 20
 
 NULL_RACE_COLOR = THECOLORS['black']
 BALANCED_RACE_COLOR = THECOLORS['red4']
@@ -38,6 +63,24 @@ COLONY_SIZE_MAX = 100
 MAX_PARTY_COLONY_RATIO = 1.7
 MIN_PARTY_SIZE = 20
 
+CAMERA_MAX_ZOOM = 3
+CAMERA_ZOOM_STEP = 1.25
+# Screen pixels panned per game tick
+CAMERA_PAN_SPEED = 30
+# Objects this far outside the view are still drawn. Covers the largest party and its animation
+CAMERA_CULL_MARGIN = 2 * MAX_PARTY_COLONY_RATIO * COLONY_SIZE_MAX
+
+# Parties on screen are drawn with less detail when there are many of them or they look small
+LEVEL_OF_DETAIL = True
+LOD_STATIC_COUNT = 400
+LOD_DOT_COUNT = 1500
+LOD_HYSTERESIS = 0.8
+LOD_STATIC_RADIUS = 8
+LOD_DOT_RADIUS = 4
+LOD_CLUSTER_CELL = 8
+LOD_DOT_SIZE = 3
+LOD_MAX_DOT_SIZE = 12
+
 COLONY_MAX_SPEED = 1
 
 MAX_BACKGROUND_ELEMENTS = 6
@@ -46,6 +89,13 @@ BACKGROUND_COLOR = THECOLORS['gray69']
 MAX_BACKGROUND_SPEED = 7
 BACKGROUND_SPIN_SPEED = 0.025
 
+# Frames between background redraws. Zero hides it
+BACKGROUND_QUALITY_HIGH = 1
+BACKGROUND_QUALITY_MEDIUM = 2
+BACKGROUND_QUALITY_LOW = 4
+BACKGROUND_QUALITY_OFF = 0
+BACKGROUND_QUALITY = BACKGROUND_QUALITY_MEDIUM
+
 INITIAL_COLONIES_RADIUS = 100
 
 PAUSE_ALPHA = 100
@@ -53,6 +103,9 @@ PAUSE_ALPHA_CHANGE_SPEED = 30
 FINISHED_ALPHA_CHANGE_SPEED = 0.5
 DEFAULT_ALPHA_CHANGE_SPEED = 30
 
+REGULAR_FONT_FILE = "res/Cabin-Regular.ttf"
+BOLD_FONT_FILE = "res/Cabin-Bold.ttf"
+
 TITLE_FONT_SIZE = 50
 DEFAULT_FONT_SIZE = 35
 
@@ -61,6 +114,13 @@ CLOCK_RECT_COLOR = THECOLORS['gray20']
 CLOCK_TEXT_COLOR = THECOLORS['gray69']
 CLOCK_FONT_SIZE = 35
 
+PROFILER_RECT_COLOR = THECOLORS['gray10']
+PROFILER_TEXT_COLOR = THECOLORS['gray69']
+PROFILER_FONT_SIZE = 14
+PROFILER_MARGIN = 6
+PROFILER_OFFSET = 60
+PROFILER_COLUMN_WIDTHS = [110, 60, 60, 50]
+
 SELECT_WIDTH = 3
 SELECT_ANIMATION_TIME = 0.5
 SELECT_LINE_WIDTH = 2
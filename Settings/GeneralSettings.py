@@ -4,5 +4,19 @@ Settings for general program behaviour.
 
 GAME_SPEED_FACTOR = 0.7
 GAME_TICKS_PER_SECOND = 30
+FRAMES_PER_SECOND = 60
+MAX_FRAME_TIME = 0.25
+
+RECORD_REPLAYS = False
+REPLAY_FOLDER = "replays"
+REPLAY_KEYFRAME_INTERVAL = 300
+REPLAY_SEEK_STEP = 900
+
+SAVE_FOLDER = "saves"
+QUICK_SAVE_FILE = "quick.sav"
+
+PROFILER_ENABLED = True
+PROFILER_WINDOW = 120
+PROFILE_FILE = "profile.json"
 
 MAX_SELECT_AMOUNT = 5
@@ -10,3 +10,13 @@ SELECTION_RIGHT = pygame.K_RIGHT
 SELECTION_LEFT = pygame.K_LEFT
 MAIN_MENU = pygame.K_m
 PAUSE = pygame.K_ESCAPE
+QUICK_SAVE = pygame.K_F5
+QUICK_LOAD = pygame.K_F9
+PROFILER_OVERLAY = pygame.K_F3
+PROFILE_DUMP = pygame.K_F4
+CAMERA_UP = pygame.K_w
+CAMERA_DOWN = pygame.K_s
+CAMERA_LEFT = pygame.K_a
+CAMERA_RIGHT = pygame.K_d
+CAMERA_ZOOM_IN = pygame.K_e
+CAMERA_ZOOM_OUT = pygame.K_q
@@ -0,0 +1,228 @@
+"""
+Headless simulation. Runs matches without screen, sound or input.
+"""
+
+from Settings import GUISettings
+from GUI.Map import Map
+from MapLoader import MapLoader
+from Player import RandomPlayer
+from Player import RecordedPlayer
+from Replay import ReplayRecorder
+from MatchState import MatchState
+from RaceManager import RaceManager
+from MapManager import MapManager
+
+
+class Simulation:
+    """
+    A match without a driver. Ticks players and map and checks for a winner, but never draws unless asked to.
+    Every player is a RandomPlayer, so matches run on their own.
+    """
+
+    def __init__(self, width=GUISettings.SCREEN_WIDTH, height=GUISettings.SCREEN_HEIGHT, seed=None):
+        """
+        Constructor.
+        :param width: Map width
+        :type width: int
+        :param height: Map height
+        :type height: int
+        :param seed: Seed for every match, so they can be repeated. Fresh entropy on each match if None
+        :type seed: int
+        """
+        self.race_manager = RaceManager()
+        self.map_manager = MapManager()
+        self.map = Map(width, height)
+        self.map_loader = MapLoader(self)
+        self.players = []
+        self.winner = None
+        self.ticks = 0
+        self.seed = seed
+
+    def get_races_array(self):
+        """
+        :return: Array with available races
+        """
+        return self.race_manager.get_races_array()
+
+    def new_players(self, amount):
+        """
+        Create players with random races, all different.
+        :param amount: Amount of players
+        :type amount: int
+        :return: Array of players
+        :rtype: list
+        """
+        players = []
+        for i in range(amount):
+            player = RandomPlayer("Player " + str(i + 1))
+            player.random_race(players, self.get_races_array(), self.map.random)
+            players.append(player)
+        return players
+
+    def load_random(self, n_colonies, n_enemies, min_size=40, max_size=60):
+        """
+        Load a random map. There's always one player besides the enemies.
+        :param n_colonies: Amount of empty colonies
+        :param n_enemies: Amount of enemies
+        :param min_size: Minimum colony radius
+        :param max_size: Maximum colony radius
+        """
+        self.reset()
+        self.map_loader.load_random(self.map, n_colonies, min_size, max_size, self.new_players(1), n_enemies,
+                                    self.get_races_array())
+        self.players = self.map_loader.players
+        self.map.recorder = ReplayRecorder(self.map, self.players)
+
+    def load_map(self, map_name):
+        """
+        Load a custom map by its name.
+        :param map_name: Name as written in the map file
+        :type map_name: str
+        """
+        self.reset()
+        self.map_loader.load_in_map(self.map_manager.get_map(map_name), self.map, self.new_players(1))
+        self.players = self.map_loader.players
+        self.map.recorder = ReplayRecorder(self.map, self.players, map_name)
+
+    def load_replay(self, replay, tick=0):
+        """
+        Load a recorded match. Parties are sent as recorded instead of by players.
+        :param replay: Recorded match
+        :type replay: Replay
+        :param tick: Tick to start from. The last keyframe before it is restored and the rest is simulated
+        :type tick: int
+        """
+        self.reset()
+        self.map.seed(replay.seed)
+        self.map.empty()
+        self.map.resize(replay.width, replay.height)
+        races = self.race_manager.get_races()
+        replay.build(self.map, races)
+        player = RecordedPlayer(replay.commands)
+        self.players = [player]
+        keyframe = replay.keyframe_before(tick)
+        if keyframe is not None:
+            keyframe.restore(self.map, races)
+            player.seek(keyframe.ticks)
+            self.ticks = keyframe.ticks
+            self.winner = self.map.get_winner()
+            if self.winner is not None:
+                self.map.is_over = True
+        self.run(tick)
+
+    def save_replay(self, path):
+        """
+        Write current match as a replay. Matches loaded from a saved state aren't recorded.
+        :param path: File path
+        """
+        if self.map.recorder is not None:
+            self.map.recorder.save(path)
+
+    def save_state(self):
+        """
+        :return: Current match, map, players and random streams included, in binary format
+        :rtype: bytes
+        """
+        return MatchState.capture(self.map, self.players).to_bytes()
+
+    def load_state(self, data):
+        """
+        Continue a saved match where it was left. Human players are replaced by RandomPlayers.
+        :param data: A match saved with save_state, here or by a Driver
+        :type data: bytes
+        """
+        self.reset()
+        state = MatchState.from_bytes(data)
+        races = self.race_manager.get_races()
+        state.restore_map(self.map, races)
+        self.players = state.restore_players(races)
+        self.winner = self.map.get_winner()
+        if self.winner is not None:
+            self.map.is_over = True
+
+    def reset(self):
+        """
+        Forget last match and restart random streams.
+        """
+        self.map.seed(self.seed)
+        self.players = []
+        self.winner = None
+        self.ticks = 0
+        self.map.is_over = False
+
+    def tick(self):
+        """
+        Tick players and map once, then check for a winner.
+        """
+        for p in self.players:
+            p.tick(self.map)
+        self.map.tick()
+        self.ticks += 1
+        self.winner = self.map.get_winner()
+        if self.winner is not None:
+            self.map.is_over = True
+
+    def run(self, max_ticks=None):
+        """
+        Tick until there's a winner.
+        :param max_ticks: Stop after this amount of ticks, even without a winner
+        :type max_ticks: int
+        :return: Winning race, None if there isn't one
+        :rtype: AbstractRace
+        """
+        while not self.is_over():
+            if max_ticks is not None and self.ticks >= max_ticks:
+                break
+            self.step(max_ticks)
+        return self.winner
+
+    def step(self, max_ticks=None):
+        """
+        Tick once. If parties are scheduled, first jump over every tick in which nothing would happen.
+        :param max_ticks: Never jump past this tick
+        :type max_ticks: int
+        """
+        quiet = self.quiet_ticks()
+        if max_ticks is not None:
+            quiet = min(quiet, max_ticks - self.ticks - 1)
+        if quiet > 0:
+            self.skip(quiet)
+        self.tick()
+
+    def quiet_ticks(self):
+        """
+        :return: Amount of upcoming ticks in which no party arrives and no player acts
+        """
+        if not self.map.can_skip():
+            return 0
+        waits = [self.map.ticks_until_arrival()] + [p.ticks_until_action() for p in self.players]
+        waits = [w for w in waits if w is not None]
+        if len(waits) == 0:
+            return 0
+        return min(waits) - 1
+
+    def skip(self, amount):
+        """
+        Let given amount of ticks pass at once. Only valid for quiet ticks.
+        :type amount: int
+        """
+        for p in self.players:
+            p.skip(amount)
+        self.map.skip(amount)
+        self.ticks += amount
+
+    def is_over(self):
+        """
+        :return: True if there's a winner, False otherwise
+        """
+        return self.winner is not None
+
+    def draw(self, surface):
+        """
+        Draw current state. Optional, simulations don't need to be seen.
+        :param surface: Surface to draw
+        :type surface: Surface
+        :return: Bounding rectangles of what was drawn
+        :rtype: list
+        """
+        return self.map.draw(surface)
@@ -4,36 +4,52 @@ Main. Run this
 
 import pygame
 from Driver import Driver
+from Profiler import PRESENT_PHASE
+from GUI.Compositor import Compositor
+from GUI.DirtyRegion import DirtyRegion
 from Settings.GeneralSettings import *
 from Settings.GUISettings import *
 
 pygame.init()
 
 size = width, height = SCREEN_WIDTH, SCREEN_HEIGHT
-game_screen = pygame.Surface(size)
-text_screen = pygame.Surface(size)
 background_screen = pygame.display.set_mode(size)
 pygame.display.set_caption("Bacto by Franco Cruces Ayala", "res/icon2.png")
 
-game_screen.set_alpha(0)
-text_screen.set_alpha(0)
+null_color = THECOLORS['gray55']
+background_color = THECOLORS['gray80']
+compositor = Compositor(background_screen, background_color, null_color)
 
 clock = pygame.time.Clock()
 
 gameExit = False
 
-driver = Driver(game_screen, background_screen, text_screen)
-null_color = THECOLORS['gray55']
+driver = Driver(compositor)
+
+# Only what was drawn last frame or this one is erased, composed and shown. Changing a layer alpha or moving the
+# camera changes every pixel, so it refreshes the whole screen
+dirty = DirtyRegion(width, height)
+
+# Simulation runs at a fixed rate, rendering as fast as allowed. Leftover time is used to interpolate drawing
+tick_time = 1 / GAME_TICKS_PER_SECOND
+accumulator = 0
 while driver.is_running():
-    clock.tick(GAME_TICKS_PER_SECOND)
-    background_screen.fill(THECOLORS['gray80'])
-
-    text_screen.fill(null_color)
-    game_screen.fill(null_color)
-    text_screen.set_colorkey(null_color)
-    game_screen.set_colorkey(null_color)
-    driver.tick()
-    background_screen.blit(game_screen, (0, 0))
-    background_screen.blit(text_screen, (0, 0))
-
-    pygame.display.flip()
+    accumulator += min(clock.tick(FRAMES_PER_SECOND) / 1000, MAX_FRAME_TIME)
+    driver.handle_events()
+    while accumulator >= tick_time and driver.is_running():
+        driver.update()
+        accumulator -= tick_time
+
+    compositor.erase(dirty.begin((compositor.state(), driver.map.camera.state())))
+    dirty.mark(driver.render(accumulator / tick_time))
+
+    with driver.measure(PRESENT_PHASE):
+        rects = dirty.end()
+        compositor.compose(rects)
+        overlay = driver.draw_profiler(background_screen)
+        if overlay is not None:
+            dirty.mark_late([overlay])
+            rects.append(overlay)
+        pygame.display.update(rects)
+    if not DIRTY_RECTS:
+        dirty.invalidate()